@@ -4,10 +4,10 @@
 from __future__ import annotations
 
 import dataclasses
-import difflib
 import json
 import logging
 import os
+from collections import defaultdict
 from dataclasses import dataclass
 from typing import Any
 
@@ -151,16 +151,45 @@ class ModuleDescriptors:
     go_mods_digest: Digest
 
 
+@dataclass(frozen=True)
+class DownloadThirdPartyModuleRequest:
+    """Download the sources of a single third-party module version.
+
+    The request deliberately does not refer to the `go.mod` which depends on the module, only to
+    the `go.sum` entries for the module version, so that the download is shared by every `go.mod`
+    which depends on the same module version.
+    """
+
+    name: str
+    version: str
+    go_sum_entries: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class DownloadedThirdPartyModule:
+    """The sources of a third-party module version, in the format of `gopath/pkg/mod`.
+
+    The digest only contains the module sources and its `go.mod`.
+    """
+
+    digest: Digest
+    module_sources_path: str
+
+
 @dataclass(frozen=True)
 class AnalyzeThirdPartyModuleRequest:
-    go_mod_address: Address
-    go_mod_digest: Digest
-    go_mod_path: str
-    import_path: str
+    """Analyze all of the packages of a third-party module version.
+
+    Like `DownloadThirdPartyModuleRequest`, this is independent of the `go.mod` which depends on
+    the module, so that the analysis is shared by every `go.mod` which depends on the same module
+    version.
+    """
+
     name: str
     version: str
+    go_sum_entries: tuple[str, ...]
     minimum_go_version: str | None
-    build_opts: GoBuildOptions
+    cgo_enabled: bool
 
 
 @dataclass(frozen=True)
@@ -285,64 +314,55 @@ def _freeze_json_dict(d: dict[Any, Any]) -> FrozenDict[str, Any]:
     return FrozenDict(result)
 
 
-async def _check_go_sum_has_not_changed(
-    input_digest: Digest,
-    output_digest: Digest,
-    dir_path: str,
-    import_path: str,
-    go_mod_address: Address,
-) -> None:
-    input_entries, output_entries = await MultiGet(
-        Get(DigestContents, Digest, input_digest),
-        Get(DigestContents, Digest, output_digest),
-    )
+def parse_go_sum_entries(go_sum: bytes) -> dict[tuple[str, str], tuple[str, ...]]:
+    """Group the lines of a `go.sum` file by the module name and version they apply to.
 
-    go_sum_path = os.path.join(dir_path, "go.sum")
-
-    input_go_sum_entry: bytes | None = None
-    for entry in input_entries:
-        if entry.path == go_sum_path:
-            input_go_sum_entry = entry.content
-
-    output_go_sum_entry: bytes | None = None
-    for entry in output_entries:
-        if entry.path == go_sum_path:
-            output_go_sum_entry = entry.content
-
-    if input_go_sum_entry is not None or output_go_sum_entry is not None:
-        if input_go_sum_entry != output_go_sum_entry:
-            go_sum_diff = list(
-                difflib.unified_diff(
-                    (input_go_sum_entry or b"").decode().splitlines(),
-                    (output_go_sum_entry or b"").decode().splitlines(),
-                )
-            )
-            go_sum_diff_rendered = "\n".join(line.rstrip() for line in go_sum_diff)
-            raise ValueError(
-                f"For `{GoModTarget.alias}` target `{go_mod_address}`, the go.sum file is incomplete "
-                f"because it was updated while processing third-party dependency `{import_path}`. "
-                "Please re-generate the go.sum file by running `go mod download all` in the module directory. "
-                "(Pants does not currently have support for updating the go.sum checksum database itself.)\n\n"
-                f"Diff:\n{go_sum_diff_rendered}"
-            )
+    Both the hash of the module sources (`<name> <version> <hash>`) and the hash of the module's
+    `go.mod` (`<name> <version>/go.mod <hash>`) are attributed to `(<name>, <version>)`.
+    """
+    entries: dict[tuple[str, str], list[str]] = defaultdict(list)
+    for line in go_sum.decode().splitlines():
+        parts = line.split()
+        if len(parts) != 3:
+            continue
+        name, version, _ = parts
+        entries[(name, version.removesuffix("/go.mod"))].append(" ".join(parts))
+    return {key: tuple(sorted(lines)) for key, lines in entries.items()}
+
+
+def _has_complete_go_sum_entries(entries: tuple[str, ...]) -> bool:
+    """Whether the `go.sum` entries pin both the module sources and the module's `go.mod`.
+
+    `go mod download` adds any missing hash to the `go.sum` of the placeholder module it runs in,
+    where it would go unnoticed, so the download would not be verified against the repo's `go.sum`.
+    """
+    go_mod_entries = [entry for entry in entries if entry.split()[1].endswith("/go.mod")]
+    return 0 < len(go_mod_entries) < len(entries)
 
 
 @rule
-async def analyze_go_third_party_module(
-    request: AnalyzeThirdPartyModuleRequest,
-    analyzer: PackageAnalyzerSetup,
-) -> AnalyzedThirdPartyModule:
-    # Download the module.
+async def download_third_party_module(
+    request: DownloadThirdPartyModuleRequest,
+) -> DownloadedThirdPartyModule:
+    # Download the module in a placeholder module whose `go.sum` only contains the entries for the
+    # module being downloaded, which `go` uses to verify the download.
+    download_module_digest = await Get(
+        Digest,
+        CreateDigest(
+            [
+                FileContent("go.mod", b"module __pants_go_module_download__\n"),
+                FileContent("go.sum", "".join(f"{e}\n" for e in request.go_sum_entries).encode()),
+            ]
+        ),
+    )
     download_result = await Get(
         ProcessResult,
         GoSdkProcess(
             ("mod", "download", "-json", f"{request.name}@{request.version}"),
-            input_digest=request.go_mod_digest,  # for go.sum
-            working_dir=os.path.dirname(request.go_mod_path),
+            input_digest=download_module_digest,
             # Allow downloads of the module sources.
             allow_downloads=True,
             output_directories=("gopath",),
-            output_files=(os.path.join(os.path.dirname(request.go_mod_path), "go.sum"),),
             description=f"Download Go module {request.name}@{request.version}.",
         ),
     )
@@ -352,22 +372,13 @@ async def analyze_go_third_party_module(
             f"Expected output from `go mod download` for {request.name}@{request.version}."
         )
 
-    # Make sure go.sum has not changed.
-    await _check_go_sum_has_not_changed(
-        input_digest=request.go_mod_digest,
-        output_digest=download_result.output_digest,
-        dir_path=os.path.dirname(request.go_mod_path),
-        import_path=request.import_path,
-        go_mod_address=request.go_mod_address,
-    )
-
     module_metadata = json.loads(download_result.stdout)
     module_sources_relpath = strip_sandbox_prefix(module_metadata["Dir"], "gopath/")
     go_mod_relpath = strip_sandbox_prefix(module_metadata["GoMod"], "gopath/")
 
     # Subset the output directory to just the module sources and go.mod (which may be generated).
-    module_sources_snapshot = await Get(
-        Snapshot,
+    module_sources_digest = await Get(
+        Digest,
         DigestSubset(
             download_result.output_digest,
             PathGlobs(
@@ -378,6 +389,20 @@ async def analyze_go_third_party_module(
             ),
         ),
     )
+    return DownloadedThirdPartyModule(module_sources_digest, module_sources_relpath)
+
+
+@rule
+async def analyze_go_third_party_module(
+    request: AnalyzeThirdPartyModuleRequest,
+    analyzer: PackageAnalyzerSetup,
+) -> AnalyzedThirdPartyModule:
+    downloaded_module = await Get(
+        DownloadedThirdPartyModule,
+        DownloadThirdPartyModuleRequest(request.name, request.version, request.go_sum_entries),
+    )
+    module_sources_relpath = downloaded_module.module_sources_path
+    module_sources_snapshot = await Get(Snapshot, Digest, downloaded_module.digest)
 
     # Determine directories with potential Go packages in them.
     candidate_package_dirs = []
@@ -407,7 +432,7 @@ async def analyze_go_third_party_module(
             },
             description=f"Analyze metadata for Go third-party module: {request.name}@{request.version}",
             level=LogLevel.DEBUG,
-            env={"CGO_ENABLED": "1" if request.build_opts.cgo_enabled else "0"},
+            env={"CGO_ENABLED": "1" if request.cgo_enabled else "0"},
         ),
     )
 
@@ -582,22 +607,35 @@ async def download_and_analyze_third_party_packages(
         ),
     )
 
-    go_mod_digest = await Get(
-        Digest, MergeDigests([request.go_mod_digest, module_analysis.go_mods_digest])
+    go_sum_path = os.path.join(os.path.dirname(request.go_mod_path), "go.sum")
+    go_sum_contents = await Get(
+        DigestContents, DigestSubset(request.go_mod_digest, PathGlobs([go_sum_path]))
     )
+    go_sum_entries = parse_go_sum_entries(
+        b"".join(file_content.content for file_content in go_sum_contents)
+    )
+
+    # Module versions are analyzed independently of this `go.mod`, keyed only by their name,
+    # version and `go.sum` entries, so that their analysis is shared across `go.mod` files.
+    for mod in module_analysis.modules:
+        if not _has_complete_go_sum_entries(go_sum_entries.get((mod.name, mod.version), ())):
+            raise ValueError(
+                f"For `{GoModTarget.alias}` target `{request.go_mod_address}`, the go.sum file is "
+                f"incomplete because it is missing entries for third-party dependency "
+                f"`{mod.name}@{mod.version}`. "
+                "Please re-generate the go.sum file by running `go mod download all` in the module directory. "
+                "(Pants does not currently have support for updating the go.sum checksum database itself.)"
+            )
 
     analyzed_modules = await MultiGet(
         Get(
             AnalyzedThirdPartyModule,
             AnalyzeThirdPartyModuleRequest(
-                go_mod_address=request.go_mod_address,
-                go_mod_digest=go_mod_digest,
-                go_mod_path=request.go_mod_path,
-                import_path=mod.name,
                 name=mod.name,
                 version=mod.version,
+                go_sum_entries=go_sum_entries[(mod.name, mod.version)],
                 minimum_go_version=mod.minimum_go_version,
-                build_opts=request.build_opts,
+                cgo_enabled=request.build_opts.cgo_enabled,
             ),
         )
         for mod in module_analysis.modules
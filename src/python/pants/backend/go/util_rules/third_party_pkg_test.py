@@ -28,6 +28,7 @@ from pants.backend.go.util_rules.third_party_pkg import (
     AllThirdPartyPackagesRequest,
     ThirdPartyPkgAnalysis,
     ThirdPartyPkgAnalysisRequest,
+    parse_go_sum_entries,
 )
 from pants.build_graph.address import Address
 from pants.engine.fs import Digest, Snapshot
@@ -592,7 +593,7 @@ def test_go_sum_with_missing_entries_triggers_error(rule_runner: RuleRunner) ->
     )
     msg = (
         "For `go_mod` target `fake_addr_for_test:mod`, the go.sum file is incomplete because "
-        "it was updated while processing third-party dependency `github.com/google/uuid`."
+        "it is missing entries for third-party dependency `github.com/google/uuid@v1.3.0`."
     )
     with pytest.raises(ExecutionError, match=re.escape(msg)):
         _ = rule_runner.request(
@@ -607,3 +608,86 @@ def test_go_sum_with_missing_entries_triggers_error(rule_runner: RuleRunner) ->
                 )
             ],
         )
+
+
+def test_go_sum_with_only_go_mod_entry_triggers_error(rule_runner: RuleRunner) -> None:
+    # Without the hash of the module sources, the download would not be pinned by the `go.sum`.
+    digest = set_up_go_mod(
+        rule_runner,
+        dedent(
+            """\
+            module example.com/third-party-module
+            go 1.16
+            require github.com/google/uuid v1.3.0
+            """
+        ),
+        "github.com/google/uuid v1.3.0/go.mod h1:TIyPZe4MgqvfeYDBFedMoGGpEw/LqOeaOT+nhxU+yHo=\n",
+    )
+    msg = (
+        "For `go_mod` target `fake_addr_for_test:mod`, the go.sum file is incomplete because "
+        "it is missing entries for third-party dependency `github.com/google/uuid@v1.3.0`."
+    )
+    with pytest.raises(ExecutionError, match=re.escape(msg)):
+        _ = rule_runner.request(
+            AllThirdPartyPackages,
+            [
+                AllThirdPartyPackagesRequest(
+                    Address("fake_addr_for_test", target_name="mod"),
+                    digest,
+                    "go.mod",
+                    build_opts=GoBuildOptions(),
+                )
+            ],
+        )
+
+
+def test_parse_go_sum_entries() -> None:
+    assert parse_go_sum_entries(GO_SUM.encode())[("rsc.io/quote", "v1.5.2")] == (
+        "rsc.io/quote v1.5.2 h1:w5fcysjrx7yqtD/aO+QwRjYZOKnaM9Uh2b40tElTs3Y=",
+        "rsc.io/quote v1.5.2/go.mod h1:LzX7hefJvL54yjefDEDHNONDjII0t9xZLPXsUe+TKr0=",
+    )
+    assert parse_go_sum_entries(
+        b"example.com/only-go-mod v1.0.0/go.mod h1:abc=\n\nnot an entry\n"
+    ) == {
+        ("example.com/only-go-mod", "v1.0.0"): ("example.com/only-go-mod v1.0.0/go.mod h1:abc=",)
+    }
+
+
+def test_third_party_modules_shared_across_go_mods(rule_runner: RuleRunner) -> None:
+    go_mod = dedent(
+        """\
+        module example.com/{name}
+        go 1.16
+        require github.com/google/uuid v1.3.0
+        """
+    )
+    go_sum = dedent(
+        """\
+        github.com/google/uuid v1.3.0 h1:t6JiXgmwXMjEs8VusXIJk2BXHsn+wx8BZdTaoZ5fu7I=
+        github.com/google/uuid v1.3.0/go.mod h1:TIyPZe4MgqvfeYDBFedMoGGpEw/LqOeaOT+nhxU+yHo=
+        """
+    )
+    input_digest = rule_runner.make_snapshot(
+        {
+            "a/go.mod": go_mod.format(name="a"),
+            "a/go.sum": go_sum,
+            "b/go.mod": go_mod.format(name="b"),
+            "b/go.sum": go_sum,
+        }
+    ).digest
+
+    def analyze(dir_path: str) -> ThirdPartyPkgAnalysis:
+        all_packages = rule_runner.request(
+            AllThirdPartyPackages,
+            [
+                AllThirdPartyPackagesRequest(
+                    Address(dir_path, target_name="mod"),
+                    input_digest,
+                    os.path.join(dir_path, "go.mod"),
+                    build_opts=GoBuildOptions(),
+                )
+            ],
+        )
+        return all_packages.import_paths_to_pkg_info["github.com/google/uuid"]
+
+    assert analyze("a") == analyze("b")
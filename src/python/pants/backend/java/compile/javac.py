@@ -16,11 +16,20 @@ from pants.backend.java.subsystems.javac import JavacSubsystem
 from pants.backend.java.target_types import JavaFieldSet, JavaGeneratorFieldSet, JavaSourceField
 from pants.core.util_rules.source_files import SourceFiles, SourceFilesRequest
 from pants.core.util_rules.system_binaries import BashBinary, ZipBinary
-from pants.engine.fs import EMPTY_DIGEST, CreateDigest, Digest, Directory, MergeDigests, Snapshot
+from pants.engine.fs import (
+    EMPTY_DIGEST,
+    CreateDigest,
+    Digest,
+    DigestContents,
+    Directory,
+    MergeDigests,
+    Snapshot,
+)
 from pants.engine.process import FallibleProcessResult, Process, ProcessCacheScope, ProcessResult
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
 from pants.engine.target import CoarsenedTarget, SourcesField
 from pants.engine.unions import UnionRule
+from pants.jvm.classfile_abi import classpath_abi_fingerprint
 from pants.jvm.classpath import Classpath
 from pants.jvm.compile import (
     ClasspathDependenciesRequest,
@@ -30,11 +39,13 @@ from pants.jvm.compile import (
     CompileResult,
     FallibleClasspathEntries,
     FallibleClasspathEntry,
+    compiled_jar_cache,
 )
 from pants.jvm.compile import rules as jvm_compile_rules
 from pants.jvm.jdk_rules import JdkEnvironment, JdkRequest, JvmProcess
 from pants.jvm.strip_jar.strip_jar import StripJarRequest
 from pants.jvm.subsystems import JvmSubsystem
+from pants.option.global_options import GlobalOptions
 from pants.util.logging import LogLevel
 
 logger = logging.getLogger(__name__)
@@ -55,6 +66,7 @@ async def compile_java_source(
     javac: JavacSubsystem,
     zip_binary: ZipBinary,
     jvm: JvmSubsystem,
+    global_options: GlobalOptions,
     request: CompileJavaSourceRequest,
 ) -> FallibleClasspathEntry:
     # Request the component's direct dependency classpath, and additionally any prerequisite.
@@ -159,77 +171,114 @@ async def compile_java_source(
     classpath_arg = ":".join(user_classpath.root_immutable_inputs_args(prefix=usercp))
     immutable_input_digests = dict(user_classpath.root_immutable_inputs(prefix=usercp))
 
-    # Compile.
-    compile_result = await Get(
-        FallibleProcessResult,
-        JvmProcess(
-            jdk=jdk,
-            classpath_entries=[f"{jdk.java_home}/lib/tools.jar"],
-            argv=[
-                "com.sun.tools.javac.Main",
-                *(("-cp", classpath_arg) if classpath_arg else ()),
+    output_file = compute_output_jar_filename(request.component)
+    jar_cache = compiled_jar_cache(global_options, jvm)
+    jar_cache_key = ""
+    cached_output = None
+    if jar_cache is not None:
+        # NB: The compile classpath is keyed by ABI, so a change to only the implementation of a
+        # dependency reuses the previous output. Unless they are disabled, annotation processors
+        # found on the classpath (via `META-INF/services/javax.annotation.processing.Processor`)
+        # run during compilation, and their output may depend on their implementation: the
+        # classpath is then keyed by its full digests.
+        jar_cache_key = jar_cache.key(
+            (
+                "javac",
+                jdk.fingerprint,
+                output_file,
+                f"reproducible_jars={jvm.reproducible_jars}",
                 *javac.args,
-                "-d",
-                dest_dir,
-                *sorted(
-                    chain.from_iterable(
-                        sources.snapshot.files
-                        for _, sources in component_members_and_java_source_files
-                    )
-                ),
-            ],
-            input_digest=merged_digest,
-            extra_immutable_input_digests=immutable_input_digests,
-            output_directories=(dest_dir,),
-            description=f"Compile {request.component} with javac",
-            level=LogLevel.DEBUG,
-        ),
-    )
-    if compile_result.exit_code != 0:
-        return FallibleClasspathEntry.from_fallible_process_result(
-            str(request.component),
-            compile_result,
-            None,
+            ),
+            merged_digest,
+            direct_dependency_classpath_entries,
+            by_abi="-proc:none" in javac.args,
         )
+        cached_output = jar_cache.get(jar_cache_key)
 
-    # Jar.
-    # NB: We jar up the outputs in a separate process because the nailgun runner cannot support
-    # invoking via a `bash` wrapper (since the trailing portion of the command is executed by
-    # the nailgun server). We might be able to resolve this in the future via a Javac wrapper shim.
-    output_snapshot = await Get(Snapshot, Digest, compile_result.output_digest)
-    output_file = compute_output_jar_filename(request.component)
-    output_files: tuple[str, ...] = (output_file,)
-    if output_snapshot.files:
-        jar_result = await Get(
-            ProcessResult,
-            Process(
+    compile_result: FallibleProcessResult | None = None
+    if cached_output is not None:
+        abi_fingerprint, cached_files = cached_output
+        output_files: tuple[str, ...] = tuple(file_content.path for file_content in cached_files)
+        jar_output_digest = await Get(Digest, CreateDigest(cached_files))
+    else:
+        # Compile.
+        compile_result = await Get(
+            FallibleProcessResult,
+            JvmProcess(
+                jdk=jdk,
+                classpath_entries=[f"{jdk.java_home}/lib/tools.jar"],
                 argv=[
-                    bash.path,
-                    "-c",
-                    " ".join(
-                        ["cd", dest_dir, ";", zip_binary.path, "-r", f"../{output_file}", "."]
+                    "com.sun.tools.javac.Main",
+                    *(("-cp", classpath_arg) if classpath_arg else ()),
+                    *javac.args,
+                    "-d",
+                    dest_dir,
+                    *sorted(
+                        chain.from_iterable(
+                            sources.snapshot.files
+                            for _, sources in component_members_and_java_source_files
+                        )
                     ),
                 ],
-                input_digest=compile_result.output_digest,
-                output_files=output_files,
-                description=f"Capture outputs of {request.component} for javac",
-                level=LogLevel.TRACE,
-                cache_scope=ProcessCacheScope.LOCAL_SUCCESSFUL,
+                input_digest=merged_digest,
+                extra_immutable_input_digests=immutable_input_digests,
+                output_directories=(dest_dir,),
+                description=f"Compile {request.component} with javac",
+                level=LogLevel.DEBUG,
             ),
         )
-        jar_output_digest = jar_result.output_digest
-    else:
-        # If there was no output, then do not create a jar file. This may occur, for example, when compiling
-        # a `package-info.java` in a single partition.
-        output_files = ()
-        jar_output_digest = EMPTY_DIGEST
+        if compile_result.exit_code != 0:
+            return FallibleClasspathEntry.from_fallible_process_result(
+                str(request.component),
+                compile_result,
+                None,
+            )
+
+        # Jar.
+        # NB: We jar up the outputs in a separate process because the nailgun runner cannot
+        # support invoking via a `bash` wrapper (since the trailing portion of the command is
+        # executed by the nailgun server). We might be able to resolve this in the future via a
+        # Javac wrapper shim.
+        output_snapshot = await Get(Snapshot, Digest, compile_result.output_digest)
+        output_files = (output_file,)
+        if output_snapshot.files:
+            jar_result = await Get(
+                ProcessResult,
+                Process(
+                    argv=[
+                        bash.path,
+                        "-c",
+                        " ".join(
+                            ["cd", dest_dir, ";", zip_binary.path, "-r", f"../{output_file}", "."]
+                        ),
+                    ],
+                    input_digest=compile_result.output_digest,
+                    output_files=output_files,
+                    description=f"Capture outputs of {request.component} for javac",
+                    level=LogLevel.TRACE,
+                    cache_scope=ProcessCacheScope.LOCAL_SUCCESSFUL,
+                ),
+            )
+            jar_output_digest = jar_result.output_digest
+        else:
+            # If there was no output, then do not create a jar file. This may occur, for example,
+            # when compiling a `package-info.java` in a single partition.
+            output_files = ()
+            jar_output_digest = EMPTY_DIGEST
+
+        if jvm.reproducible_jars:
+            jar_output_digest = await Get(
+                Digest, StripJarRequest(digest=jar_output_digest, filenames=output_files)
+            )
+
+        abi_fingerprint = None
+        if jar_cache is not None:
+            jar_contents = await Get(DigestContents, Digest, jar_output_digest)
+            abi_fingerprint = classpath_abi_fingerprint(jar_contents)
+            jar_cache.put(jar_cache_key, abi_fingerprint, jar_contents)
 
-    if jvm.reproducible_jars:
-        jar_output_digest = await Get(
-            Digest, StripJarRequest(digest=jar_output_digest, filenames=output_files)
-        )
     output_classpath = ClasspathEntry(
-        jar_output_digest, output_files, direct_dependency_classpath_entries
+        jar_output_digest, output_files, direct_dependency_classpath_entries, abi_fingerprint
     )
 
     if export_classpath_entries:
@@ -242,6 +291,13 @@ async def compile_java_source(
         )
         output_classpath = merged_classpath
 
+    if compile_result is None:
+        return FallibleClasspathEntry(
+            description=str(request.component),
+            result=CompileResult.SUCCEEDED,
+            output=output_classpath,
+            exit_code=0,
+        )
     return FallibleClasspathEntry.from_fallible_process_result(
         str(request.component),
         compile_result,
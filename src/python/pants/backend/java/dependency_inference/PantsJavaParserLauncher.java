@@ -25,6 +25,8 @@ import com.github.javaparser.ast.type.ClassOrInterfaceType;
 import com.github.javaparser.ast.type.Type;
 import com.github.javaparser.ast.type.WildcardType;
 import java.io.File;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Files;
 import java.util.ArrayList;
 import java.util.HashSet;
 import java.util.List;
@@ -115,16 +117,51 @@ public class PantsJavaParserLauncher {
     return new ArrayList<>();
   }
 
+  /**
+   * Usage:
+   *
+   * <p>PantsJavaParserLauncher ANALYSIS_OUTPUT_PATH SOURCE
+   *
+   * <p>PantsJavaParserLauncher --output-dir ANALYSIS_OUTPUT_DIR SOURCE...
+   *
+   * <p>The second form analyzes each source in turn, and writes its analysis to
+   * `ANALYSIS_OUTPUT_DIR/SOURCE.json`.
+   */
   public static void main(String[] args) throws Exception {
-    String analysisOutputPath = args[0];
-    String sourceToAnalyze = args[1];
-
     // NB: We hardcode the most permissive language level in order to capture all potential
     // sources of symbols. If certain syntax ends up deprecated in future versions, we may need to
     // allow this to be configured.
     StaticJavaParser.setConfiguration(
         new ParserConfiguration()
             .setLanguageLevel(ParserConfiguration.LanguageLevel.JAVA_17_PREVIEW));
+    ObjectMapper mapper = new ObjectMapper();
+    mapper.registerModule(new Jdk8Module());
+
+    if (args[0].equals("--output-dir")) {
+      // NB: In batch mode, a source which fails to parse does not fail the whole batch: the error
+      // is recorded in a `.error` file in place of its analysis, so that only that source needs to
+      // be analyzed again individually.
+      File analysisOutputDir = new File(args[1]);
+      for (int i = 2; i < args.length; i++) {
+        String sourceToAnalyze = args[i];
+        new File(analysisOutputDir, sourceToAnalyze).getParentFile().mkdirs();
+        CompilationUnitAnalysis analysis;
+        try {
+          analysis = analyze(sourceToAnalyze);
+        } catch (Exception e) {
+          Files.write(
+              new File(analysisOutputDir, sourceToAnalyze + ".error").toPath(),
+              String.valueOf(e).getBytes(StandardCharsets.UTF_8));
+          continue;
+        }
+        mapper.writeValue(new File(analysisOutputDir, sourceToAnalyze + ".json"), analysis);
+      }
+    } else {
+      mapper.writeValue(new File(args[0]), analyze(args[1]));
+    }
+  }
+
+  private static CompilationUnitAnalysis analyze(String sourceToAnalyze) throws Exception {
     CompilationUnit cu = StaticJavaParser.parse(new File(sourceToAnalyze));
 
     // Get the source's declare package.
@@ -227,11 +264,7 @@ public class PantsJavaParserLauncher {
 
     ArrayList<String> consumedTypes = new ArrayList<>(consumedIdentifiers);
     ArrayList<String> exportTypes = new ArrayList<>(exportIdentifiers);
-    CompilationUnitAnalysis analysis =
-        new CompilationUnitAnalysis(
-            declaredPackage, imports, topLevelTypes, consumedTypes, exportTypes);
-    ObjectMapper mapper = new ObjectMapper();
-    mapper.registerModule(new Jdk8Module());
-    mapper.writeValue(new File(analysisOutputPath), analysis);
+    return new CompilationUnitAnalysis(
+        declaredPackage, imports, topLevelTypes, consumedTypes, exportTypes);
   }
 }
@@ -21,12 +21,16 @@ from pants.engine.unions import UnionRule
 from pants.jvm.jdk_rules import InternalJdk, JvmProcess
 from pants.jvm.resolve.coursier_fetch import ToolClasspath, ToolClasspathRequest
 from pants.jvm.resolve.jvm_tool import GenerateJvmLockfileFromTool, JvmToolBase
+from pants.option.option_types import IntOption
+from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
+from pants.util.strutil import pluralize, softwrap
 
 logger = logging.getLogger(__name__)
 
 
 _LAUNCHER_BASENAME = "PantsJavaParserLauncher.java"
+_SOURCE_PREFIX = "__source_to_analyze"
 
 
 class JavaParser(JvmToolBase):
@@ -43,6 +47,21 @@ class JavaParser(JvmToolBase):
         "java_parser.lock",
     )
 
+    batch_size = IntOption(
+        default=128,
+        advanced=True,
+        help=softwrap(
+            """
+            The target number of Java source files to analyze in each run of the parser when
+            analyzing all of the Java sources in the repository, e.g. for `dependencies ::`.
+
+            Larger batches amortize the startup cost of the JVM over more files, but mean that
+            more files are re-analyzed when any one file in the batch changes. Batches are created
+            at stable boundaries, so adding or removing a file only affects one batch.
+            """
+        ),
+    )
+
 
 @dataclass(frozen=True)
 class JavaSourceDependencyAnalysisRequest:
@@ -96,8 +115,101 @@ async def analyze_java_source_dependencies(
         raise ValueError(
             "parse_java_package expects sources with exactly 1 source file, but found none."
         )
-    source_prefix = "__source_to_analyze"
-    source_path = os.path.join(source_prefix, source_files.files[0])
+    analysis_output_path = "__source_analysis.json"
+    process_result = await _run_java_parser(
+        processor_classfiles,
+        jdk,
+        tool,
+        source_files,
+        output_args=[analysis_output_path],
+        output_files=(analysis_output_path,),
+        output_directories=(),
+        description=f"Analyzing {source_files.files[0]}",
+    )
+    return FallibleJavaSourceDependencyAnalysisResult(process_result=process_result)
+
+
+@dataclass(frozen=True)
+class JavaSourceDependencyAnalysisBatchRequest:
+    source_files: SourceFiles
+
+
+@dataclass(frozen=True)
+class JavaSourceDependencyAnalysisBatch:
+    """The analysis of each of the files of a `JavaSourceDependencyAnalysisBatchRequest`.
+
+    Files which fail to parse are recorded in `failures`, along with their error, rather than
+    failing the whole batch. Callers should analyze those files individually, in order to surface
+    the error for the offending file. If the parser itself fails, no files are analyzed.
+    """
+
+    analyses: FrozenDict[str, JavaSourceDependencyAnalysis]
+    failures: FrozenDict[str, str]
+
+
+@rule(level=LogLevel.DEBUG)
+async def analyze_java_source_dependencies_batch(
+    processor_classfiles: JavaParserCompiledClassfiles,
+    jdk: InternalJdk,
+    tool: JavaParser,
+    request: JavaSourceDependencyAnalysisBatchRequest,
+) -> JavaSourceDependencyAnalysisBatch:
+    source_files = request.source_files
+    if not source_files.files:
+        return JavaSourceDependencyAnalysisBatch(FrozenDict(), FrozenDict())
+
+    analysis_output_dir = "__source_analysis"
+    process_result = await _run_java_parser(
+        processor_classfiles,
+        jdk,
+        tool,
+        source_files,
+        output_args=["--output-dir", analysis_output_dir],
+        output_files=(),
+        output_directories=(analysis_output_dir,),
+        description=f"Analyzing {pluralize(len(source_files.files), 'Java source')}",
+    )
+    if process_result.exit_code != 0:
+        logger.debug(
+            f"Failed to analyze {pluralize(len(source_files.files), 'Java source')} in a batch, "
+            f"they will be analyzed individually:\n{process_result.stderr.decode()}"
+        )
+        return JavaSourceDependencyAnalysisBatch(FrozenDict(), FrozenDict())
+
+    analysis_digest = await Get(
+        Digest,
+        RemovePrefix(
+            process_result.output_digest, os.path.join(analysis_output_dir, _SOURCE_PREFIX)
+        ),
+    )
+    analysis_contents = await Get(DigestContents, Digest, analysis_digest)
+    analyses = {}
+    failures = {}
+    for file_content in analysis_contents:
+        if file_content.path.endswith(".error"):
+            failures[file_content.path[: -len(".error")]] = file_content.content.decode()
+        else:
+            analysis = JavaSourceDependencyAnalysis.from_json_dict(json.loads(file_content.content))
+            analyses[file_content.path[: -len(".json")]] = analysis
+    if failures:
+        logger.debug(
+            f"Failed to analyze {pluralize(len(failures), 'Java source')} in a batch, they will "
+            f"be analyzed individually: {', '.join(sorted(failures))}"
+        )
+    return JavaSourceDependencyAnalysisBatch(FrozenDict(analyses), FrozenDict(failures))
+
+
+async def _run_java_parser(
+    processor_classfiles: JavaParserCompiledClassfiles,
+    jdk: InternalJdk,
+    tool: JavaParser,
+    source_files: SourceFiles,
+    *,
+    output_args: list[str],
+    output_files: tuple[str, ...],
+    output_directories: tuple[str, ...],
+    description: str,
+) -> FallibleProcessResult:
     processorcp_relpath = "__processorcp"
     toolcp_relpath = "__toolcp"
 
@@ -106,7 +218,7 @@ async def analyze_java_source_dependencies(
             ToolClasspath,
             ToolClasspathRequest(lockfile=(GenerateJvmLockfileFromTool.create(tool))),
         ),
-        Get(Digest, AddPrefix(source_files.snapshot.digest, source_prefix)),
+        Get(Digest, AddPrefix(source_files.snapshot.digest, _SOURCE_PREFIX)),
     )
 
     extra_immutable_input_digests = {
@@ -114,9 +226,7 @@ async def analyze_java_source_dependencies(
         processorcp_relpath: processor_classfiles.digest,
     }
 
-    analysis_output_path = "__source_analysis.json"
-
-    process_result = await Get(
+    return await Get(
         FallibleProcessResult,
         JvmProcess(
             jdk=jdk,
@@ -126,20 +236,19 @@ async def analyze_java_source_dependencies(
             ],
             argv=[
                 "org.pantsbuild.javaparser.PantsJavaParserLauncher",
-                analysis_output_path,
-                source_path,
+                *output_args,
+                *(os.path.join(_SOURCE_PREFIX, file) for file in source_files.files),
             ],
             input_digest=prefixed_source_files_digest,
             extra_immutable_input_digests=extra_immutable_input_digests,
-            output_files=(analysis_output_path,),
+            output_files=output_files,
+            output_directories=output_directories,
             extra_nailgun_keys=extra_immutable_input_digests,
-            description=f"Analyzing {source_files.files[0]}",
+            description=description,
             level=LogLevel.DEBUG,
         ),
     )
 
-    return FallibleJavaSourceDependencyAnalysisResult(process_result=process_result)
-
 
 def _load_javaparser_launcher_source() -> bytes:
     return pkg_resources.resource_string(__name__, _LAUNCHER_BASENAME)
@@ -9,6 +9,8 @@ import pytest
 
 from pants.backend.java.dependency_inference.java_parser import (
     FallibleJavaSourceDependencyAnalysisResult,
+    JavaSourceDependencyAnalysisBatch,
+    JavaSourceDependencyAnalysisBatchRequest,
 )
 from pants.backend.java.dependency_inference.java_parser import rules as java_parser_rules
 from pants.backend.java.dependency_inference.types import JavaImport, JavaSourceDependencyAnalysis
@@ -38,6 +40,9 @@ def rule_runner() -> RuleRunner:
             *jdk_rules.rules(),
             QueryRule(FallibleJavaSourceDependencyAnalysisResult, (SourceFiles,)),
             QueryRule(JavaSourceDependencyAnalysis, (SourceFiles,)),
+            QueryRule(
+                JavaSourceDependencyAnalysisBatch, (JavaSourceDependencyAnalysisBatchRequest,)
+            ),
             QueryRule(SourceFiles, (SourceFilesRequest,)),
         ],
         target_types=[JavaSourceTarget],
@@ -309,3 +314,63 @@ def test_java_parser_consumed_types(rule_runner: RuleRunner) -> None:
         "String",
         "provider",  # note: false positive on a variable identifier
     ]
+
+
+@maybe_skip_jdk_test
+def test_java_parser_batch(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "BUILD": dedent(
+                """\
+                java_source(name='a', source='A.java')
+                java_source(name='b', source='sub/B.java')
+                java_source(name='bad', source='Bad.java')
+                """
+            ),
+            "A.java": dedent(
+                """\
+                package org.pantsbuild.a;
+
+                import org.pantsbuild.b.B;
+
+                public class A {}
+                """
+            ),
+            "sub/B.java": dedent(
+                """\
+                package org.pantsbuild.b;
+
+                public class B {}
+                """
+            ),
+            "Bad.java": "public class Bad {",
+        }
+    )
+
+    def analyze_batch(*target_names: str) -> JavaSourceDependencyAnalysisBatch:
+        source_files = rule_runner.request(
+            SourceFiles,
+            [
+                SourceFilesRequest(
+                    rule_runner.get_target(Address("", target_name=name))[JavaSourceField]
+                    for name in target_names
+                )
+            ],
+        )
+        return rule_runner.request(
+            JavaSourceDependencyAnalysisBatch,
+            [JavaSourceDependencyAnalysisBatchRequest(source_files)],
+        )
+
+    batch = analyze_batch("a", "b")
+    assert sorted(batch.analyses) == ["A.java", "sub/B.java"]
+    assert batch.analyses["A.java"].declared_package == "org.pantsbuild.a"
+    assert batch.analyses["A.java"].imports == (JavaImport(name="org.pantsbuild.b.B"),)
+    assert batch.analyses["sub/B.java"].top_level_types == ("org.pantsbuild.b.B",)
+    assert not batch.failures
+
+    # A file which fails to parse is recorded as a failure, without affecting the rest of its batch.
+    batch = analyze_batch("a", "bad")
+    assert sorted(batch.analyses) == ["A.java"]
+    assert sorted(batch.failures) == ["Bad.java"]
+    assert "ParseProblemException" in batch.failures["Bad.java"]
@@ -5,11 +5,18 @@ from __future__ import annotations
 
 import logging
 from collections import defaultdict
+from dataclasses import dataclass
 from typing import Mapping
 
+from pants.backend.java.dependency_inference.java_parser import (
+    JavaParser,
+    JavaSourceDependencyAnalysisBatch,
+    JavaSourceDependencyAnalysisBatchRequest,
+)
 from pants.backend.java.dependency_inference.types import JavaSourceDependencyAnalysis
 from pants.backend.java.target_types import JavaSourceField
-from pants.core.util_rules.source_files import SourceFilesRequest
+from pants.core.util_rules.source_files import SourceFiles, SourceFilesRequest
+from pants.engine.addresses import Address
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
 from pants.engine.target import AllTargets, Targets
 from pants.engine.unions import UnionRule
@@ -18,6 +25,8 @@ from pants.jvm.dependency_inference.artifact_mapper import MutableTrieNode
 from pants.jvm.dependency_inference.symbol_mapper import FirstPartyMappingRequest, SymbolMap
 from pants.jvm.subsystems import JvmSubsystem
 from pants.jvm.target_types import JvmResolveField
+from pants.util.collections import partition_sequentially
+from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 
 logger = logging.getLogger(__name__)
@@ -32,6 +41,64 @@ def find_all_java_targets(tgts: AllTargets) -> AllJavaTargets:
     return AllJavaTargets(tgt for tgt in tgts if tgt.has_field(JavaSourceField))
 
 
+@dataclass(frozen=True)
+class JavaSourceAnalysisBatches:
+    """All Java sources in the project, partitioned into batches to be analyzed together."""
+
+    batches: tuple[tuple[JavaSourceField, ...], ...]
+    address_to_batch: FrozenDict[Address, int]
+
+
+@rule(desc="Partition Java sources for analysis", level=LogLevel.DEBUG)
+def partition_java_sources_for_analysis(
+    java_targets: AllJavaTargets, tool: JavaParser
+) -> JavaSourceAnalysisBatches:
+    batches = tuple(
+        tuple(tgt[JavaSourceField] for tgt in batch)
+        for batch in partition_sequentially(
+            java_targets,
+            key=lambda tgt: tgt.address.spec,
+            size_target=tool.batch_size,
+            size_max=2 * tool.batch_size,
+        )
+    )
+    return JavaSourceAnalysisBatches(
+        batches,
+        FrozenDict((source.address, i) for i, batch in enumerate(batches) for source in batch),
+    )
+
+
+@dataclass(frozen=True)
+class BatchedJavaSourceDependencyAnalysisRequest:
+    """Analyze a Java source as part of the batch of sources that it belongs to.
+
+    Each batch is analyzed in a single run of the parser, and the result is split back into the
+    analysis of each file.
+    """
+
+    source: JavaSourceField
+
+
+@rule(level=LogLevel.DEBUG)
+async def analyze_java_source_dependencies_in_batch(
+    request: BatchedJavaSourceDependencyAnalysisRequest, batches: JavaSourceAnalysisBatches
+) -> JavaSourceDependencyAnalysis:
+    batch_index = batches.address_to_batch.get(request.source.address)
+    if batch_index is not None:
+        source_files = await Get(SourceFiles, SourceFilesRequest(batches.batches[batch_index]))
+        batch = await Get(
+            JavaSourceDependencyAnalysisBatch,
+            JavaSourceDependencyAnalysisBatchRequest(source_files),
+        )
+        analysis = batch.analyses.get(request.source.file_path)
+        if analysis is not None:
+            return analysis
+
+    # Either the source is not owned by a Java target, or it (or the parser) failed in its batch:
+    # analyze it individually, which will raise its error.
+    return await Get(JavaSourceDependencyAnalysis, SourceFilesRequest([request.source]))
+
+
 class FirstPartyJavaTargetsMappingRequest(FirstPartyMappingRequest):
     pass
 
@@ -43,7 +110,10 @@ async def map_first_party_java_targets_to_symbols(
     jvm: JvmSubsystem,
 ) -> SymbolMap:
     source_analysis = await MultiGet(
-        Get(JavaSourceDependencyAnalysis, SourceFilesRequest([target[JavaSourceField]]))
+        Get(
+            JavaSourceDependencyAnalysis,
+            BatchedJavaSourceDependencyAnalysisRequest(target[JavaSourceField]),
+        )
         for target in java_targets
     )
     address_and_analysis = zip(
@@ -7,7 +7,7 @@ import logging
 import os.path
 from dataclasses import dataclass
 from pathlib import PurePath
-from typing import Iterable
+from typing import Iterable, Mapping
 
 from pants.backend.javascript import package_json
 from pants.backend.javascript.package_json import (
@@ -53,6 +53,7 @@ from pants.engine.target import (
     Targets,
 )
 from pants.engine.unions import UnionRule
+from pants.source.filespec import FilespecMatcher
 from pants.util.docutil import doc_url
 from pants.util.frozendict import FrozenDict
 from pants.util.ordered_set import FrozenOrderedSet
@@ -137,7 +138,7 @@ def _create_inference_metadata(
 
 async def _prepare_inference_metadata(address: Address, file_path: str) -> InferenceMetadata:
     owning_pkg, maybe_config = await concurrently(
-        find_owning_package(OwningNodePackageRequest(address)),
+        find_owning_package(OwningNodePackageRequest(address), **implicitly()),
         find_parent_ts_config(ParentTSConfigRequest(file_path, "jsconfig.json"), **implicitly()),
     )
     if not owning_pkg.target:
@@ -157,46 +158,79 @@ async def _prepare_inference_metadata(address: Address, file_path: str) -> Infer
     )
 
 
-def _add_extensions(file_imports: frozenset[str], file_extensions: tuple[str, ...]) -> PathGlobs:
+def _add_extensions(file_import: str, file_extensions: tuple[str, ...]) -> tuple[str, ...]:
+    if PurePath(file_import).suffix:
+        return (file_import,)
     extensions = file_extensions + tuple(f"/index{ext}" for ext in file_extensions)
-    return PathGlobs(
-        string
-        for file_import in file_imports
-        for string in (
-            [file_import]
-            if PurePath(file_import).suffix
-            else [f"{file_import}{ext}" for ext in extensions]
-        )
-    )
+    return tuple(f"{file_import}{ext}" for ext in extensions)
+
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+def _matching_paths(candidate_paths: Iterable[str], existing_paths: frozenset[str]) -> set[str]:
+    matches = set()
+    for candidate_path in candidate_paths:
+        if not _GLOB_CHARS.intersection(candidate_path):
+            if candidate_path in existing_paths:
+                matches.add(candidate_path)
+        else:
+            # The candidate was expanded as a glob when checking for existing files. Match it with
+            # the same semantics, e.g. `*` does not match across directories.
+            matches.update(FilespecMatcher([candidate_path], ()).matches(sorted(existing_paths)))
+    return matches
 
 
-async def _determine_import_from_candidates(
-    candidates: ParsedJavascriptDependencyCandidate,
+async def _determine_imports_from_candidates(
+    import_candidates: Mapping[str, ParsedJavascriptDependencyCandidate],
     package_candidate_map: NodePackageCandidateMap,
     file_extensions: tuple[str, ...],
-) -> Addresses:
-    paths = await path_globs_to_paths(
-        _add_extensions(
-            candidates.file_imports,
-            file_extensions,
-        )
+) -> dict[str, Addresses]:
+    """Determine the addresses of each of the imports of a file.
+
+    The candidate paths of all of the imports are checked for existence at once, and the owners of
+    each existing path are looked up once, rather than once per import.
+    """
+    candidate_paths = {
+        string: {
+            path
+            for file_import in candidates.file_imports
+            for path in _add_extensions(file_import, file_extensions)
+        }
+        for string, candidates in import_candidates.items()
+    }
+    all_candidate_paths = sorted(set(itertools.chain.from_iterable(candidate_paths.values())))
+    existing_paths = (
+        frozenset((await path_globs_to_paths(PathGlobs(all_candidate_paths))).files)
+        if all_candidate_paths
+        else frozenset()
     )
-    local_owners = await Get(Owners, OwnersRequest(paths.files))
-
-    owning_targets = await Get(Targets, Addresses(local_owners))
-
-    addresses = Addresses(tgt.address for tgt in owning_targets)
-    if not local_owners:
+    matching_paths = {
+        string: _matching_paths(paths, existing_paths) for string, paths in candidate_paths.items()
+    }
+
+    owned_paths = sorted(set(itertools.chain.from_iterable(matching_paths.values())))
+    all_owners = await concurrently(Get(Owners, OwnersRequest((path,))) for path in owned_paths)
+    owners_by_path = dict(zip(owned_paths, all_owners))
+
+    result = {}
+    for string, candidates in import_candidates.items():
+        local_owners = {
+            address for path in matching_paths[string] for address in owners_by_path[path]
+        }
+        if local_owners:
+            result[string] = Addresses(sorted(local_owners))
+            continue
         non_path_string_bases = FrozenOrderedSet(
             non_path_string.partition(os.path.sep)[0]
             for non_path_string in candidates.package_imports
         )
-        addresses = Addresses(
+        result[string] = Addresses(
             package_candidate_map[pkg_name]
             for pkg_name in non_path_string_bases
             if pkg_name in package_candidate_map
         )
-    return addresses
+    return result
 
 
 def _handle_unowned_imports(
@@ -251,18 +285,10 @@ async def infer_js_source_dependencies(
             RequestNodePackagesCandidateMap(request.field_set.address), **implicitly()
         ),
     )
-    imports = dict(
-        zip(
-            import_strings.imports,
-            await concurrently(
-                _determine_import_from_candidates(
-                    candidates,
-                    candidate_pkgs,
-                    file_extensions=JS_FILE_EXTENSIONS + JSX_FILE_EXTENSIONS,
-                )
-                for string, candidates in import_strings.imports.items()
-            ),
-        )
+    imports = await _determine_imports_from_candidates(
+        import_strings.imports,
+        candidate_pkgs,
+        file_extensions=JS_FILE_EXTENSIONS + JSX_FILE_EXTENSIONS,
     )
     _handle_unowned_imports(
         request.field_set.address,
@@ -13,6 +13,7 @@ from pants.backend.javascript.dependency_inference.rules import (
     InferNodePackageDependenciesRequest,
     JSSourceInferenceFieldSet,
     NodePackageInferenceFieldSet,
+    _matching_paths,
 )
 from pants.backend.javascript.dependency_inference.rules import rules as dependency_inference_rules
 from pants.backend.javascript.package_json import AllPackageJson
@@ -81,6 +82,39 @@ def test_infers_esmodule_js_dependencies(rule_runner: RuleRunner) -> None:
     assert set(addresses) == {Address("src/js", relative_file_path="xes.mjs")}
 
 
+def test_infers_many_extension_less_js_dependencies(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "src/js/BUILD": "javascript_sources()",
+            "src/js/index.mjs": dedent(
+                """\
+                import { a } from "./a";
+                import { b } from "./b";
+                import { c } from "./c";
+                import { d } from "./missing";
+                import { e } from "./a";
+                """
+            ),
+            "src/js/a.js": "",
+            "src/js/b.mjs": "",
+            "src/js/c/BUILD": "javascript_sources()",
+            "src/js/c/index.cjs": "",
+        }
+    )
+
+    index_tgt = rule_runner.get_target(Address("src/js", relative_file_path="index.mjs"))
+    addresses = rule_runner.request(
+        InferredDependencies,
+        [InferJSDependenciesRequest(JSSourceInferenceFieldSet.create(index_tgt))],
+    ).include
+
+    assert set(addresses) == {
+        Address("src/js", relative_file_path="a.js"),
+        Address("src/js", relative_file_path="b.mjs"),
+        Address("src/js/c", relative_file_path="index.cjs"),
+    }
+
+
 def test_infers_esmodule_js_dependencies_from_ancestor_files(rule_runner: RuleRunner) -> None:
     rule_runner.write_files(
         {
@@ -564,3 +598,12 @@ def test_infers_first_party_package_json_field_js_source_dependency_with_starred
     ).include
 
     assert set(addresses) == {Address("src/js/b", generated_name="spam")}
+
+
+def test_matching_paths() -> None:
+    existing_paths = frozenset({"src/a.js", "src/lib/a.js", "src/lib/b.ts"})
+    assert _matching_paths(["src/a.js", "src/missing.js"], existing_paths) == {"src/a.js"}
+    # Globs match with the semantics of PathGlobs, in which `*` does not cross directories, so
+    # that a glob does not claim paths which only exist due to other candidates.
+    assert _matching_paths(["src/*.js"], existing_paths) == {"src/a.js"}
+    assert _matching_paths(["src/**/*.js"], existing_paths) == {"src/a.js", "src/lib/a.js"}
@@ -14,7 +14,7 @@ import yaml
 
 from pants.backend.project_info import dependencies
 from pants.base.glob_match_error_behavior import GlobMatchErrorBehavior
-from pants.base.specs import AncestorGlobSpec, RawSpecs
+from pants.base.specs import DirLiteralSpec, RawSpecs
 from pants.build_graph.address import Address
 from pants.build_graph.build_file_aliases import BuildFileAliases
 from pants.core.goals.package import OutputPathField
@@ -653,25 +653,64 @@ class OwningNodePackage:
         raise ValueError("No owner could be determined.")
 
 
+@dataclass(frozen=True)
+class NodePackageDirectories:
+    """The directories of all `package_json` targets in the project.
+
+    Used to find the package which owns a source without resolving the targets of every ancestor
+    directory of the source.
+    """
+
+    directories: frozenset[str]
+
+    def nearest(self, directory: str) -> str | None:
+        """The nearest directory at or above `directory` which contains a `package_json` target."""
+        while True:
+            if directory in self.directories:
+                return directory
+            if not directory:
+                return None
+            directory = os.path.dirname(directory)
+
+
 @rule
-async def find_owning_package(request: OwningNodePackageRequest) -> OwningNodePackage:
+async def find_node_package_directories() -> NodePackageDirectories:
+    # Avoids using `AllTargets` for the same reason as `all_package_json`.
+    requests = await Get(
+        ResolvedTargetGeneratorRequests,
+        ResolveAllTargetGeneratorRequests(
+            description_of_origin="The `NodePackageDirectories` rule", of_type=PackageJsonTarget
+        ),
+    )
+    return NodePackageDirectories(
+        frozenset(req.generator.address.spec_path for req in requests.requests)
+    )
+
+
+@dataclass(frozen=True)
+class OwningNodePackageInDirectoryRequest:
+    directory: str
+
+
+@rule
+async def find_owning_package_in_directory(
+    request: OwningNodePackageInDirectoryRequest,
+) -> OwningNodePackage:
     candidate_targets = await Get(
         Targets,
         RawSpecs(
-            ancestor_globs=(AncestorGlobSpec(request.address.spec_path),),
+            dir_literals=(DirLiteralSpec(request.directory),),
             description_of_origin=f"the `{OwningNodePackage.__name__}` rule",
         ),
     )
-    package_json_tgts = sorted(
+    tgt = next(
         (
             tgt
             for tgt in candidate_targets
             if tgt.has_field(PackageJsonSourceField) and tgt.has_field(NodePackageNameField)
         ),
-        key=lambda tgt: tgt.address.spec_path,
-        reverse=True,
+        None,
     )
-    tgt = package_json_tgts[0] if package_json_tgts else None
     if tgt:
         deps = await Get(Targets, DependenciesRequest(tgt[Dependencies]))
         return OwningNodePackage(
@@ -680,6 +719,17 @@ async def find_owning_package(request: OwningNodePackageRequest) -> OwningNodePa
     return OwningNodePackage()
 
 
+@rule
+async def find_owning_package(
+    request: OwningNodePackageRequest, package_directories: NodePackageDirectories
+) -> OwningNodePackage:
+    # All sources in a package share the result for the package's directory.
+    directory = package_directories.nearest(request.address.spec_path)
+    if directory is None:
+        return OwningNodePackage.no_owner()
+    return await Get(OwningNodePackage, OwningNodePackageInDirectoryRequest(directory))
+
+
 @rule
 async def parse_package_json(content: FileContent) -> PackageJson:
     parsed_package_json = FrozenDict.deep_freeze(json.loads(content.content))
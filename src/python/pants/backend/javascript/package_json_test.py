@@ -11,9 +11,12 @@ import pytest
 from pants.backend.javascript import package_json
 from pants.backend.javascript.package_json import (
     AllPackageJson,
+    NodePackageDirectories,
     NodePackageTestScriptField,
     NodeTestScript,
     NodeThirdPartyPackageTarget,
+    OwningNodePackage,
+    OwningNodePackageRequest,
     PackageJson,
     PackageJsonImports,
     PackageJsonSourceField,
@@ -39,6 +42,7 @@ def rule_runner() -> RuleRunner:
             QueryRule(AllPackageJson, ()),
             QueryRule(Owners, (OwnersRequest,)),
             QueryRule(PackageJsonImports, (PackageJsonSourceField,)),
+            QueryRule(OwningNodePackage, (OwningNodePackageRequest,)),
         ],
         target_types=[
             PackageJsonTarget,
@@ -86,6 +90,37 @@ def test_parses_package_jsons(rule_runner: RuleRunner) -> None:
     }
 
 
+def test_nearest_node_package_directory() -> None:
+    package_directories = NodePackageDirectories(frozenset({"", "src/js/a"}))
+    assert package_directories.nearest("src/js/a") == "src/js/a"
+    assert package_directories.nearest("src/js/a/lib") == "src/js/a"
+    assert package_directories.nearest("src/js/ab") == ""
+    assert package_directories.nearest("") == ""
+    assert NodePackageDirectories(frozenset({"src/js/a"})).nearest("src/js") is None
+
+
+def test_finds_nearest_owning_package(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "src/js/BUILD": "package_json()",
+            "src/js/package.json": given_package("outer", "0.0.1"),
+            "src/js/a/BUILD": "package_json()",
+            "src/js/a/package.json": given_package("inner", "0.0.1"),
+        }
+    )
+
+    def owning_package_name(spec_path: str) -> str | None:
+        owning_pkg = rule_runner.request(
+            OwningNodePackage, [OwningNodePackageRequest(Address(spec_path, target_name="x"))]
+        )
+        return owning_pkg.target.address.generated_name if owning_pkg.target else None
+
+    assert owning_package_name("src/js/a/lib") == "inner"
+    assert owning_package_name("src/js/a") == "inner"
+    assert owning_package_name("src/js/b") == "outer"
+    assert owning_package_name("src") is None
+
+
 def test_parse_package_json_without_name(rule_runner: RuleRunner) -> None:
     rule_runner.write_files(
         {
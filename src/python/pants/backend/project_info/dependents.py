@@ -4,7 +4,7 @@ import json
 from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum
-from typing import Iterable, Set
+from typing import DefaultDict, Iterable, List, Set, Tuple
 
 from pants.engine.addresses import Address, Addresses
 from pants.engine.collection import DeduplicatedCollection
@@ -16,6 +16,7 @@ from pants.engine.target import (
     AlwaysTraverseDeps,
     Dependencies,
     DependenciesRequest,
+    Target,
 )
 from pants.option.option_types import BoolOption, EnumOption
 from pants.util.frozendict import FrozenDict
@@ -27,6 +28,23 @@ from pants.util.ordered_set import FrozenOrderedSet
 class AddressToDependents:
     mapping: FrozenDict[Address, FrozenOrderedSet[Address]]
 
+    def dependents(self, addresses: Iterable[Address], *, transitive: bool) -> Set[Address]:
+        """Find the (optionally transitive) dependents of any of the given addresses.
+
+        The result may include the given addresses themselves, if they depend on one another.
+        """
+        dependents: Set[Address] = set()
+        check = set(addresses)
+        while check:
+            new_dependents: Set[Address] = set()
+            for address in check:
+                new_dependents.update(self.mapping.get(address, ()))
+            check = new_dependents - dependents
+            dependents |= new_dependents
+            if not transitive:
+                break
+        return dependents
+
 
 class DependentsOutputFormat(Enum):
     """Output format for listing dependents.
@@ -39,8 +57,19 @@ class DependentsOutputFormat(Enum):
     json = "json"
 
 
-@rule(desc="Map all targets to their dependents", level=LogLevel.DEBUG)
-async def map_addresses_to_dependents(all_targets: AllUnexpandedTargets) -> AddressToDependents:
+@dataclass(frozen=True)
+class _DirectoryDependentsRequest:
+    """The targets of a single directory."""
+
+    targets: Tuple[Target, ...]
+
+
+class _DirectoryDependents(FrozenDict[Address, FrozenOrderedSet[Address]]):
+    """The dependents of each address, among the targets of a single directory."""
+
+
+@rule(desc="Map the targets of a directory to their dependents", level=LogLevel.DEBUG)
+async def map_directory_to_dependents(request: _DirectoryDependentsRequest) -> _DirectoryDependents:
     dependencies_per_target = await MultiGet(
         Get(
             Addresses,
@@ -48,18 +77,41 @@ async def map_addresses_to_dependents(all_targets: AllUnexpandedTargets) -> Addr
                 tgt.get(Dependencies), should_traverse_deps_predicate=AlwaysTraverseDeps()
             ),
         )
-        for tgt in all_targets
+        for tgt in request.targets
     )
 
-    address_to_dependents = defaultdict(set)
-    for tgt, dependencies in zip(all_targets, dependencies_per_target):
+    address_to_dependents: DefaultDict[Address, List[Address]] = defaultdict(list)
+    for tgt, dependencies in zip(request.targets, dependencies_per_target):
         for dependency in dependencies:
-            address_to_dependents[dependency].add(tgt.address)
+            address_to_dependents[dependency].append(tgt.address)
+    return _DirectoryDependents(
+        (address, FrozenOrderedSet(dependents))
+        for address, dependents in address_to_dependents.items()
+    )
+
+
+@rule(desc="Map all targets to their dependents", level=LogLevel.DEBUG)
+async def map_addresses_to_dependents(all_targets: AllUnexpandedTargets) -> AddressToDependents:
+    # The dependents are mapped per directory, so that after an edit the engine only re-maps the
+    # directories whose targets or dependencies changed. The mappings of all directories are still
+    # merged again though, which is linear in the number of dependencies in the repository.
+    targets_per_directory: DefaultDict[str, List[Target]] = defaultdict(list)
+    for tgt in all_targets:
+        targets_per_directory[tgt.address.spec_path].append(tgt)
+    dependents_per_directory = await MultiGet(
+        Get(_DirectoryDependents, _DirectoryDependentsRequest(tuple(targets)))
+        for targets in targets_per_directory.values()
+    )
+
+    address_to_dependents: DefaultDict[Address, List[Address]] = defaultdict(list)
+    for directory_dependents in dependents_per_directory:
+        for address, dependents in directory_dependents.items():
+            address_to_dependents[address].extend(dependents)
     return AddressToDependents(
         FrozenDict(
             {
-                addr: FrozenOrderedSet(dependents)
-                for addr, dependents in address_to_dependents.items()
+                address: FrozenOrderedSet(dependents)
+                for address, dependents in address_to_dependents.items()
             }
         )
     )
@@ -83,26 +135,39 @@ class Dependents(DeduplicatedCollection[Address]):
     sort_input = True
 
 
+def _dependents_result(
+    roots: Iterable[Address], dependents: Set[Address], *, include_roots: bool
+) -> Dependents:
+    return Dependents(dependents | set(roots) if include_roots else dependents - set(roots))
+
+
 @rule(level=LogLevel.DEBUG)
 def find_dependents(
     request: DependentsRequest, address_to_dependents: AddressToDependents
 ) -> Dependents:
-    check = set(request.addresses)
-    known_dependents: Set[Address] = set()
-    while True:
-        dependents = set(known_dependents)
-        for target in check:
-            target_dependents = address_to_dependents.mapping.get(target, FrozenOrderedSet())
-            dependents.update(target_dependents)
-        check = dependents - known_dependents
-        if not check or not request.transitive:
-            result = (
-                dependents | set(request.addresses)
-                if request.include_roots
-                else dependents - set(request.addresses)
-            )
-            return Dependents(result)
-        known_dependents = dependents
+    dependents = address_to_dependents.dependents(request.addresses, transitive=request.transitive)
+    return _dependents_result(request.addresses, dependents, include_roots=request.include_roots)
+
+
+class DependentsPerAddress(FrozenDict[Address, Dependents]):
+    """The dependents of each of the addresses of a `DependentsRequest`."""
+
+
+@rule(level=LogLevel.DEBUG)
+def find_dependents_per_address(
+    request: DependentsRequest, address_to_dependents: AddressToDependents
+) -> DependentsPerAddress:
+    return DependentsPerAddress(
+        (
+            address,
+            _dependents_result(
+                (address,),
+                address_to_dependents.dependents((address,), transitive=request.transitive),
+                include_roots=request.include_roots,
+            ),
+        )
+        for address in request.addresses
+    )
 
 
 class DependentsSubsystem(LineOriented, GoalSubsystem):
@@ -149,21 +214,18 @@ async def list_dependents_as_json(
     addresses: Addresses, dependents_subsystem: DependentsSubsystem, console: Console
 ) -> None:
     """Get dependents for given addresses and list them in the console in JSON."""
-    dependents_group = await MultiGet(
-        Get(
-            Dependents,
-            DependentsRequest(
-                (address,),
-                transitive=dependents_subsystem.transitive,
-                include_roots=dependents_subsystem.closed,
-            ),
-        )
-        for address in addresses
+    dependents_per_address = await Get(
+        DependentsPerAddress,
+        DependentsRequest(
+            addresses,
+            transitive=dependents_subsystem.transitive,
+            include_roots=dependents_subsystem.closed,
+        ),
     )
-    iterated_addresses = []
-    for dependents in dependents_group:
-        iterated_addresses.append(sorted([str(address) for address in dependents]))
-    mapping = dict(zip([str(address) for address in addresses], iterated_addresses))
+    mapping = {
+        str(address): sorted([str(dependent) for dependent in dependents])
+        for address, dependents in dependents_per_address.items()
+    }
     output = json.dumps(mapping, indent=4)
     with dependents_subsystem.line_oriented(console) as print_stdout:
         print_stdout(output)
@@ -10,6 +10,7 @@ from pants.backend.project_info.dependents import DependentsGoal, DependentsOutp
 from pants.backend.project_info.dependents import rules as dependent_rules
 from pants.engine.target import Dependencies, SpecialCasedDependencies, Target
 from pants.testutil.rule_runner import RuleRunner
+from pants.util.logging import LogLevel
 
 
 class SpecialDeps(SpecialCasedDependencies):
@@ -123,6 +124,42 @@ def test_special_cased_dependencies(rule_runner: RuleRunner) -> None:
     )
 
 
+def test_dependents_after_edits(rule_runner: RuleRunner) -> None:
+    rule_name = "pants.backend.project_info.dependents.map_directory_to_dependents"
+
+    def mapped_directories() -> int:
+        completed = rule_runner.scheduler.poll_workunits(LogLevel.DEBUG)["completed"]
+        return sum(1 for workunit in completed if workunit["name"] == rule_name)
+
+    assert_dependents(
+        rule_runner,
+        targets=["base"],
+        transitive=True,
+        expected=["intermediate:intermediate", "leaf:leaf"],
+    )
+    assert mapped_directories() == 3
+
+    # Only the directories whose targets changed are re-mapped.
+    rule_runner.write_files(
+        {
+            "leaf/BUILD": "tgt(dependencies=['base'])",
+            "other/BUILD": "tgt(dependencies=['leaf'])",
+        }
+    )
+    assert_dependents(
+        rule_runner, targets=["base"], expected=["intermediate:intermediate", "leaf:leaf"]
+    )
+    assert mapped_directories() == 2
+    assert_dependents(rule_runner, targets=["intermediate"], expected=[])
+    assert_dependents(rule_runner, targets=["leaf"], expected=["other:other"])
+    assert mapped_directories() == 0
+
+    rule_runner.write_files({"intermediate/BUILD": "", "other/BUILD": "tgt()"})
+    assert_dependents(rule_runner, targets=["base"], expected=["leaf:leaf"])
+    assert mapped_directories() == 1
+    assert_dependents(rule_runner, targets=["leaf"], expected=[])
+
+
 def test_dependents_as_json_direct_deps(rule_runner: RuleRunner) -> None:
     rule_runner.write_files({"special/BUILD": "tgt(special_deps=['intermediate'])"})
     assert_deps = partial(
@@ -8,6 +8,7 @@ import functools
 import itertools
 import logging
 import os
+import sys
 from collections import defaultdict
 from dataclasses import dataclass
 from functools import total_ordering
@@ -71,6 +72,10 @@ class PossibleModuleProvider:
     ancestry: int
 
 
+def top_level_module(module: str) -> str:
+    return module.split(".", maxsplit=1)[0]
+
+
 def module_from_stripped_path(path: PurePath) -> str:
     module_name_with_slashes = (
         path.parent if path.name in ("__init__.py", "__init__.pyi") else path.with_suffix("")
@@ -197,10 +202,58 @@ class FirstPartyPythonModuleMapping:
         )
 
 
+@dataclass(frozen=True)
+class FirstPartyPythonModuleMappingShards:
+    """The merged first-party module mapping, split into a shard per top-level package.
+
+    Each shard is the `FirstPartyPythonModuleMapping` of the modules within one top-level package.
+    Lookups of any module within a top-level package give the same result in its shard as in the
+    full mapping, since providers are never looked up across top-level packages.
+
+    This, rather than the full mapping, is what the engine keeps in memory for dependency
+    inference: the full `FirstPartyPythonModuleMapping` is only assembled from the shards on
+    request.
+    """
+
+    shards: FrozenDict[str, FirstPartyPythonModuleMapping]
+
+    @classmethod
+    def create(
+        cls,
+        resolves_to_modules_to_providers: Mapping[
+            ResolveName, Mapping[str, Iterable[ModuleProvider]]
+        ],
+    ) -> FirstPartyPythonModuleMappingShards:
+        shards: DefaultDict[
+            str, DefaultDict[ResolveName, dict[str, Tuple[ModuleProvider, ...]]]
+        ] = defaultdict(lambda: defaultdict(dict))
+        for resolve, modules_to_providers in resolves_to_modules_to_providers.items():
+            for module, providers in modules_to_providers.items():
+                shards[top_level_module(module)][resolve][module] = tuple(providers)
+        return cls(
+            FrozenDict(
+                (
+                    top_level,
+                    FirstPartyPythonModuleMapping(
+                        FrozenDict(
+                            (resolve, FrozenDict(modules_to_providers))
+                            for resolve, modules_to_providers in resolves_to_modules.items()
+                        )
+                    ),
+                )
+                for top_level, resolves_to_modules in sorted(shards.items())
+            )
+        )
+
+    def shard(self, package: str) -> FirstPartyPythonModuleMapping:
+        """Return the subset of the mapping for modules within the given top-level package."""
+        return self.shards.get(package) or FirstPartyPythonModuleMapping(FrozenDict())
+
+
 @rule(level=LogLevel.DEBUG)
-async def merge_first_party_module_mappings(
+async def shard_first_party_module_mappings(
     union_membership: UnionMembership,
-) -> FirstPartyPythonModuleMapping:
+) -> FirstPartyPythonModuleMappingShards:
     all_mappings = await MultiGet(
         Get(
             FirstPartyPythonMappingImpl,
@@ -215,20 +268,60 @@ async def merge_first_party_module_mappings(
     for mapping_impl in all_mappings:
         for resolve, modules_to_providers in mapping_impl.items():
             for module, providers in modules_to_providers.items():
-                resolves_to_modules_to_providers[resolve][module].extend(providers)
+                # Module names are shared by every resolve which contains them.
+                resolves_to_modules_to_providers[resolve][sys.intern(module)].extend(providers)
+    return FirstPartyPythonModuleMappingShards.create(
+        {
+            resolve: {module: sorted(providers) for module, providers in sorted(mapping.items())}
+            for resolve, mapping in sorted(resolves_to_modules_to_providers.items())
+        }
+    )
+
+
+@rule(level=LogLevel.DEBUG)
+async def merge_first_party_module_mappings(
+    mapping_shards: FirstPartyPythonModuleMappingShards,
+) -> FirstPartyPythonModuleMapping:
+    resolves_to_modules_to_providers: DefaultDict[
+        ResolveName, dict[str, Tuple[ModuleProvider, ...]]
+    ] = defaultdict(dict)
+    for shard in mapping_shards.shards.values():
+        for resolve, modules_to_providers in shard.resolves_to_modules_to_providers.items():
+            resolves_to_modules_to_providers[resolve].update(modules_to_providers)
     return FirstPartyPythonModuleMapping(
         FrozenDict(
-            (
-                resolve,
-                FrozenDict(
-                    (mod, tuple(sorted(providers))) for mod, providers in sorted(mapping.items())
-                ),
-            )
+            (resolve, FrozenDict(sorted(mapping.items())))
             for resolve, mapping in sorted(resolves_to_modules_to_providers.items())
         )
     )
 
 
+@dataclass(frozen=True)
+class FirstPartyPythonModuleMappingShardRequest:
+    top_level_module: str
+
+
+@dataclass(frozen=True)
+class FirstPartyPythonModuleMappingShard:
+    """The subset of the `FirstPartyPythonModuleMapping` for a single top-level package.
+
+    Consumers which only need to look up modules within one top-level package should request a
+    shard rather than the full mapping: the engine only invalidates consumers of a shard whose
+    content actually changed, and so adding or removing a module only invalidates the dependency
+    inference of modules which import from the same top-level package.
+    """
+
+    mapping: FirstPartyPythonModuleMapping
+
+
+@rule
+async def find_first_party_module_mapping_shard(
+    request: FirstPartyPythonModuleMappingShardRequest,
+    mapping_shards: FirstPartyPythonModuleMappingShards,
+) -> FirstPartyPythonModuleMappingShard:
+    return FirstPartyPythonModuleMappingShard(mapping_shards.shard(request.top_level_module))
+
+
 # This is only used to register our implementation with the plugin hook via unions. Note that we
 # implement this like any other plugin implementation so that we can run them all in parallel.
 class FirstPartyPythonTargetsMappingMarker(FirstPartyPythonMappingImplMarker):
@@ -452,12 +545,17 @@ class PythonModuleOwnersRequest:
 @rule
 async def map_module_to_address(
     request: PythonModuleOwnersRequest,
-    first_party_mapping: FirstPartyPythonModuleMapping,
     third_party_mapping: ThirdPartyPythonModuleMapping,
 ) -> PythonModuleOwners:
+    first_party_mapping_shard = await Get(
+        FirstPartyPythonModuleMappingShard,
+        FirstPartyPythonModuleMappingShardRequest(top_level_module(request.module)),
+    )
     possible_providers: tuple[PossibleModuleProvider, ...] = (
         *third_party_mapping.providers_for_module(request.module, resolve=request.resolve),
-        *first_party_mapping.providers_for_module(request.module, resolve=request.resolve),
+        *first_party_mapping_shard.mapping.providers_for_module(
+            request.module, resolve=request.resolve
+        ),
     )
 
     # We first attempt to disambiguate conflicting providers by taking - for each provider type -
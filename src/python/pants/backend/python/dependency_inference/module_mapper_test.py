@@ -29,6 +29,7 @@ from pants.backend.python.dependency_inference.default_module_mapping import (
 )
 from pants.backend.python.dependency_inference.module_mapper import (
     FirstPartyPythonModuleMapping,
+    FirstPartyPythonModuleMappingShards,
     ModuleProvider,
     ModuleProviderType,
     PossibleModuleProvider,
@@ -134,6 +135,10 @@ def test_first_party_modules_mapping() -> None:
         )
     )
 
+    mapping_shards = FirstPartyPythonModuleMappingShards.create(
+        mapping.resolves_to_modules_to_providers
+    )
+
     def assert_addresses(
         mod: str,
         expected: tuple[PossibleModuleProvider, ...],
@@ -141,6 +146,8 @@ def test_first_party_modules_mapping() -> None:
         resolve: str | None = None,
     ) -> None:
         assert mapping.providers_for_module(mod, resolve=resolve) == expected
+        shard = mapping_shards.shard(mod.split(".")[0])
+        assert shard.providers_for_module(mod, resolve=resolve) == expected
 
     root_provider0 = PossibleModuleProvider(root_provider, 0)
     root_provider1 = PossibleModuleProvider(root_provider, 1)
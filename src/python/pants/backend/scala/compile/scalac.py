@@ -28,7 +28,14 @@ from pants.backend.scala.util_rules.versions import (
 from pants.core.util_rules.source_files import SourceFilesRequest
 from pants.core.util_rules.stripped_source_files import StrippedSourceFiles
 from pants.core.util_rules.system_binaries import BashBinary, ZipBinary
-from pants.engine.fs import EMPTY_DIGEST, CreateDigest, Digest, Directory, MergeDigests
+from pants.engine.fs import (
+    EMPTY_DIGEST,
+    CreateDigest,
+    Digest,
+    DigestContents,
+    Directory,
+    MergeDigests,
+)
 from pants.engine.process import FallibleProcessResult, Process, ProcessCacheScope, ProcessResult
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
 from pants.engine.target import CoarsenedTarget, SourcesField
@@ -41,6 +48,7 @@ from pants.jvm.compile import (
     CompileResult,
     FallibleClasspathEntries,
     FallibleClasspathEntry,
+    compiled_jar_cache,
 )
 from pants.jvm.compile import rules as jvm_compile_rules
 from pants.jvm.jdk_rules import JdkEnvironment, JdkRequest, JvmProcess
@@ -49,6 +57,7 @@ from pants.jvm.resolve.coursier_fetch import ToolClasspath, ToolClasspathRequest
 from pants.jvm.strip_jar import strip_jar
 from pants.jvm.strip_jar.strip_jar import StripJarRequest
 from pants.jvm.subsystems import JvmSubsystem
+from pants.option.global_options import GlobalOptions
 from pants.util.logging import LogLevel
 
 logger = logging.getLogger(__name__)
@@ -73,6 +82,7 @@ def compute_output_jar_filename(ctgt: CoarsenedTarget) -> str:
 async def compile_scala_source(
     scala: ScalaSubsystem,
     jvm: JvmSubsystem,
+    global_options: GlobalOptions,
     scalac: Scalac,
     bash: BashBinary,
     zip_binary: ZipBinary,
@@ -185,6 +195,46 @@ async def compile_scala_source(
     compilation_empty_dir = await Get(Digest, CreateDigest([Directory(compilation_output_dir)]))
     merged_digest = await Get(Digest, MergeDigests([sources_digest, compilation_empty_dir]))
 
+    jar_cache = compiled_jar_cache(global_options, jvm)
+    # The Scala optimizer may inline method bodies from the classpath, in which case the output
+    # depends on more than the ABI of the classpath.
+    if any(arg.startswith(("-opt", "-Yopt")) for arg in scalac.args):
+        jar_cache = None
+    jar_cache_key = ""
+    cached_output = None
+    if jar_cache is not None:
+        jar_cache_key = jar_cache.key(
+            (
+                "scalac",
+                jdk.fingerprint,
+                tool_classpath.digest.fingerprint,
+                local_plugins.classpath.digest.fingerprint,
+                *local_plugins.args(local_scalac_plugins_relpath),
+                output_file,
+                f"reproducible_jars={jvm.reproducible_jars}",
+                *scalac.args,
+            ),
+            sources_digest,
+            ClasspathEntry.closure(direct_dependency_classpath_entries),
+        )
+        cached_output = jar_cache.get(jar_cache_key)
+
+    if cached_output is not None:
+        # NB: Outputs of scalac are not given an ABI fingerprint, since macros and inlining make
+        # the compilation of dependents depend on method bodies too.
+        _, cached_files = cached_output
+        output_digest = await Get(Digest, CreateDigest(cached_files))
+        return FallibleClasspathEntry(
+            description=str(request.component),
+            result=CompileResult.SUCCEEDED,
+            output=ClasspathEntry(
+                output_digest,
+                (file_content.path for file_content in cached_files),
+                direct_dependency_classpath_entries,
+            ),
+            exit_code=0,
+        )
+
     compile_result = await Get(
         FallibleProcessResult,
         JvmProcess(
@@ -250,6 +300,9 @@ async def compile_scala_source(
                 Digest, StripJarRequest(digest=output_digest, filenames=(output_file,))
             )
 
+        if jar_cache is not None:
+            jar_cache.put(jar_cache_key, None, await Get(DigestContents, Digest, output_digest))
+
         output = ClasspathEntry(output_digest, (output_file,), direct_dependency_classpath_entries)
 
     return FallibleClasspathEntry.from_fallible_process_result(
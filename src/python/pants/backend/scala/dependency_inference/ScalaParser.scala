@@ -567,13 +567,7 @@ object ScalaParser {
     analysisTraverser.toAnalysis
   }
 
-  def main(args: Array[String]): Unit = {
-    val outputPath = java.nio.file.Paths.get(args(0))
-    val pathStr = args(1)
-    val scalaVersion = args(2)
-    val source3 = args(3).toBoolean
-    val analysis = analyze(pathStr, scalaVersion, source3)
-
+  def writeAnalysis(outputPath: java.nio.file.Path, analysis: Analysis): Unit = {
     val json = analysis.asJson.noSpaces
     java.nio.file.Files.write(
       outputPath,
@@ -582,4 +576,39 @@ object ScalaParser {
       java.nio.file.StandardOpenOption.WRITE
     )
   }
+
+  // Usage:
+  //
+  //   ScalaParser OUTPUT_PATH SOURCE SCALA_VERSION SOURCE3
+  //   ScalaParser --output-dir OUTPUT_DIR SCALA_VERSION SOURCE3 SOURCE...
+  //
+  // The second form analyzes each source in turn, and writes its analysis to
+  // `OUTPUT_DIR/SOURCE.json`. A source which fails to parse does not fail the whole batch: its
+  // error is written to `OUTPUT_DIR/SOURCE.error` instead, so that only that source needs to be
+  // analyzed again individually.
+  def main(args: Array[String]): Unit = {
+    if (args(0) == "--output-dir") {
+      val outputDir = java.nio.file.Paths.get(args(1))
+      val scalaVersion = args(2)
+      val source3 = args(3).toBoolean
+      args.drop(4).foreach { pathStr =>
+        val outputPath = outputDir.resolve(pathStr + ".json")
+        java.nio.file.Files.createDirectories(outputPath.getParent)
+        scala.util.Try(analyze(pathStr, scalaVersion, source3)) match {
+          case scala.util.Success(analysis) => writeAnalysis(outputPath, analysis)
+          case scala.util.Failure(e) =>
+            java.nio.file.Files.write(
+              outputDir.resolve(pathStr + ".error"),
+              e.toString.getBytes("UTF-8")
+            )
+        }
+      }
+    } else {
+      val outputPath = java.nio.file.Paths.get(args(0))
+      val pathStr = args(1)
+      val scalaVersion = args(2)
+      val source3 = args(3).toBoolean
+      writeAnalysis(outputPath, analyze(pathStr, scalaVersion, source3))
+    }
+  }
 }
@@ -41,16 +41,19 @@ from pants.jvm.resolve.coursier_fetch import ToolClasspath, ToolClasspathRequest
 from pants.jvm.resolve.jvm_tool import GenerateJvmLockfileFromTool, JvmToolBase
 from pants.jvm.subsystems import JvmSubsystem
 from pants.jvm.target_types import JvmResolveField
+from pants.option.option_types import IntOption
 from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 from pants.util.ordered_set import FrozenOrderedSet
 from pants.util.resources import read_resource
+from pants.util.strutil import pluralize, softwrap
 
 logger = logging.getLogger(__name__)
 
 
 _PARSER_SCALA_VERSION = ScalaVersion.parse("2.13.8")
 _PARSER_SCALA_BINARY_VERSION = _PARSER_SCALA_VERSION.binary
+_SOURCE_PREFIX = "__source_to_analyze"
 
 
 class ScalaParser(JvmToolBase):
@@ -69,6 +72,22 @@ class ScalaParser(JvmToolBase):
         "scala_parser.lock",
     )
 
+    batch_size = IntOption(
+        default=128,
+        advanced=True,
+        help=softwrap(
+            """
+            The target number of Scala source files to analyze in each run of the parser when
+            analyzing all of the Scala sources in the repository, e.g. for `dependencies ::`.
+
+            Sources are batched by directory and resolve, and directories with more sources than
+            this are split into several batches. Larger batches amortize the startup cost of the
+            JVM over more files, but mean that more files are re-analyzed when any one file in the
+            batch changes.
+            """
+        ),
+    )
+
 
 @dataclass(frozen=True)
 class ScalaImport:
@@ -296,8 +315,105 @@ async def analyze_scala_source_dependencies(
         raise ValueError(
             "analyze_scala_source_dependencies expects sources with exactly 1 source file, but found none."
         )
-    source_prefix = "__source_to_analyze"
-    source_path = os.path.join(source_prefix, source_files.files[0])
+    analysis_output_path = "__source_analysis.json"
+    process_result = await _run_scala_parser(
+        jdk,
+        processor_classfiles,
+        tool,
+        source_files,
+        argv_prefix=[analysis_output_path, os.path.join(_SOURCE_PREFIX, source_files.files[0])],
+        argv_suffix=[str(request.scala_version), str(request.source3)],
+        output_files=(analysis_output_path,),
+        output_directories=(),
+        description=f"Analyzing {source_files.files[0]}",
+    )
+    return FallibleScalaSourceDependencyAnalysisResult(process_result=process_result)
+
+
+@dataclass(frozen=True)
+class ScalaSourceDependencyAnalysisBatch:
+    """The analysis of each of the files of an `AnalyzeScalaSourceRequest`, keyed by path.
+
+    Files which fail to parse are recorded in `failures`, along with their error, rather than
+    failing the whole batch. Callers should analyze those files individually, in order to surface
+    the error for the offending file. If the parser itself fails, no files are analyzed.
+    """
+
+    analyses: FrozenDict[str, ScalaSourceDependencyAnalysis]
+    failures: FrozenDict[str, str]
+
+
+@rule(level=LogLevel.DEBUG)
+async def analyze_scala_source_dependencies_batch(
+    jdk: InternalJdk,
+    processor_classfiles: ScalaParserCompiledClassfiles,
+    tool: ScalaParser,
+    request: AnalyzeScalaSourceRequest,
+) -> ScalaSourceDependencyAnalysisBatch:
+    source_files = request.source_files
+    if not source_files.files:
+        return ScalaSourceDependencyAnalysisBatch(FrozenDict(), FrozenDict())
+
+    analysis_output_dir = "__source_analysis"
+    process_result = await _run_scala_parser(
+        jdk,
+        processor_classfiles,
+        tool,
+        source_files,
+        argv_prefix=[
+            "--output-dir",
+            analysis_output_dir,
+            str(request.scala_version),
+            str(request.source3),
+        ],
+        argv_suffix=[os.path.join(_SOURCE_PREFIX, file) for file in source_files.files],
+        output_files=(),
+        output_directories=(analysis_output_dir,),
+        description=f"Analyzing {pluralize(len(source_files.files), 'Scala source')}",
+    )
+    if process_result.exit_code != 0:
+        logger.debug(
+            f"Failed to analyze {pluralize(len(source_files.files), 'Scala source')} in a batch, "
+            f"they will be analyzed individually:\n{process_result.stderr.decode()}"
+        )
+        return ScalaSourceDependencyAnalysisBatch(FrozenDict(), FrozenDict())
+
+    analysis_digest = await Get(
+        Digest,
+        RemovePrefix(
+            process_result.output_digest, os.path.join(analysis_output_dir, _SOURCE_PREFIX)
+        ),
+    )
+    analysis_contents = await Get(DigestContents, Digest, analysis_digest)
+    analyses = {}
+    failures = {}
+    for file_content in analysis_contents:
+        if file_content.path.endswith(".error"):
+            failures[file_content.path[: -len(".error")]] = file_content.content.decode()
+        else:
+            analyses[file_content.path[: -len(".json")]] = (
+                ScalaSourceDependencyAnalysis.from_json_dict(json.loads(file_content.content))
+            )
+    if failures:
+        logger.debug(
+            f"Failed to analyze {pluralize(len(failures), 'Scala source')} in a batch, they will "
+            f"be analyzed individually: {', '.join(sorted(failures))}"
+        )
+    return ScalaSourceDependencyAnalysisBatch(FrozenDict(analyses), FrozenDict(failures))
+
+
+async def _run_scala_parser(
+    jdk: InternalJdk,
+    processor_classfiles: ScalaParserCompiledClassfiles,
+    tool: ScalaParser,
+    source_files: SourceFiles,
+    *,
+    argv_prefix: list[str],
+    argv_suffix: list[str],
+    output_files: tuple[str, ...],
+    output_directories: tuple[str, ...],
+    description: str,
+) -> FallibleProcessResult:
     processorcp_relpath = "__processorcp"
     toolcp_relpath = "__toolcp"
 
@@ -306,7 +422,7 @@ async def analyze_scala_source_dependencies(
             ToolClasspath,
             ToolClasspathRequest(lockfile=GenerateJvmLockfileFromTool.create(tool)),
         ),
-        Get(Digest, AddPrefix(source_files.snapshot.digest, source_prefix)),
+        Get(Digest, AddPrefix(source_files.snapshot.digest, _SOURCE_PREFIX)),
     )
 
     extra_immutable_input_digests = {
@@ -314,9 +430,7 @@ async def analyze_scala_source_dependencies(
         processorcp_relpath: processor_classfiles.digest,
     }
 
-    analysis_output_path = "__source_analysis.json"
-
-    process_result = await Get(
+    return await Get(
         FallibleProcessResult,
         JvmProcess(
             jdk=jdk,
@@ -326,22 +440,19 @@ async def analyze_scala_source_dependencies(
             ],
             argv=[
                 "org.pantsbuild.backend.scala.dependency_inference.ScalaParser",
-                analysis_output_path,
-                source_path,
-                str(request.scala_version),
-                str(request.source3),
+                *argv_prefix,
+                *argv_suffix,
             ],
             input_digest=prefixed_source_files_digest,
             extra_immutable_input_digests=extra_immutable_input_digests,
-            output_files=(analysis_output_path,),
+            output_files=output_files,
+            output_directories=output_directories,
             extra_nailgun_keys=extra_immutable_input_digests,
-            description=f"Analyzing {source_files.files[0]}",
+            description=description,
             level=LogLevel.DEBUG,
         ),
     )
 
-    return FallibleScalaSourceDependencyAnalysisResult(process_result=process_result)
-
 
 @rule(level=LogLevel.DEBUG)
 async def resolve_fallible_result_to_analysis(
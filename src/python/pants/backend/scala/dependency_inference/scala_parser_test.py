@@ -11,6 +11,7 @@ from pants.backend.scala.dependency_inference.scala_parser import (
     ScalaImport,
     ScalaProvidedSymbol,
     ScalaSourceDependencyAnalysis,
+    ScalaSourceDependencyAnalysisBatch,
 )
 from pants.backend.scala.target_types import ScalaSourceField, ScalaSourceTarget
 from pants.backend.scala.util_rules import versions
@@ -41,6 +42,7 @@ def rule_runner() -> RuleRunner:
             *versions.rules(),
             QueryRule(AnalyzeScalaSourceRequest, (SourceFilesRequest,)),
             QueryRule(ScalaSourceDependencyAnalysis, (AnalyzeScalaSourceRequest,)),
+            QueryRule(ScalaSourceDependencyAnalysisBatch, (AnalyzeScalaSourceRequest,)),
         ],
         target_types=[ScalaSourceTarget],
     )
@@ -822,3 +824,38 @@ def test_applied_types_to_terms(rule_runner: RuleRunner) -> None:
         "foo.applied",
         "foo.bar",
     ]
+
+
+def test_parser_batch(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "BUILD": textwrap.dedent(
+                """\
+                scala_source(name="a", source="A.scala")
+                scala_source(name="b", source="B.scala")
+                scala_source(name="bad", source="Bad.scala")
+                """
+            ),
+            "A.scala": "package foo\nclass A extends B",
+            "B.scala": "package foo\nclass B",
+            "Bad.scala": "package foo\nclass Bad {",
+        }
+    )
+    targets = [
+        rule_runner.get_target(address=Address("", target_name=name))
+        for name in ("a", "b", "bad")
+    ]
+    request = rule_runner.request(
+        AnalyzeScalaSourceRequest,
+        [SourceFilesRequest([tgt[ScalaSourceField] for tgt in targets])],
+    )
+
+    batch = rule_runner.request(ScalaSourceDependencyAnalysisBatch, [request])
+    assert set(batch.analyses) == {"A.scala", "B.scala"}
+    assert [symbol.name for symbol in batch.analyses["A.scala"].provided_symbols] == ["foo.A"]
+    assert [symbol.name for symbol in batch.analyses["B.scala"].provided_symbols] == ["foo.B"]
+    assert "foo.B" in set(batch.analyses["A.scala"].fully_qualified_consumed_symbols())
+
+    # A file which fails to parse is recorded as a failure, without affecting the rest of its batch.
+    assert set(batch.failures) == {"Bad.scala"}
+    assert "ParseException" in batch.failures["Bad.scala"]
@@ -2,10 +2,17 @@
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 from __future__ import annotations
 
+import os
 from collections import defaultdict
+from dataclasses import dataclass
 from typing import Mapping
 
-from pants.backend.scala.dependency_inference.scala_parser import ScalaSourceDependencyAnalysis
+from pants.backend.scala.dependency_inference.scala_parser import (
+    AnalyzeScalaSourceRequest,
+    ScalaParser,
+    ScalaSourceDependencyAnalysis,
+    ScalaSourceDependencyAnalysisBatch,
+)
 from pants.backend.scala.target_types import ScalaSourceField
 from pants.core.util_rules.source_files import SourceFilesRequest
 from pants.engine.addresses import Address
@@ -22,6 +29,8 @@ from pants.jvm.dependency_inference.artifact_mapper import (
 from pants.jvm.dependency_inference.symbol_mapper import FirstPartyMappingRequest, SymbolMap
 from pants.jvm.subsystems import JvmSubsystem
 from pants.jvm.target_types import JvmResolveField
+from pants.util.collections import partition_sequentially
+from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 
 
@@ -40,6 +49,77 @@ def find_all_scala_targets(targets: AllTargets) -> AllScalaTargets:
     return AllScalaTargets(tgt for tgt in targets if tgt.has_field(ScalaSourceField))
 
 
+@dataclass(frozen=True)
+class ScalaSourceAnalysisBatches:
+    """All Scala sources in the project, partitioned by directory and resolve into batches of at
+    most `2 * [scala-parser].batch_size` sources to be analyzed together."""
+
+    batches: tuple[tuple[ScalaSourceField, ...], ...]
+    address_to_batch: FrozenDict[Address, int]
+
+
+@rule(desc="Partition Scala sources for analysis", level=LogLevel.DEBUG)
+def partition_scala_sources_for_analysis(
+    scala_targets: AllScalaTargets, jvm: JvmSubsystem, tool: ScalaParser
+) -> ScalaSourceAnalysisBatches:
+    # Sources in the same directory tend to be edited together, and all sources in a batch must
+    # share a resolve so that they are parsed for the same Scala version.
+    sources_by_directory: dict[tuple[str, str], list[ScalaSourceField]] = defaultdict(list)
+    for tgt in scala_targets:
+        source = tgt[ScalaSourceField]
+        key = (os.path.dirname(source.file_path), tgt[JvmResolveField].normalized_value(jvm))
+        sources_by_directory[key].append(source)
+
+    # Large directories are split at stable boundaries, so that an edit does not re-analyze all
+    # of their sources.
+    batches = tuple(
+        tuple(batch)
+        for _, sources in sorted(sources_by_directory.items())
+        for batch in partition_sequentially(
+            sources,
+            key=lambda source: source.file_path,
+            size_target=tool.batch_size,
+            size_max=2 * tool.batch_size,
+        )
+    )
+    return ScalaSourceAnalysisBatches(
+        batches,
+        FrozenDict((source.address, i) for i, batch in enumerate(batches) for source in batch),
+    )
+
+
+@dataclass(frozen=True)
+class BatchedScalaSourceDependencyAnalysisRequest:
+    """Analyze a Scala source as part of the batch of sources in its directory.
+
+    Each batch is analyzed in a single run of the parser, and the result is split back into the
+    analysis of each file.
+    """
+
+    source: ScalaSourceField
+
+
+@rule(level=LogLevel.DEBUG)
+async def analyze_scala_source_dependencies_in_batch(
+    request: BatchedScalaSourceDependencyAnalysisRequest, batches: ScalaSourceAnalysisBatches
+) -> ScalaSourceDependencyAnalysis:
+    batch_index = batches.address_to_batch.get(request.source.address)
+    if batch_index is not None:
+        analyze_request = await Get(
+            AnalyzeScalaSourceRequest, SourceFilesRequest(batches.batches[batch_index])
+        )
+        batch = await Get(
+            ScalaSourceDependencyAnalysisBatch, AnalyzeScalaSourceRequest, analyze_request
+        )
+        analysis = batch.analyses.get(request.source.file_path)
+        if analysis is not None:
+            return analysis
+
+    # Either the source is not owned by a Scala target, or it (or the parser) failed in its batch:
+    # analyze it individually, which will raise its error.
+    return await Get(ScalaSourceDependencyAnalysis, SourceFilesRequest([request.source]))
+
+
 SCALA_PACKAGE_OBJECT_NAMESPACE: SymbolNamespace = "package object"
 
 
@@ -61,7 +141,10 @@ async def map_first_party_scala_targets_to_symbols(
     jvm: JvmSubsystem,
 ) -> SymbolMap:
     source_analysis = await MultiGet(
-        Get(ScalaSourceDependencyAnalysis, SourceFilesRequest([target[ScalaSourceField]]))
+        Get(
+            ScalaSourceDependencyAnalysis,
+            BatchedScalaSourceDependencyAnalysisRequest(target[ScalaSourceField]),
+        )
         for target in scala_targets
     )
     address_and_analysis = zip(
@@ -6,17 +6,18 @@ from __future__ import annotations
 import json
 import logging
 import re
+import shlex
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import DefaultDict
+from typing import DefaultDict, Iterator
 
 from pants.backend.shell.lint.shellcheck.subsystem import Shellcheck
-from pants.backend.shell.subsystems.shell_setup import ShellSetup
+from pants.backend.shell.subsystems.shell_setup import ShellImportParser, ShellSetup
 from pants.backend.shell.target_types import ShellDependenciesField, ShellSourceField
 from pants.core.util_rules.external_tool import DownloadedExternalTool, ExternalToolRequest
 from pants.engine.addresses import Address
 from pants.engine.collection import DeduplicatedCollection
-from pants.engine.fs import Digest, MergeDigests
+from pants.engine.fs import Digest, DigestContents, MergeDigests
 from pants.engine.platform import Platform
 from pants.engine.process import FallibleProcessResult, Process, ProcessCacheScope
 from pants.engine.rules import Get, MultiGet, collect_rules, rule
@@ -91,11 +92,140 @@ class ParseShellImportsRequest:
 
 PATH_FROM_SHELLCHECK_ERROR = re.compile(r"Not following: (.+) was not specified as input")
 
+_SHELLCHECK_SOURCE_DIRECTIVE = re.compile(r"^\s*#\s*shellcheck\s.*?\bsource=(\S+)")
+_HEREDOC = re.compile(r"(?<!<)<<(?!<)(-?)\s*(['\"]?)([\w.-]+)\2")
+_ASSIGNMENT = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*=")
+_PUNCTUATION_CHARS = ";&|()<>"
+# Words after which the next word is still in command position.
+_COMMAND_PREFIXES = frozenset(
+    ("!", "{", "if", "then", "elif", "else", "while", "until", "do", "time", "command", "builtin")
+)
+
+
+def _source_statement_paths(line: str, directive_path: str | None) -> Iterator[str]:
+    lexer = shlex.shlex(line, posix=True, punctuation_chars=_PUNCTUATION_CHARS)
+    lexer.whitespace_split = True
+    # A `#` only starts a comment at the start of a word, which is handled below.
+    lexer.commenters = ""
+
+    command_position = True
+    expect_path = False
+    skip_word = False
+    try:
+        for token in lexer:
+            if all(char in _PUNCTUATION_CHARS for char in token):
+                if "<" in token or ">" in token:
+                    # The next word is the target of a redirection.
+                    skip_word = True
+                else:
+                    command_position = True
+                expect_path = False
+                continue
+            if skip_word:
+                skip_word = False
+                continue
+            if token.startswith("#"):
+                return
+            if expect_path:
+                path = directive_path or (
+                    token if not any(char in token for char in "$`~*?") else None
+                )
+                if path and path != "/dev/null":
+                    yield path
+                expect_path = False
+            elif command_position:
+                if token in ("source", "."):
+                    expect_path = True
+                    command_position = False
+                elif token not in _COMMAND_PREFIXES and not _ASSIGNMENT.match(token):
+                    command_position = False
+    except ValueError:
+        # An unterminated quote, which is only possible at the end of the file.
+        return
+
+
+def _open_quote(line: str, quote: str | None = None) -> str | None:
+    """The quote character of the string which is still open at the end of the line, if any.
+
+    `quote` is the quote character of a string which was already open at the start of the line.
+    """
+    escaped = False
+    at_word_start = quote is None
+    for char in line:
+        if escaped:
+            escaped = False
+            at_word_start = False
+            continue
+        if quote == "'":
+            if char == "'":
+                quote = None
+        elif char == "\\":
+            escaped = True
+        elif quote == '"':
+            if char == '"':
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char == "#" and at_word_start:
+            # The rest of the line is a comment.
+            break
+        at_word_start = quote is None and (char.isspace() or char in _PUNCTUATION_CHARS)
+    return quote
+
+
+def _scan_source_statements(content: str) -> set[str]:
+    """Find the paths of the `source` (or `.`) statements of a Shell file.
+
+    This mirrors the paths which Shellcheck reports as not followed: those which are constant, or
+    which are overridden by a `# shellcheck source=path` directive.
+    """
+    paths: set[str] = set()
+    lines = iter(content.replace("\\\n", "").splitlines())
+    directive_path: str | None = None
+    for line in lines:
+        directive = _SHELLCHECK_SOURCE_DIRECTIVE.match(line)
+        if directive:
+            directive_path = directive.group(1)
+            continue
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        # A quoted string may span multiple lines, none of which are then commands.
+        quote = _open_quote(line)
+        while quote is not None:
+            next_line = next(lines, None)
+            if next_line is None:
+                break
+            line = f"{line}\n{next_line}"
+            quote = _open_quote(next_line, quote)
+        paths.update(_source_statement_paths(line, directive_path))
+        directive_path = None
+        # Skip the bodies of any heredocs started on this line.
+        for strip_tabs, _, delimiter in _HEREDOC.findall(line):
+            for heredoc_line in lines:
+                if (heredoc_line.lstrip("\t") if strip_tabs else heredoc_line) == delimiter:
+                    break
+    return paths
+
 
 @rule
 async def parse_shell_imports(
-    request: ParseShellImportsRequest, shellcheck: Shellcheck, platform: Platform
+    request: ParseShellImportsRequest,
+    shellcheck: Shellcheck,
+    shell_setup: ShellSetup,
+    platform: Platform,
 ) -> ParsedShellImports:
+    if shell_setup.dependency_inference_parser == ShellImportParser.BUILTIN:
+        digest_contents = await Get(DigestContents, Digest, request.digest)
+        content = next(
+            (
+                file_content.content
+                for file_content in digest_contents
+                if file_content.path == request.fp
+            ),
+            b"",
+        )
+        return ParsedShellImports(_scan_source_statements(content.decode(errors="replace")))
+
     # We use Shellcheck to parse for us by running it against each file in isolation, which means
     # that all `source` statements will error. Then, we can extract the problematic paths from the
     # JSON output.
@@ -15,6 +15,7 @@ from pants.backend.shell.dependency_inference import (
     ShellDependenciesInferenceFieldSet,
     ShellMapping,
 )
+from pants.backend.shell.subsystems.shell_setup import ShellImportParser
 from pants.backend.shell.target_types import (
     ShellSourcesGeneratorTarget,
     Shunit2TestsGeneratorTarget,
@@ -73,7 +74,10 @@ def test_shell_mapping(rule_runner: RuleRunner) -> None:
     )
 
 
-def test_parse_imports(rule_runner: RuleRunner) -> None:
+@pytest.mark.parametrize("parser", ShellImportParser)
+def test_parse_imports(rule_runner: RuleRunner, parser: ShellImportParser) -> None:
+    rule_runner.set_options([f"--shell-setup-dependency-inference-parser={parser.value}"])
+
     def parse(content: str) -> set[str]:
         snapshot = rule_runner.make_snapshot({"subdir/f.sh": content})
         return set(
@@ -94,6 +98,16 @@ def test_parse_imports(rule_runner: RuleRunner) -> None:
     assert not parse("source ${FOO}")
     assert parse("# shellcheck source=a/b.sh\nsource ${FOO}") == {"a/b.sh"}
 
+    # Only `source` statements are imports, not mentions of them in other commands, strings,
+    # comments or heredocs.
+    assert not parse("echo source a.sh")
+    assert not parse("echo 'source a.sh'  # source b.sh")
+    assert parse("cat <<EOF\nsource a.sh\nEOF\nsource b.sh") == {"b.sh"}
+    assert parse("if [ -f a.sh ]; then\n  . a.sh 2>/dev/null\nfi") == {"a.sh"}
+    assert parse('echo "usage:\nsource a.sh\n"\nsource b.sh') == {"b.sh"}
+    assert parse("echo 'usage:\nsource a.sh'\nsource b.sh") == {"b.sh"}
+    assert parse("echo hi  # it's\nsource a.sh") == {"a.sh"}
+
 
 def test_dependency_inference(rule_runner: RuleRunner, caplog) -> None:
     rule_runner.write_files(
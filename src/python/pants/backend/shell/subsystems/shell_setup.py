@@ -3,12 +3,19 @@
 
 from __future__ import annotations
 
+from enum import Enum
+
 from pants.core.util_rules.search_paths import ExecutableSearchPathsOptionMixin
-from pants.option.option_types import BoolOption
+from pants.option.option_types import BoolOption, EnumOption
 from pants.option.subsystem import Subsystem
 from pants.util.strutil import softwrap
 
 
+class ShellImportParser(Enum):
+    BUILTIN = "builtin"
+    SHELLCHECK = "shellcheck"
+
+
 class ShellSetup(Subsystem):
     options_scope = "shell-setup"
     help = "Options for Pants's Shell support."
@@ -18,6 +25,22 @@ class ShellSetup(Subsystem):
         help="Infer Shell dependencies on other Shell files by analyzing `source` statements.",
         advanced=True,
     )
+    dependency_inference_parser = EnumOption(
+        default=ShellImportParser.SHELLCHECK,
+        help=softwrap(
+            """
+            How to find the `source` statements of Shell files for dependency inference.
+
+            `shellcheck` runs the Shellcheck binary once per file, and reads the paths which it
+            could not follow from its output. `builtin` scans files for `source` and `.`
+            statements in-process, which is much faster, but does not fully parse Shell syntax:
+            e.g. it does not recognize `source` statements within backtick command substitutions.
+
+            Both respect `# shellcheck source=path` directives.
+            """
+        ),
+        advanced=True,
+    )
     tailor_sources = BoolOption(
         default=True,
         help=softwrap("If true, add `shell_sources` targets with the `tailor` goal."),
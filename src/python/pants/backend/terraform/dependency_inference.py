@@ -2,6 +2,8 @@
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 from __future__ import annotations
 
+import json
+import logging
 from dataclasses import dataclass
 from pathlib import PurePath
 from typing import Iterable, Optional, Sequence
@@ -22,12 +24,13 @@ from pants.base.glob_match_error_behavior import GlobMatchErrorBehavior
 from pants.base.specs import DirGlobSpec, DirLiteralSpec, RawSpecs
 from pants.core.target_types import LockfileTarget
 from pants.engine.addresses import Addresses
-from pants.engine.fs import CreateDigest, Digest, FileContent
+from pants.engine.fs import CreateDigest, Digest, FileContent, MergeDigests
 from pants.engine.internals.native_engine import Address, AddressInput
 from pants.engine.internals.selectors import Get, MultiGet
-from pants.engine.process import Process, ProcessResult
+from pants.engine.process import FallibleProcessResult, Process, ProcessResult
 from pants.engine.rules import collect_rules, rule
 from pants.engine.target import (
+    AllTargets,
     DependenciesRequest,
     ExplicitlyProvidedDependencies,
     FieldSet,
@@ -39,11 +42,16 @@ from pants.engine.target import (
     Targets,
 )
 from pants.engine.unions import UnionRule
+from pants.option.option_types import IntOption
+from pants.util.collections import partition_sequentially
 from pants.util.dirutil import group_by_dir
+from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 from pants.util.ordered_set import OrderedSet
 from pants.util.resources import read_resource
-from pants.util.strutil import bullet_list, softwrap
+from pants.util.strutil import bullet_list, pluralize, softwrap
+
+logger = logging.getLogger(__name__)
 
 
 class TerraformHcl2Parser(PythonToolRequirementsBase):
@@ -57,6 +65,26 @@ class TerraformHcl2Parser(PythonToolRequirementsBase):
 
     default_lockfile_resource = ("pants.backend.terraform", "hcl2.lock")
 
+    batch_size = IntOption(
+        default=0,
+        advanced=True,
+        help=softwrap(
+            """
+            If greater than 0, the target number of `terraform_module` targets to parse in each
+            run of the parser when inferring dependencies. If 0, each module is parsed by its own
+            run of the parser.
+
+            Batches are made from all of the `terraform_module` targets in the repository, so
+            enabling batching means that every BUILD file is loaded even when only a few modules
+            are needed. It is only worthwhile for goals which cover most of the repository (e.g.
+            `dependencies ::`), where larger batches amortize the startup cost of the parser over
+            more modules, at the cost of re-parsing more modules when any one module in the batch
+            changes. Batches are created at stable boundaries, so adding or removing a module only
+            affects one batch.
+            """
+        ),
+    )
+
 
 @dataclass(frozen=True)
 class ParserSetup:
@@ -109,6 +137,107 @@ async def setup_process_for_parse_terraform_module_sources(
     return process
 
 
+class AllTerraformModuleTargets(Targets):
+    pass
+
+
+@rule(desc="Find all Terraform module targets in project", level=LogLevel.DEBUG)
+def find_all_terraform_module_targets(targets: AllTargets) -> AllTerraformModuleTargets:
+    return AllTerraformModuleTargets(
+        tgt for tgt in targets if tgt.has_field(TerraformModuleSourcesField)
+    )
+
+
+@dataclass(frozen=True)
+class TerraformModuleSourcesBatches:
+    """All Terraform modules in the project, partitioned into batches to be parsed together."""
+
+    batches: tuple[tuple[TerraformModuleSourcesField, ...], ...]
+    address_to_batch: FrozenDict[Address, int]
+
+
+@rule(desc="Partition Terraform modules for parsing", level=LogLevel.DEBUG)
+def partition_terraform_modules_for_parsing(
+    module_targets: AllTerraformModuleTargets, hcl2_parser: TerraformHcl2Parser
+) -> TerraformModuleSourcesBatches:
+    batches = tuple(
+        tuple(tgt[TerraformModuleSourcesField] for tgt in batch)
+        for batch in partition_sequentially(
+            module_targets,
+            key=lambda tgt: tgt.address.spec,
+            size_target=hcl2_parser.batch_size,
+            size_max=2 * hcl2_parser.batch_size,
+        )
+    )
+    return TerraformModuleSourcesBatches(
+        batches,
+        FrozenDict((sources.address, i) for i, batch in enumerate(batches) for sources in batch),
+    )
+
+
+@dataclass(frozen=True)
+class ParseTerraformModuleSourcesBatch:
+    """Parse the sources of several `terraform_module` targets in a single run of the parser."""
+
+    sources: tuple[TerraformModuleSourcesField, ...]
+
+
+@dataclass(frozen=True)
+class TerraformModuleSourcesBatchResult:
+    """The module source paths referenced by each parsed `.tf` file, keyed by file path.
+
+    Files which could not be parsed are omitted.
+    """
+
+    module_paths: FrozenDict[str, tuple[str, ...]]
+
+
+@rule
+async def parse_terraform_module_sources_batch(
+    request: ParseTerraformModuleSourcesBatch, parser: ParserSetup
+) -> TerraformModuleSourcesBatchResult:
+    all_hydrated_sources = await MultiGet(
+        Get(HydratedSources, HydrateSourcesRequest(sources)) for sources in request.sources
+    )
+    sources_digest = await Get(
+        Digest, MergeDigests(hydrated.snapshot.digest for hydrated in all_hydrated_sources)
+    )
+    paths = sorted(
+        {
+            filename
+            for hydrated in all_hydrated_sources
+            for filename in hydrated.snapshot.files
+            if filename.endswith(".tf")
+        }
+    )
+    if not paths:
+        return TerraformModuleSourcesBatchResult(FrozenDict())
+
+    process_result = await Get(
+        FallibleProcessResult,
+        VenvPexProcess(
+            parser.pex,
+            argv=("--json", *paths),
+            input_digest=sources_digest,
+            description=f"Parse Terraform module sources: {pluralize(len(request.sources), 'module')}",
+            level=LogLevel.DEBUG,
+        ),
+    )
+    if process_result.exit_code != 0:
+        logger.debug(
+            f"Failed to parse {pluralize(len(request.sources), 'Terraform module')} in a batch, "
+            f"they will be parsed individually:\n{process_result.stderr.decode()}"
+        )
+        return TerraformModuleSourcesBatchResult(FrozenDict())
+
+    return TerraformModuleSourcesBatchResult(
+        FrozenDict(
+            (path, tuple(module_paths))
+            for path, module_paths in json.loads(process_result.stdout).items()
+        )
+    )
+
+
 @dataclass(frozen=True)
 class TerraformModuleDependenciesInferenceFieldSet(FieldSet):
     required_fields = (TerraformModuleSourcesField, TerraformDependenciesField)
@@ -227,14 +356,33 @@ def identify_terraform_backend_and_vars(
     return TerraformDeploymentInvocationFiles(backend_targets, vars_targets, lockfile)
 
 
-async def _infer_dependencies_from_sources(
-    request: InferTerraformModuleDependenciesRequest,
-) -> list[Address]:
-    """Parse the source code for references to other modules."""
+async def _parse_module_source_paths(
+    request: InferTerraformModuleDependenciesRequest, hcl2_parser: TerraformHcl2Parser
+) -> list[str]:
+    """Parse the source code of a module for the paths of the modules that it references.
+
+    If batching is enabled, the module is parsed as part of its batch where possible, and
+    individually otherwise, e.g. if another module in its batch cannot be parsed.
+    """
     hydrated_sources = await Get(HydratedSources, HydrateSourcesRequest(request.field_set.sources))
     paths = OrderedSet(
         filename for filename in hydrated_sources.snapshot.files if filename.endswith(".tf")
     )
+
+    batch_index = None
+    if hcl2_parser.batch_size > 0:
+        batches = await Get(TerraformModuleSourcesBatches)
+        batch_index = batches.address_to_batch.get(request.field_set.address)
+    if batch_index is not None:
+        batch_result = await Get(
+            TerraformModuleSourcesBatchResult,
+            ParseTerraformModuleSourcesBatch(batches.batches[batch_index]),
+        )
+        if all(path in batch_result.module_paths for path in paths):
+            return sorted(
+                {module_path for path in paths for module_path in batch_result.module_paths[path]}
+            )
+
     result = await Get(
         ProcessResult,
         ParseTerraformModuleSources(
@@ -242,7 +390,14 @@ async def _infer_dependencies_from_sources(
             paths=tuple(paths),
         ),
     )
-    candidate_spec_paths = [line for line in result.stdout.decode("utf-8").split("\n") if line]
+    return [line for line in result.stdout.decode("utf-8").split("\n") if line]
+
+
+async def _infer_dependencies_from_sources(
+    request: InferTerraformModuleDependenciesRequest, hcl2_parser: TerraformHcl2Parser
+) -> list[Address]:
+    """Parse the source code for references to other modules."""
+    candidate_spec_paths = await _parse_module_source_paths(request, hcl2_parser)
     # For each path, see if there is a `terraform_module` target at the specified spec_path.
     candidate_targets = await Get(
         Targets,
@@ -279,9 +434,9 @@ async def _infer_lockfile(request: InferTerraformModuleDependenciesRequest) -> l
 
 @rule
 async def infer_terraform_module_dependencies(
-    request: InferTerraformModuleDependenciesRequest,
+    request: InferTerraformModuleDependenciesRequest, hcl2_parser: TerraformHcl2Parser
 ) -> InferredDependencies:
-    terraform_module_addresses = await _infer_dependencies_from_sources(request)
+    terraform_module_addresses = await _infer_dependencies_from_sources(request, hcl2_parser)
     lockfile_address = await _infer_lockfile(request)
 
     return InferredDependencies([*terraform_module_addresses, *lockfile_address])
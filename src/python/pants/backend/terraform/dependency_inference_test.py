@@ -9,9 +9,11 @@ from pants.backend.terraform.dependency_inference import (
     InferTerraformDeploymentDependenciesRequest,
     InferTerraformModuleDependenciesRequest,
     ParseTerraformModuleSources,
+    ParseTerraformModuleSourcesBatch,
     TerraformDeploymentDependenciesInferenceFieldSet,
     TerraformHcl2Parser,
     TerraformModuleDependenciesInferenceFieldSet,
+    TerraformModuleSourcesBatchResult,
 )
 from pants.backend.terraform.goals.lockfiles import rules as terraform_lockfile_rules
 from pants.backend.terraform.target_types import (
@@ -56,6 +58,7 @@ def rule_runner() -> RuleRunner:
             QueryRule(InferredDependencies, [InferTerraformDeploymentDependenciesRequest]),
             QueryRule(HydratedSources, [HydrateSourcesRequest]),
             QueryRule(ProcessResult, [ParseTerraformModuleSources]),
+            QueryRule(TerraformModuleSourcesBatchResult, [ParseTerraformModuleSourcesBatch]),
         ],
     )
     rule_runner.set_options(
@@ -65,7 +68,15 @@ def rule_runner() -> RuleRunner:
     return rule_runner
 
 
-def test_dependency_inference_module(rule_runner: RuleRunner) -> None:
+@pytest.mark.parametrize("batch_size", [0, 2])
+def test_dependency_inference_module(rule_runner: RuleRunner, batch_size: int) -> None:
+    rule_runner.set_options(
+        [
+            "--backend-packages=pants.backend.experimental.terraform",
+            f"--terraform-hcl2-parser-batch-size={batch_size}",
+        ],
+        env_inherit={"PATH", "PYENV_ROOT", "HOME"},
+    )
     rule_runner.write_files(
         {
             "src/tf/modules/foo/BUILD": "terraform_module()\n",
@@ -244,6 +255,29 @@ def test_hcl_parser_wrapper_runs(rule_runner: RuleRunner, major_minor_interprete
     assert lines == {"grok", "foo/hello/world"}
 
 
+def test_parse_module_sources_batch(rule_runner: RuleRunner) -> None:
+    rule_runner.write_files(
+        {
+            "foo/BUILD": "terraform_module()\n",
+            "foo/main.tf": 'module "bar" {\n  source = "../bar"\n}\n',
+            "foo/other.tf": 'module "baz" {\n  source = "./baz"\n}\n',
+            "bar/BUILD": "terraform_module()\n",
+            "bar/main.tf": 'resource "null_resource" "dep" {}\n',
+        }
+    )
+    sources = tuple(
+        rule_runner.get_target(Address(spec_path))[SourcesField] for spec_path in ("foo", "bar")
+    )
+    result = rule_runner.request(
+        TerraformModuleSourcesBatchResult, [ParseTerraformModuleSourcesBatch(sources)]
+    )
+    assert dict(result.module_paths) == {
+        "foo/main.tf": ("bar",),
+        "foo/other.tf": ("foo/baz",),
+        "bar/main.tf": (),
+    }
+
+
 def test_generate_lockfile_without_python_backend() -> None:
     """Regression test for https://github.com/pantsbuild/pants/issues/14876."""
     run_pants(
@@ -1,6 +1,7 @@
 # Copyright 2021 Pants project contributors (see CONTRIBUTORS.md).
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
+import json
 import sys
 from pathlib import PurePath
 from typing import Set
@@ -57,6 +58,22 @@ def extract_module_source_paths(path: PurePath, raw_content: bytes) -> Set[str]:
 
 
 def main(args):
+    # With `--json`, parse each file independently, and print a JSON object mapping each file that
+    # could be parsed to the module source paths that it references.
+    if args and args[0] == "--json":
+        paths_by_file = {}
+        for filename in args[1:]:
+            try:
+                with open(filename, "rb") as f:
+                    content = f.read()
+                paths_by_file[filename] = sorted(
+                    extract_module_source_paths(PurePath(filename).parent, content)
+                )
+            except Exception as e:
+                print(f"Failed to parse {filename}: {e}", file=sys.stderr)
+        print(json.dumps(paths_by_file))
+        return
+
     paths = set()
     for filename in args:
         with open(filename, "rb") as f:
@@ -1,8 +1,13 @@
 # Copyright 2023 Pants project contributors (see CONTRIBUTORS.md).
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
+import gzip
 import json
 import logging
-from typing import Any, Dict, Tuple
+import os
+import struct
+import zlib
+from enum import Enum
+from typing import IO, Any, Dict, Iterable, List, Mapping, Optional, Tuple
 
 from pants.engine.internals.scheduler import Workunit
 from pants.engine.rules import collect_rules, rule
@@ -13,34 +18,123 @@ from pants.engine.streaming_workunit_handler import (
     WorkunitsCallbackFactoryRequest,
 )
 from pants.engine.unions import UnionRule
-from pants.option.option_types import BoolOption, StrOption
+from pants.option.option_types import (
+    BoolOption,
+    DictOption,
+    EnumOption,
+    MemorySizeOption,
+    StrOption,
+)
 from pants.option.subsystem import Subsystem
-from pants.util.dirutil import safe_open
+from pants.util.dirutil import safe_mkdir_for, safe_open
+from pants.util.strutil import softwrap
 
 logger = logging.getLogger(__name__)
 
+_DUMPED_KEYS = (
+    "name",
+    "span_id",
+    "level",
+    "parent_id",
+    "start_secs",
+    "start_nanos",
+    "description",
+    "duration_secs",
+    "duration_nanos",
+    "metadata",
+)
+
+# Workunits are written in many small records, so buffer them well beyond the default 8KiB.
+_BUFFER_SIZE = 1024 * 1024
+
+
+def dump_workunit(wu: Mapping[str, Any]) -> Dict[str, Any]:
+    return {k: v for k, v in wu.items() if k in _DUMPED_KEYS}
+
 
 def just_dump_map(workunits_map):
-    return [
-        {
-            k: v
-            for k, v in wu.items()
-            if k
-            in (
-                "name",
-                "span_id",
-                "level",
-                "parent_id",
-                "start_secs",
-                "start_nanos",
-                "description",
-                "duration_secs",
-                "duration_nanos",
-                "metadata",
-            )
-        }
-        for wu in workunits_map.values()
-    ]
+    return [dump_workunit(wu) for wu in workunits_map.values()]
+
+
+class WorkunitLogFormat(Enum):
+    json = "json"
+    ndjson = "ndjson"
+    binary = "binary"
+
+
+class StreamingWorkunitWriter:
+    """Appends workunits to a log file as they complete.
+
+    Each workunit is written as a JSON document: for `ndjson` on its own line, and for `binary`
+    prefixed by its length in bytes as a big-endian 32-bit unsigned integer. The file is flushed
+    after each batch of workunits, so that the log of a run which crashes is preserved up to the
+    last batch.
+
+    When the file reaches `max_size` bytes on disk, it is rolled over to `rolled_path`, replacing
+    any file rolled over before, so that the log takes up at most about twice `max_size`.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        rolled_path: str,
+        log_format: WorkunitLogFormat,
+        *,
+        compress: bool = False,
+        max_size: Optional[int] = None,
+    ) -> None:
+        assert log_format != WorkunitLogFormat.json
+        self._path = path
+        self._rolled_path = rolled_path
+        self._format = log_format
+        self._compress = compress
+        self._max_size = max_size
+        self._raw: Optional[IO[bytes]] = None
+        self._file: Optional[IO[bytes]] = None
+
+    def _open(self) -> IO[bytes]:
+        safe_mkdir_for(self._path)
+        self._raw = open(self._path, "wb", buffering=_BUFFER_SIZE)
+        self._file = gzip.GzipFile(fileobj=self._raw, mode="wb") if self._compress else self._raw
+        return self._file
+
+    def write(self, workunits: Iterable[Mapping[str, Any]]) -> None:
+        f = self._file or self._open()
+        for wu in workunits:
+            record = json.dumps(dump_workunit(wu)).encode()
+            if self._format == WorkunitLogFormat.binary:
+                f.write(struct.pack(">I", len(record)))
+                f.write(record)
+            else:
+                f.write(record)
+                f.write(b"\n")
+        f.flush()
+        assert self._raw is not None
+        if self._max_size and self._raw.tell() >= self._max_size:
+            self.close()
+            os.replace(self._path, self._rolled_path)
+            self._open()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        if self._raw is not None:
+            # NB: A GzipFile does not close the file object it was given.
+            self._raw.close()
+        self._file = self._raw = None
+
+
+def is_sampled(wu: Mapping[str, Any], sample_rates: Mapping[str, float]) -> bool:
+    """Whether to log the workunit, given the fraction of workunits to log per level.
+
+    Workunits are sampled by their span id, so the decision is stable for a given workunit.
+    """
+    rate = sample_rates.get(str(wu.get("level", "")).lower(), 1.0)
+    if rate >= 1.0:
+        return True
+    if rate <= 0.0:
+        return False
+    return zlib.crc32(str(wu["span_id"]).encode()) < rate * 2**32
 
 
 class WorkunitLoggerCallback(WorkunitsCallback):
@@ -49,11 +143,20 @@ class WorkunitLoggerCallback(WorkunitsCallback):
     def __init__(self, wulogger: "WorkunitLogger"):
         self.wulogger = wulogger
         self._completed_workunits: Dict[str, object] = {}
+        self._writer: Optional[StreamingWorkunitWriter] = None
 
     @property
     def can_finish_async(self) -> bool:
         return False
 
+    def _filepath(self, context: StreamingWorkunitContext, rolled: bool = False) -> str:
+        suffix = ".1" if rolled else ""
+        extension = ".gz" if self.wulogger.compress else ""
+        return (
+            f"{self.wulogger.logdir}/{context.run_tracker.run_id}{suffix}"
+            f".{self.wulogger.format.value}{extension}"
+        )
+
     def __call__(
         self,
         *,
@@ -63,13 +166,42 @@ class WorkunitLoggerCallback(WorkunitsCallback):
         finished: bool = False,
         **kwargs: Any,
     ) -> None:
-        for wu in completed_workunits:
+        sample_rates = self.wulogger.sample_rates
+        workunits: List[Workunit] = [
+            wu for wu in completed_workunits if not sample_rates or is_sampled(wu, sample_rates)
+        ]
+        if self.wulogger.format == WorkunitLogFormat.json:
+            self._write_json(workunits, context, finished)
+            return
+
+        if self._writer is None:
+            self._writer = StreamingWorkunitWriter(
+                self._filepath(context),
+                self._filepath(context, rolled=True),
+                self.wulogger.format,
+                compress=self.wulogger.compress,
+                max_size=self.wulogger.max_log_size,
+            )
+        self._writer.write(workunits)
+        if finished:
+            self._writer.close()
+            logger.info(f"Wrote log to {self._filepath(context)}")
+
+    def _write_json(
+        self, workunits: List[Workunit], context: StreamingWorkunitContext, finished: bool
+    ) -> None:
+        for wu in workunits:
             self._completed_workunits[wu["span_id"]] = wu
         if finished:
-            filepath = f"{self.wulogger.logdir}/{context.run_tracker.run_id}.json"
-            with safe_open(filepath, "w") as f:
-                json.dump(just_dump_map(self._completed_workunits), f)
-                logger.info(f"Wrote log to {filepath}")
+            filepath = self._filepath(context)
+            if self.wulogger.compress:
+                safe_mkdir_for(filepath)
+                with gzip.open(filepath, "wt") as f:
+                    json.dump(just_dump_map(self._completed_workunits), f)
+            else:
+                with safe_open(filepath, "w") as f:
+                    json.dump(just_dump_map(self._completed_workunits), f)
+            logger.info(f"Wrote log to {filepath}")
 
 
 class WorkunitLoggerCallbackFactoryRequest:
@@ -82,6 +214,43 @@ class WorkunitLogger(Subsystem):
 
     enabled = BoolOption("--enabled", default=False, help="Whether to enable workunit logging.")
     logdir = StrOption("--logdir", default=".pants.d", help="Where to write the log to.")
+    format = EnumOption(
+        default=WorkunitLogFormat.json,
+        help=softwrap(
+            """
+            The format of the log.
+
+            * `json`: A single JSON list, written when the run finishes. All workunits are held in
+              memory until then.
+            * `ndjson`: One JSON object per line, written as workunits complete.
+            * `binary`: JSON objects, each prefixed by its length in bytes as a big-endian 32-bit
+              unsigned integer, written as workunits complete.
+            """
+        ),
+    )
+    compress = BoolOption(default=False, help="Whether to gzip the log.")
+    sample_rates = DictOption[float](
+        help=softwrap(
+            """
+            The fraction of workunits to log, by level, e.g. `{"trace": 0, "debug": 0.1}`.
+
+            Workunits of levels which are not listed are all logged. Sampled workunits may refer
+            to parents which were not.
+            """
+        ),
+    )
+    max_log_size = MemorySizeOption(
+        default=None,
+        help=softwrap(
+            """
+            The size at which the log is rolled over, for the `ndjson` and `binary` formats.
+
+            The log is renamed to `<run_id>.1.<format>`, replacing any log rolled over before, so
+            that the logs of a run take up at most about twice this size. By default, the log is
+            not rolled over.
+            """
+        ),
+    )
 
 
 @rule
@@ -0,0 +1,94 @@
+# Copyright 2025 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import gzip
+import json
+import struct
+import zlib
+from pathlib import Path
+
+import pytest
+
+from pants.backend.tools.workunit_logger.rules import (
+    StreamingWorkunitWriter,
+    WorkunitLogFormat,
+    is_sampled,
+)
+
+
+def workunit(span_id: str, level: str = "INFO") -> dict:
+    return {"name": "wu", "span_id": span_id, "level": level, "artifacts": {"ignored": 1}}
+
+
+def read_gzip(data: bytes) -> bytes:
+    # NB: Unlike `gzip.decompress`, this reads the log of a run which has not finished.
+    return zlib.decompressobj(wbits=16 + zlib.MAX_WBITS).decompress(data)
+
+
+def read_binary(data: bytes) -> list[dict]:
+    records = []
+    while data:
+        (length,) = struct.unpack(">I", data[:4])
+        records.append(json.loads(data[4 : 4 + length]))
+        data = data[4 + length :]
+    return records
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_streaming_writer(tmp_path: Path, compress: bool) -> None:
+    path = tmp_path / "logs" / "run.ndjson"
+    writer = StreamingWorkunitWriter(
+        str(path), str(tmp_path / "run.1.ndjson"), WorkunitLogFormat.ndjson, compress=compress
+    )
+    writer.write([workunit("1"), workunit("2")])
+    # Each batch is flushed, so that it is not lost if the run crashes.
+    read = read_gzip if compress else bytes
+    assert len(read(path.read_bytes()).splitlines()) == 2
+    writer.write([workunit("3")])
+    writer.close()
+
+    if compress:
+        # Once closed, the log is a complete gzip file.
+        gzip.decompress(path.read_bytes())
+    lines = read(path.read_bytes()).splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"name": "wu", "span_id": span_id, "level": "INFO"} for span_id in ("1", "2", "3")
+    ]
+
+
+def test_streaming_writer_binary(tmp_path: Path) -> None:
+    path = tmp_path / "run.binary"
+    writer = StreamingWorkunitWriter(
+        str(path), str(tmp_path / "run.1.binary"), WorkunitLogFormat.binary
+    )
+    writer.write([workunit("1"), workunit("2")])
+    writer.close()
+    assert [record["span_id"] for record in read_binary(path.read_bytes())] == ["1", "2"]
+
+
+def test_streaming_writer_rolls_over(tmp_path: Path) -> None:
+    path, rolled_path = tmp_path / "run.binary", tmp_path / "run.1.binary"
+    writer = StreamingWorkunitWriter(
+        str(path), str(rolled_path), WorkunitLogFormat.binary, max_size=100
+    )
+    for i in range(9):
+        writer.write([workunit(str(i))])
+    writer.close()
+
+    rolled = [record["span_id"] for record in read_binary(rolled_path.read_bytes())]
+    current = [record["span_id"] for record in read_binary(path.read_bytes())]
+    assert rolled and current
+    assert rolled + current == [str(i) for i in range(9 - len(rolled) - len(current), 9)]
+    assert rolled_path.stat().st_size < 200
+
+
+def test_is_sampled() -> None:
+    assert is_sampled(workunit("1"), {})
+    assert not is_sampled(workunit("1", "TRACE"), {"trace": 0})
+    assert is_sampled(workunit("1", "INFO"), {"trace": 0})
+
+    sampled = [is_sampled(workunit(str(i), "DEBUG"), {"debug": 0.25}) for i in range(1000)]
+    assert 150 < sum(sampled) < 350
+    assert sampled == [is_sampled(workunit(str(i), "DEBUG"), {"debug": 0.25}) for i in range(1000)]
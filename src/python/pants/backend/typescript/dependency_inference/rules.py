@@ -11,7 +11,7 @@ from pants.backend.javascript import package_json
 from pants.backend.javascript.dependency_inference.rules import (
     InferNodePackageDependenciesRequest,
     RequestNodePackagesCandidateMap,
-    _determine_import_from_candidates,
+    _determine_imports_from_candidates,
     _handle_unowned_imports,
     _is_node_builtin_module,
     map_candidate_node_packages,
@@ -79,7 +79,7 @@ def _create_inference_metadata(
 
 async def _prepare_inference_metadata(address: Address, file_path: str) -> InferenceMetadata:
     owning_pkg, maybe_config = await concurrently(
-        find_owning_package(OwningNodePackageRequest(address)),
+        find_owning_package(OwningNodePackageRequest(address), **implicitly()),
         find_parent_ts_config(ParentTSConfigRequest(file_path, "tsconfig.json"), **implicitly()),
     )
 
@@ -121,18 +121,10 @@ async def infer_typescript_source_dependencies(
         ),
     )
 
-    imports = dict(
-        zip(
-            import_strings.imports,
-            await concurrently(
-                _determine_import_from_candidates(
-                    candidates,
-                    candidate_pkgs,
-                    file_extensions=TS_FILE_EXTENSIONS + JS_FILE_EXTENSIONS,
-                )
-                for string, candidates in import_strings.imports.items()
-            ),
-        )
+    imports = await _determine_imports_from_candidates(
+        import_strings.imports,
+        candidate_pkgs,
+        file_extensions=TS_FILE_EXTENSIONS + JS_FILE_EXTENSIONS,
     )
     _handle_unowned_imports(
         request.field_set.address,
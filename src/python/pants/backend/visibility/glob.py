@@ -157,6 +157,36 @@ RULE_REGEXP = "|".join(
 )
 
 
+@dataclass(frozen=True)
+class TargetMatchProperties:
+    """The properties of a target that a `TargetGlob` may match against.
+
+    Matching against these rather than the target's `Address` and `TargetAdaptor` allows the
+    results of matching to be memoized across all targets with the same properties.
+    """
+
+    type_alias: str
+    name: str
+    path: str
+    # None if the target has no valid `tags`.
+    tags: tuple[str, ...] | None
+
+    @classmethod
+    def create(cls, address: Address, adaptor: TargetAdaptor) -> TargetMatchProperties:
+        # Use adaptor.kwargs with caution, unvalidated input data from BUILD file.
+        target_tags = adaptor.kwargs.get("tags")
+        return cls(
+            type_alias=adaptor.type_alias,
+            name=address.target_name,
+            path=TargetGlob.address_path(address),
+            tags=(
+                tuple(str(tag) for tag in target_tags)
+                if isinstance(target_tags, Sequence) and not isinstance(target_tags, str)
+                else None
+            ),
+        )
+
+
 @dataclass(frozen=True)
 class TargetGlob:
     type_: Glob | None
@@ -282,27 +312,28 @@ class TargetGlob:
             return address.spec_path
 
     def match(self, address: Address, adaptor: TargetAdaptor, base: str) -> bool:
+        return self.match_properties(TargetMatchProperties.create(address, adaptor), base)
+
+    def match_properties(self, target: TargetMatchProperties, base: str) -> bool:
         if not (self.type_ or self.name or self.path or self.tags):
             # Nothing rules this target in.
             return False
 
         # target type
-        if self.type_ and not self.type_.match(adaptor.type_alias):
+        if self.type_ and not self.type_.match(target.type_alias):
             return False
         # target name
-        if self.name and not self.name.match(address.target_name):
+        if self.name and not self.name.match(target.name):
             return False
         # target path (includes filename for source targets)
-        if self.path and not self.path.match(self.address_path(address), base):
+        if self.path and not self.path.match(target.path, base):
             return False
         # target tags
         if self.tags:
-            # Use adaptor.kwargs with caution, unvalidated input data from BUILD file.
-            target_tags = adaptor.kwargs.get("tags")
-            if not isinstance(target_tags, Sequence) or isinstance(target_tags, str):
+            if target.tags is None:
                 # Bad tags value
                 return False
-            if not all(any(glob.match(str(tag)) for tag in target_tags) for glob in self.tags):
+            if not all(any(glob.match(tag) for tag in target.tags) for glob in self.tags):
                 return False
 
         # Nothing rules this target out.
@@ -2,6 +2,7 @@
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 from __future__ import annotations
 
+import functools
 import itertools
 import logging
 import os.path
@@ -10,7 +11,7 @@ from pathlib import PurePath
 from pprint import pformat
 from typing import Any, Iterable, Iterator, Sequence, cast
 
-from pants.backend.visibility.glob import TargetGlob
+from pants.backend.visibility.glob import TargetGlob, TargetMatchProperties
 from pants.engine.addresses import Address
 from pants.engine.internals.dep_rules import (
     BuildFileDependencyRules,
@@ -24,6 +25,11 @@ from pants.util.strutil import softwrap
 
 logger = logging.getLogger(__name__)
 
+# The max number of memoized rule set and rule lookups. Lookups are memoized per distinct target
+# properties and declaring path rather than per dependency edge, so this bounds the memory used
+# when checking very large numbers of edges while still covering typical repositories.
+_MATCH_CACHE_SIZE = 2**16
+
 
 class BuildFileVisibilityRulesError(DependencyRulesError):
     @classmethod
@@ -125,8 +131,12 @@ class VisibilityRuleSet:
     build_file: str
     selectors: tuple[TargetGlob, ...]
     rules: tuple[VisibilityRule, ...]
+    # Rule sets are used as memoization keys for every dependency edge checked, so their hash is
+    # computed once.
+    _hash: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
+        object.__setattr__(self, "_hash", hash((self.build_file, self.selectors, self.rules)))
         if all("!*" == str(selector) for selector in self.selectors):
             rules = tuple(map(str, self.rules))
             raise BuildFileVisibilityRulesError(
@@ -181,14 +191,43 @@ class VisibilityRuleSet:
     def _noop_rule(rule: str | dict) -> bool:
         return not rule or isinstance(rule, str) and rule.startswith("#")
 
+    def __hash__(self) -> int:
+        return self._hash
+
     def match(self, address: Address, adaptor: TargetAdaptor, relpath: str) -> bool:
-        return any(selector.match(address, adaptor, relpath) for selector in self.selectors)
+        return self.match_properties(TargetMatchProperties.create(address, adaptor), relpath)
+
+    def match_properties(self, target: TargetMatchProperties, relpath: str) -> bool:
+        return any(selector.match_properties(target, relpath) for selector in self.selectors)
+
+    def get_rule(
+        self, address: Address, adaptor: TargetAdaptor, relpath: str
+    ) -> VisibilityRule | None:
+        """Get the first rule of this rule set that matches the target, if any."""
+        return _get_rule(self, TargetMatchProperties.create(address, adaptor), relpath)
+
+
+@functools.lru_cache(maxsize=_MATCH_CACHE_SIZE)
+def _get_rule(
+    ruleset: VisibilityRuleSet, target: TargetMatchProperties, relpath: str
+) -> VisibilityRule | None:
+    for visibility_rule in ruleset.rules:
+        if visibility_rule.glob.match_properties(target, relpath):
+            return visibility_rule
+    return None
 
 
 @dataclass(frozen=True)
 class BuildFileVisibilityRules(BuildFileDependencyRules):
     path: str
     rulesets: tuple[VisibilityRuleSet, ...]
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_hash", hash((self.path, self.rulesets)))
+
+    def __hash__(self) -> int:
+        return self._hash
 
     @staticmethod
     def create_parser_state(
@@ -301,32 +340,39 @@ class BuildFileVisibilityRules(BuildFileDependencyRules):
         ruleset = self.get_ruleset(address, adaptor, relpath)
         if ruleset is None:
             return None, None, None
-        for visibility_rule in ruleset.rules:
-            if visibility_rule.match(other_address, other_adaptor, relpath):
-                if visibility_rule.action != DependencyRuleAction.ALLOW:
-                    path = self._get_address_path(other_address)
-                    logger.debug(
-                        softwrap(
-                            f"""
-                            {visibility_rule.action.name}: type={adaptor.type_alias}
-                            address={address} [{relpath}] other={other_address} [{path}]
-                            rule={str(visibility_rule)!r} {self.path}:
-                            {', '.join(map(str, ruleset.rules))}
-                            """
-                        )
-                    )
-                return ruleset, visibility_rule.action, str(visibility_rule)
-        return ruleset, None, None
+        visibility_rule = ruleset.get_rule(other_address, other_adaptor, relpath)
+        if visibility_rule is None:
+            return ruleset, None, None
+        if visibility_rule.action != DependencyRuleAction.ALLOW:
+            path = self._get_address_path(other_address)
+            logger.debug(
+                softwrap(
+                    f"""
+                    {visibility_rule.action.name}: type={adaptor.type_alias}
+                    address={address} [{relpath}] other={other_address} [{path}]
+                    rule={str(visibility_rule)!r} {self.path}:
+                    {', '.join(map(str, ruleset.rules))}
+                    """
+                )
+            )
+        return ruleset, visibility_rule.action, str(visibility_rule)
 
     def get_ruleset(
         self, address: Address, target: TargetAdaptor, relpath: str | None = None
     ) -> VisibilityRuleSet | None:
         if relpath is None:
             relpath = self._get_address_relpath(address)
-        for ruleset in self.rulesets:
-            if ruleset.match(address, target, relpath):
-                return ruleset
-        return None
+        return _get_ruleset(self, TargetMatchProperties.create(address, target), relpath)
+
+
+@functools.lru_cache(maxsize=_MATCH_CACHE_SIZE)
+def _get_ruleset(
+    rules: BuildFileVisibilityRules, target: TargetMatchProperties, relpath: str
+) -> VisibilityRuleSet | None:
+    for ruleset in rules.rulesets:
+        if ruleset.match_properties(target, relpath):
+            return ruleset
+    return None
 
 
 @dataclass
@@ -12,7 +12,7 @@ from typing import Any
 
 import pytest
 
-from pants.backend.visibility.glob import TargetGlob
+from pants.backend.visibility.glob import TargetGlob, TargetMatchProperties
 from pants.backend.visibility.rule_types import (
     BuildFileVisibilityRules,
     BuildFileVisibilityRulesError,
@@ -273,6 +273,29 @@ def test_visibility_rule_set_match(expected: bool, target: str, rule_spec: tuple
     )
 
 
+def test_visibility_rule_set_get_rule() -> None:
+    ruleset = parse_ruleset(("*", "!src/blocked/*", "?src/dubious/*", "src/**", "!*"), "")
+    adaptor = TargetAdaptor("target", None, "BUILD:1")
+
+    def assert_rule(address: Address, expected: str) -> None:
+        rule = ruleset.get_rule(address, adaptor, "")
+        assert rule is not None
+        assert str(rule) == expected
+
+    assert_rule(Address("src/blocked", relative_file_path="a.py"), "!src/blocked/*")
+    assert_rule(Address("src/dubious", relative_file_path="a.py"), "?src/dubious/*")
+    assert_rule(Address("src/ok", target_name="a"), "src/**")
+    assert_rule(Address("other", target_name="a"), "!*")
+
+    # Targets with the same properties share the memoized lookup, regardless of their addresses.
+    assert TargetMatchProperties.create(
+        Address("src/ok", target_name="a"), adaptor
+    ) == TargetMatchProperties.create(
+        Address("src/ok", target_name="a", parameters={"x": "y"}), adaptor
+    )
+    assert_rule(Address("src/ok", target_name="a", parameters={"x": "y"}), "src/**")
+
+
 @pytest.fixture
 def dependencies_rules() -> BuildFileVisibilityRules:
     return BuildFileVisibilityRules(
@@ -59,7 +59,14 @@ def _check_frozen_dataclass_attributes() -> None:
                     old__init__(self, *args, **kwargs)
                     expected = sorted(field.name for field in dataclasses.fields(self))
                     if hasattr(self, "__dict__"):
-                        actual = sorted(self.__dict__)
+                        # NB: A base class may store some of the fields in its slots.
+                        slots = {
+                            name
+                            for cls in type(self).__mro__
+                            for name in getattr(cls, "__slots__", ())
+                            if hasattr(self, name)
+                        }
+                        actual = sorted({*self.__dict__, *slots})
                         assert expected == actual
                     else:
                         for attrname in self.__slots__:
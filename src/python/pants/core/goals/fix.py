@@ -3,8 +3,11 @@
 
 from __future__ import annotations
 
+import hashlib
+import inspect
 import itertools
 import logging
+import os
 from collections import defaultdict
 from dataclasses import dataclass
 from typing import (
@@ -21,6 +24,7 @@ from typing import (
     TypeVar,
 )
 
+from pants.base.glob_match_error_behavior import GlobMatchErrorBehavior
 from pants.base.specs import Specs
 from pants.core.goals.lint import (
     AbstractLintRequest,
@@ -31,23 +35,42 @@ from pants.core.goals.lint import (
     _MultiToolGoalSubsystem,
 )
 from pants.core.goals.multi_tool_goal_helper import BatchSizeOption, OnlyOption
+from pants.core.util_rules import config_files
+from pants.core.util_rules.config_files import ConfigFiles, ConfigFilesRequest
 from pants.core.util_rules.partitions import PartitionerType, PartitionMetadataT
 from pants.core.util_rules.partitions import Partitions as UntypedPartitions
+from pants.core.util_rules.partitions import _EmptyMetadata
 from pants.engine.collection import Collection
 from pants.engine.console import Console
 from pants.engine.engine_aware import EngineAwareReturnType
 from pants.engine.environment import EnvironmentName
-from pants.engine.fs import Digest, MergeDigests, PathGlobs, Snapshot, SnapshotDiff, Workspace
+from pants.engine.fs import (
+    EMPTY_DIGEST,
+    EMPTY_SNAPSHOT,
+    Digest,
+    DigestEntries,
+    FileDigest,
+    FileEntry,
+    MergeDigests,
+    PathGlobs,
+    Snapshot,
+    SnapshotDiff,
+    Workspace,
+)
 from pants.engine.goal import Goal, GoalSubsystem
 from pants.engine.process import FallibleProcessResult, ProcessResult
 from pants.engine.rules import Get, MultiGet, collect_rules, goal_rule, rule
 from pants.engine.unions import UnionMembership, UnionRule, distinct_union_type_per_subclass, union
-from pants.option.option_types import BoolOption
+from pants.option.global_options import GlobalOptions
+from pants.option.option_types import BoolOption, IntOption
+from pants.option.scope import Scope, ScopedOptions
 from pants.util.collections import partition_sequentially
+from pants.util.disk_cache import DiskCache, persistent_cache
 from pants.util.docutil import bin_name
 from pants.util.logging import LogLevel
 from pants.util.ordered_set import FrozenOrderedSet
 from pants.util.strutil import Simplifier, softwrap
+from pants.version import VERSION
 
 logger = logging.getLogger(__name__)
 
@@ -194,7 +217,7 @@ class FixFilesRequest(AbstractFixRequest, LintFilesRequest):
 
 
 class _FixBatchElement(NamedTuple):
-    request_type: type[AbstractFixRequest.Batch]
+    request_type: type[AbstractFixRequest]
     tool_name: str
     files: tuple[str, ...]
     key: Any
@@ -235,6 +258,28 @@ class FixSubsystem(GoalSubsystem):
         ),
     )
     batch_size = BatchSizeOption(uppercase="Fixer", lowercase="fixer")
+    known_clean_cache_max_size_bytes = IntOption(
+        default=0,
+        advanced=True,
+        help=softwrap(
+            f"""
+            The maximum size in bytes of the persistent cache of files which fixers and formatters
+            are known to leave unchanged, which is used by both `fix` and `fmt` and is stored below
+            `--persistent-caches-dir`. The least recently used entries are evicted once this size
+            is exceeded.
+
+            When enabled, `{bin_name()} fix` and `{bin_name()} fmt` only run a tool on the files
+            which it has not already left unchanged with the same content, options and config
+            files, regardless of which batches those files were previously run in.
+
+            The cache cannot observe changes to a tool which are not reflected in its options or
+            config files, such as a new version of a tool installed from a resolve's lockfile, or
+            of a tool found on the `PATH`. Clear the cache directory after such an upgrade.
+
+            Set to 0 (the default) to disable the cache.
+            """
+        ),
+    )
 
 
 class Fix(Goal):
@@ -242,6 +287,151 @@ class Fix(Goal):
     environment_behavior = Goal.EnvironmentBehavior.LOCAL_ONLY
 
 
+class KnownCleanFilesCache:
+    """A persistent record of files which a fixer is known to leave unchanged.
+
+    Entries are keyed by the fingerprint of the fixer's configuration (see `_FixerFingerprint`) and
+    the path and content of a single file, so they remain valid regardless of which other files
+    the fixer was run on.
+    """
+
+    def __init__(self, disk_cache: DiskCache) -> None:
+        self._disk_cache = disk_cache
+
+    @staticmethod
+    def _key(fixer_fingerprint: str, path: str, file_digest: FileDigest) -> str:
+        h = hashlib.sha256()
+        h.update(f"{fixer_fingerprint}\n{path}\n".encode())
+        h.update(f"{file_digest.fingerprint} {file_digest.serialized_bytes_length}".encode())
+        return h.hexdigest()
+
+    def is_clean(self, fixer_fingerprint: str, path: str, file_digest: FileDigest) -> bool:
+        return self._disk_cache.get(self._key(fixer_fingerprint, path, file_digest)) is not None
+
+    def mark_clean(self, fixer_fingerprint: str, path: str, file_digest: FileDigest) -> None:
+        self._disk_cache.put(self._key(fixer_fingerprint, path, file_digest), path.encode())
+
+    @staticmethod
+    def _snapshot_key(fixer_fingerprint: str, digest: Digest) -> str:
+        h = hashlib.sha256()
+        h.update(f"{fixer_fingerprint}\nsnapshot {digest.fingerprint}".encode())
+        return h.hexdigest()
+
+    def is_snapshot_clean(self, fixer_fingerprint: str, digest: Digest) -> bool:
+        """Whether the fixer is known to leave all of the files in the digest unchanged."""
+        return self._disk_cache.get(self._snapshot_key(fixer_fingerprint, digest)) is not None
+
+    def mark_snapshot_clean(self, fixer_fingerprint: str, digest: Digest) -> None:
+        key = self._snapshot_key(fixer_fingerprint, digest)
+        self._disk_cache.put(key, digest.fingerprint.encode())
+
+
+def known_clean_files_cache(
+    global_options: GlobalOptions, fix_subsystem: FixSubsystem
+) -> KnownCleanFilesCache | None:
+    """The configured `KnownCleanFilesCache`, or None if it is disabled."""
+    disk_cache = persistent_cache(
+        global_options.persistent_caches_dir,
+        "fix_known_clean_files",
+        fix_subsystem.known_clean_cache_max_size_bytes,
+    )
+    return KnownCleanFilesCache(disk_cache) if disk_cache is not None else None
+
+
+def _stable_metadata_repr(partition_metadata: Any) -> str | None:
+    """A representation of partition metadata which is stable across runs, if there is one."""
+    if isinstance(partition_metadata, _EmptyMetadata):
+        return ""
+    metadata_repr = repr(partition_metadata)
+    # The default `object.__repr__` includes the address of the object.
+    return None if " at 0x" in metadata_repr else metadata_repr
+
+
+@dataclass(frozen=True)
+class _FixerFingerprintRequest:
+    request_type: type[AbstractFixRequest]
+    partition_metadata_repr: str
+    dirs: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class _FixerFingerprint:
+    """A fingerprint of the inputs of a fixer other than the files it is run on.
+
+    That is the version of Pants, the fixer's partition metadata, options, config files for the
+    given directories and lockfile. The value is None for fixers without a tool subsystem.
+    """
+
+    value: str | None
+
+
+@rule
+async def fixer_fingerprint(request: _FixerFingerprintRequest) -> _FixerFingerprint:
+    request_type = request.request_type
+    tool_subsystem = getattr(request_type, "tool_subsystem", None)
+    if tool_subsystem is None:
+        return _FixerFingerprint(None)
+    scoped_options = await Get(ScopedOptions, Scope(str(tool_subsystem.options_scope)))
+    options = scoped_options.options
+
+    config_snapshot = EMPTY_SNAPSHOT
+    if hasattr(tool_subsystem, "config_request"):
+        subsystem = tool_subsystem(options)
+        # NB: Some tools discover config files relative to the files they run on.
+        takes_dirs = bool(inspect.signature(subsystem.config_request).parameters)
+        config_request = (
+            subsystem.config_request(request.dirs) if takes_dirs else subsystem.config_request()
+        )
+        config_files = await Get(ConfigFiles, ConfigFilesRequest, config_request)
+        config_snapshot = config_files.snapshot
+
+    lockfile = options.get("lockfile")
+    lockfile_digest = EMPTY_DIGEST
+    if isinstance(lockfile, str) and lockfile and not os.path.isabs(lockfile):
+        lockfile_digest = await Get(
+            Digest,
+            PathGlobs([lockfile], glob_match_error_behavior=GlobMatchErrorBehavior.ignore),
+        )
+
+    h = hashlib.sha256()
+    for part in (
+        VERSION,
+        f"{request_type.__module__}.{request_type.__qualname__}",
+        request_type.tool_name,
+        request.partition_metadata_repr,
+        repr(sorted(options.as_dict().items())),
+        config_snapshot.digest.fingerprint,
+        lockfile_digest.fingerprint,
+    ):
+        h.update(f"{part}\n".encode())
+    return _FixerFingerprint(h.hexdigest())
+
+
+_FixerKey = Tuple[Type[AbstractFixRequest], str, str]
+
+
+class _FixerFingerprints:
+    """The fingerprints of the fixers which may run on a set of files, by file."""
+
+    def __init__(self, fingerprints: dict[_FixerKey, str | None]) -> None:
+        self._fingerprints = fingerprints
+
+    @staticmethod
+    def key(
+        request_type: type[AbstractFixRequest], partition_metadata: Any, path: str
+    ) -> _FixerKey | None:
+        metadata_repr = _stable_metadata_repr(partition_metadata)
+        if metadata_repr is None:
+            return None
+        return request_type, metadata_repr, os.path.dirname(path)
+
+    def get(
+        self, request_type: type[AbstractFixRequest], partition_metadata: Any, path: str
+    ) -> str | None:
+        key = self.key(request_type, partition_metadata, path)
+        return None if key is None else self._fingerprints.get(key)
+
+
 async def _write_files(workspace: Workspace, batched_results: Iterable[_FixBatchResult]):
     if any(batched_result.did_change for batched_result in batched_results):
         # NB: this will fail if there are any conflicting changes, which we want to happen rather
@@ -259,14 +449,18 @@ async def _write_files(workspace: Workspace, batched_results: Iterable[_FixBatch
 def _print_results(
     console: Console,
     results: Iterable[FixResult],
+    known_clean_tool_names: Iterable[str] = (),
 ):
-    if results:
+    if results or known_clean_tool_names:
         console.print_stderr("")
 
     # We group all results for the same tool so that we can give one final status in the
     # summary. This is only relevant if there were multiple results because of
-    # `--per-file-caching`.
-    tool_to_results = defaultdict(set)
+    # `--per-file-caching`. Tools which did not run on some files because they were known to leave
+    # them unchanged made no changes to them.
+    tool_to_results: defaultdict[str, set[FixResult]] = defaultdict(set)
+    for tool_name in known_clean_tool_names:
+        tool_to_results.setdefault(tool_name, set())
     for result in results:
         tool_to_results[result.tool_name].add(result)
 
@@ -290,6 +484,62 @@ class _BatchableMultiToolGoalSubsystem(_MultiToolGoalSubsystem, Protocol):
     batch_size: BatchSizeOption
 
 
+async def _get_fixer_fingerprints(
+    partitions_by_request_type: dict[type[_CoreRequestType], list[Partitions]],
+) -> _FixerFingerprints:
+    keys = set()
+    for request_type, partitions_list in partitions_by_request_type.items():
+        for partitions in partitions_list:
+            for partition in partitions:
+                for file in partition.elements:
+                    key = _FixerFingerprints.key(request_type, partition.metadata, file)
+                    if key is not None:
+                        keys.add(key)
+    fingerprints = await MultiGet(
+        Get(_FixerFingerprint, _FixerFingerprintRequest(request_type, metadata_repr, (directory,)))
+        for request_type, metadata_repr, directory in keys
+    )
+    return _FixerFingerprints(
+        {key: fingerprint.value for key, fingerprint in zip(keys, fingerprints)}
+    )
+
+
+async def _get_file_digests(files: Iterable[str]) -> dict[str, FileDigest]:
+    digest = await Get(Digest, PathGlobs(files))
+    entries = await Get(DigestEntries, Digest, digest)
+    return {entry.path: entry.file_digest for entry in entries if isinstance(entry, FileEntry)}
+
+
+async def _record_known_clean_files(
+    cache: KnownCleanFilesCache,
+    fingerprints: _FixerFingerprints,
+    batch_requests: Sequence[_FixBatchRequest],
+    batch_results: Sequence[_FixBatchResult],
+) -> None:
+    elements_and_results = [
+        (element, result)
+        for batch_request, batch_result in zip(batch_requests, batch_results)
+        for element, result in zip(batch_request, batch_result.results)
+    ]
+    entries = await MultiGet(
+        Get(DigestEntries, Digest, snapshot.digest)
+        for _, result in elements_and_results
+        for snapshot in (result.input, result.output)
+    )
+    for i, (element, _) in enumerate(elements_and_results):
+        input_entries, output_entries = (
+            {entry.path: entry for entry in entries[2 * i + offset] if isinstance(entry, FileEntry)}
+            for offset in (0, 1)
+        )
+        for file in element.files:
+            input_entry, output_entry = input_entries.get(file), output_entries.get(file)
+            if input_entry is None or input_entry != output_entry:
+                continue
+            fingerprint = fingerprints.get(element.request_type, element.key, file)
+            if fingerprint is not None:
+                cache.mark_clean(fingerprint, file, input_entry.file_digest)
+
+
 async def _do_fix(
     core_request_types: Iterable[type[_CoreRequestType]],
     target_partitioners: Iterable[type[_TargetPartitioner]],
@@ -301,6 +551,7 @@ async def _do_fix(
     console: Console,
     make_targets_partition_request_get: Callable[[_TargetPartitioner], Get[Partitions]],
     make_files_partition_request_get: Callable[[_FilePartitioner], Get[Partitions]],
+    known_clean_files_cache: KnownCleanFilesCache | None = None,
 ) -> _GoalT:
     partitions_by_request_type = await _get_partitions_by_request_type(
         core_request_types,
@@ -315,6 +566,32 @@ async def _do_fix(
     if not partitions_by_request_type:
         return goal_cls(exit_code=0)
 
+    fingerprints = _FixerFingerprints({})
+    file_digests: dict[str, FileDigest] = {}
+    if known_clean_files_cache is not None:
+        fingerprints, file_digests = await MultiGet(
+            _get_fixer_fingerprints(partitions_by_request_type),
+            _get_file_digests(
+                {
+                    file
+                    for partitions_list in partitions_by_request_type.values()
+                    for partitions in partitions_list
+                    for partition in partitions
+                    for file in partition.elements
+                }
+            ),
+        )
+
+    def is_known_clean(file: str, request_type: type[AbstractFixRequest], metadata: Any) -> bool:
+        if known_clean_files_cache is None or file not in file_digests:
+            return False
+        fingerprint = fingerprints.get(request_type, metadata, file)
+        return fingerprint is not None and known_clean_files_cache.is_clean(
+            fingerprint, file, file_digests[file]
+        )
+
+    known_clean_tool_names: set[str] = set()
+
     def batch_by_size(files: Iterable[str]) -> Iterator[tuple[str, ...]]:
         batches = partition_sequentially(
             files,
@@ -339,13 +616,23 @@ async def _do_fix(
         files_by_partition_info = defaultdict(list)
         for file, partition_infos in partition_infos_by_files.items():
             deduped_partition_infos = FrozenOrderedSet(partition_infos)
-            files_by_partition_info[deduped_partition_infos].append(file)
+            # Tools which are known to leave the file unchanged need not run on it, up until the
+            # first tool which might change it.
+            known_clean_count = 0
+            for request_type, partition_metadata in deduped_partition_infos:
+                if not is_known_clean(file, request_type, partition_metadata):
+                    break
+                known_clean_tool_names.add(request_type.tool_name)
+                known_clean_count += 1
+            remaining_partition_infos = list(deduped_partition_infos)[known_clean_count:]
+            if remaining_partition_infos:
+                files_by_partition_info[FrozenOrderedSet(remaining_partition_infos)].append(file)
 
         for partition_infos, files in files_by_partition_info.items():
             for batch in batch_by_size(files):
                 yield _FixBatchRequest(
                     _FixBatchElement(
-                        request_type.Batch,
+                        request_type,
                         request_type.tool_name,
                         batch,
                         partition_metadata,
@@ -353,17 +640,21 @@ async def _do_fix(
                     for request_type, partition_metadata in partition_infos
                 )
 
+    batch_requests = list(_make_disjoint_batch_requests())
     all_results = await MultiGet(
-        Get(_FixBatchResult, _FixBatchRequest, request)
-        for request in _make_disjoint_batch_requests()
+        Get(_FixBatchResult, _FixBatchRequest, request) for request in batch_requests
     )
 
     individual_results = list(
         itertools.chain.from_iterable(result.results for result in all_results)
     )
 
+    if known_clean_files_cache is not None:
+        await _record_known_clean_files(
+            known_clean_files_cache, fingerprints, batch_requests, all_results
+        )
     await _write_files(workspace, all_results)
-    _print_results(console, individual_results)
+    _print_results(console, individual_results, known_clean_tool_names)
 
     # Since the rules to produce FixResult should use ProcessResult, rather than
     # FallibleProcessResult, we assume that there were no failures.
@@ -375,6 +666,7 @@ async def fix(
     console: Console,
     specs: Specs,
     fix_subsystem: FixSubsystem,
+    global_options: GlobalOptions,
     workspace: Workspace,
     union_membership: UnionMembership,
 ) -> Fix:
@@ -402,21 +694,51 @@ async def fix(
         console,
         lambda request_type: Get(Partitions, FixTargetsRequest.PartitionRequest, request_type),
         lambda request_type: Get(Partitions, FixFilesRequest.PartitionRequest, request_type),
+        known_clean_files_cache(global_options, fix_subsystem),
     )
 
 
 @rule
 async def fix_batch(
     request: _FixBatchRequest,
+    fix_subsystem: FixSubsystem,
+    global_options: GlobalOptions,
 ) -> _FixBatchResult:
+    cache = known_clean_files_cache(global_options, fix_subsystem)
     current_snapshot = await Get(Snapshot, PathGlobs(request[0].files))
 
     results = []
     for request_type, tool_name, files, key in request:
-        batch = request_type(tool_name, files, key, current_snapshot)
-        result = await Get(  # noqa: PNT30: this is inherently sequential
-            FixResult, AbstractFixRequest.Batch, batch
-        )
+        # If an earlier run found that this tool leaves the snapshot (which may be the unchanged
+        # output of the previous tool) unchanged, there is no need to run it.
+        fingerprint = None
+        metadata_repr = _stable_metadata_repr(key)
+        if cache is not None and metadata_repr is not None:
+            fixer_fingerprint = await Get(  # noqa: PNT30: this is inherently sequential
+                _FixerFingerprint,
+                _FixerFingerprintRequest(request_type, metadata_repr, current_snapshot.dirs),
+            )
+            fingerprint = fixer_fingerprint.value
+
+        if (
+            cache is not None
+            and fingerprint is not None
+            and cache.is_snapshot_clean(fingerprint, current_snapshot.digest)
+        ):
+            result = FixResult(
+                input=current_snapshot,
+                output=current_snapshot,
+                stdout="",
+                stderr="",
+                tool_name=tool_name,
+            )
+        else:
+            batch = request_type.Batch(tool_name, files, key, current_snapshot)
+            result = await Get(  # noqa: PNT30: this is inherently sequential
+                FixResult, AbstractFixRequest.Batch, batch
+            )
+            if cache is not None and fingerprint is not None and not result.did_change:
+                cache.mark_snapshot_clean(fingerprint, current_snapshot.digest)
         results.append(result)
 
         assert set(result.output.files) == set(
@@ -438,4 +760,7 @@ async def convert_fix_result_to_lint_result(fix_result: FixResult) -> LintResult
 
 
 def rules():
-    return collect_rules()
+    return [
+        *collect_rules(),
+        *config_files.rules(),
+    ]
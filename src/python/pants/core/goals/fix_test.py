@@ -206,6 +206,72 @@ async def smalltalk_skip(request: SmalltalkSkipRequest.Batch) -> FixResult:
     assert False
 
 
+class SmalltalkTrackedNoopSubsystem(Subsystem):
+    options_scope = "smalltalk-tracked-noop"
+    name = "Smalltalk Tracked Noop"
+    help = "Leaves Smalltalk files unchanged, recording which files it ran on."
+    skip = SkipOption("fix", "lint")
+
+
+class SmalltalkTrackedNoopRequest(FixTargetsRequest):
+    field_set_type = SmalltalkFieldSet
+    tool_subsystem = SmalltalkTrackedNoopSubsystem
+    partitioner_type = PartitionerType.DEFAULT_SINGLE_PARTITION
+
+
+smalltalk_tracked_noop_files: list[str] = []
+
+
+@rule
+async def smalltalk_tracked_noop(request: SmalltalkTrackedNoopRequest.Batch) -> FixResult:
+    smalltalk_tracked_noop_files.extend(request.files)
+    return FixResult(
+        input=request.snapshot,
+        output=request.snapshot,
+        stdout="",
+        stderr="",
+        tool_name=SmalltalkTrackedNoopRequest.tool_name,
+    )
+
+
+class SmalltalkNewlineRequest(FixTargetsRequest):
+    field_set_type = SmalltalkFieldSet
+
+    @classproperty
+    def tool_name(cls) -> str:
+        return "Smalltalk Newline"
+
+    @classproperty
+    def tool_id(cls) -> str:
+        return "smalltalknewline"
+
+
+@rule
+async def smalltalk_newline_partition(
+    request: SmalltalkNewlineRequest.PartitionRequest,
+) -> Partitions:
+    return Partitions.single_partition(fs.source.file_path for fs in request.field_sets)
+
+
+@rule
+async def smalltalk_newline(request: SmalltalkNewlineRequest.Batch) -> FixResult:
+    digest_contents = await Get(DigestContents, Digest, request.snapshot.digest)
+    output = await Get(
+        Snapshot,
+        CreateDigest(
+            dataclasses.replace(fc, content=fc.content.rstrip(b"\n") + b"\n")
+            for fc in digest_contents
+        ),
+    )
+    return FixResult(
+        input=request.snapshot,
+        output=output,
+        stdout="",
+        stderr="",
+        tool_name=SmalltalkNewlineRequest.tool_name,
+    )
+
+
 class BrickyBuildFileFixer(FixFilesRequest):
     """Ensures all non-comment lines only consist of the word 'brick'."""
 
@@ -274,10 +340,12 @@ def run_fix(
     *,
     target_specs: List[str],
     only: list[str] | None = None,
+    global_args: Iterable[str] = (),
     extra_args: Iterable[str] = (),
 ) -> str:
     result = rule_runner.run_goal_rule(
         Fix,
+        global_args=global_args,
         args=[f"--only={repr(only or [])}", *target_specs, *extra_args],
     )
     assert result.exit_code == 0
@@ -372,6 +440,72 @@ def test_summary() -> None:
     )
 
 
+def test_known_clean_files_cache(tmp_path: Path) -> None:
+    def run(files: dict[str, str]) -> list[str]:
+        rule_runner = fix_rule_runner(
+            target_types=[SmalltalkTarget],
+            request_types=[SmalltalkTrackedNoopRequest],
+        )
+        rule_runner.write_files(
+            {
+                "BUILD": dedent(
+                    """\
+                    smalltalk(name='s1', source="s1.st")
+                    smalltalk(name='s2', source="s2.st")
+                    """
+                ),
+                **files,
+            }
+        )
+        smalltalk_tracked_noop_files.clear()
+        stderr = run_fix(
+            rule_runner,
+            target_specs=["::"],
+            global_args=[f"--persistent-caches-dir={tmp_path}"],
+            extra_args=["--fix-known-clean-cache-max-size-bytes=1000000"],
+        )
+        assert stderr.strip() == "✓ Smalltalk Tracked Noop made no changes."
+        return sorted(smalltalk_tracked_noop_files)
+
+    files = {"s1.st": "y := 1.", "s2.st": "y := 2."}
+    assert run(files) == ["s1.st", "s2.st"]
+    # The tool does not run again on files which it left unchanged, even in a new build root.
+    assert run(files) == []
+    assert run({**files, "s2.st": "y := 3."}) == ["s2.st"]
+
+
+def test_known_clean_snapshots_cache(tmp_path: Path) -> None:
+    def run() -> list[str]:
+        rule_runner = fix_rule_runner(
+            target_types=[SmalltalkTarget],
+            request_types=[SmalltalkNewlineRequest, SmalltalkTrackedNoopRequest],
+        )
+        rule_runner.write_files(
+            {"BUILD": "smalltalk(name='s1', source='s1.st')", "s1.st": "y := 1."}
+        )
+        smalltalk_tracked_noop_files.clear()
+        stderr = run_fix(
+            rule_runner,
+            target_specs=["::"],
+            global_args=[f"--persistent-caches-dir={tmp_path}"],
+            extra_args=["--fix-known-clean-cache-max-size-bytes=1000000"],
+        )
+        assert stderr == dedent(
+            """\
+
+            + Smalltalk Newline made changes.
+            ✓ Smalltalk Tracked Noop made no changes.
+            """
+        )
+        assert Path(rule_runner.build_root, "s1.st").read_text() == "y := 1.\n"
+        return smalltalk_tracked_noop_files.copy()
+
+    assert run() == ["s1.st"]
+    # The file on disk is changed by the first fixer, but the tool is known to leave its output
+    # unchanged.
+    assert run() == []
+
+
 def test_skip_formatters() -> None:
     rule_runner = fix_rule_runner(
         target_types=[FortranTarget, SmalltalkTarget],
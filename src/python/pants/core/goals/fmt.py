@@ -7,15 +7,22 @@ import logging
 from typing import Iterable
 
 from pants.base.specs import Specs
-from pants.core.goals.fix import AbstractFixRequest, FixFilesRequest, FixResult, FixTargetsRequest
+from pants.core.goals.fix import (
+    AbstractFixRequest,
+    FixFilesRequest,
+    FixResult,
+    FixSubsystem,
+    FixTargetsRequest,
+)
 from pants.core.goals.fix import Partitions as Partitions  # re-export
-from pants.core.goals.fix import _do_fix
+from pants.core.goals.fix import _do_fix, known_clean_files_cache
 from pants.core.goals.multi_tool_goal_helper import BatchSizeOption, OnlyOption
 from pants.engine.console import Console
 from pants.engine.fs import Workspace
 from pants.engine.goal import Goal, GoalSubsystem
 from pants.engine.rules import Get, collect_rules, goal_rule
 from pants.engine.unions import UnionMembership, UnionRule, union
+from pants.option.global_options import GlobalOptions
 
 logger = logging.getLogger(__name__)
 
@@ -71,6 +78,8 @@ async def fmt(
     console: Console,
     specs: Specs,
     fmt_subsystem: FmtSubsystem,
+    fix_subsystem: FixSubsystem,
+    global_options: GlobalOptions,
     workspace: Workspace,
     union_membership: UnionMembership,
 ) -> Fmt:
@@ -85,6 +94,7 @@ async def fmt(
         console,
         lambda request_type: Get(Partitions, FmtTargetsRequest.PartitionRequest, request_type),
         lambda request_type: Get(Partitions, FmtFilesRequest.PartitionRequest, request_type),
+        known_clean_files_cache(global_options, fix_subsystem),
     )
 
 
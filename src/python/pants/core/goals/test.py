@@ -60,8 +60,9 @@ from pants.engine.target import (
     parse_shard_spec,
 )
 from pants.engine.unions import UnionMembership, UnionRule, distinct_union_type_per_subclass, union
+from pants.option.global_options import GlobalOptions
 from pants.option.option_types import BoolOption, EnumOption, IntOption, StrListOption, StrOption
-from pants.util.collections import partition_sequentially
+from pants.util.collections import partition_by_duration, partition_sequentially
 from pants.util.dirutil import safe_open
 from pants.util.docutil import bin_name
 from pants.util.logging import LogLevel
@@ -284,6 +285,16 @@ class ShowOutput(Enum):
     NONE = "none"
 
 
+class TestBatchScheduling(Enum):
+    """How to divide the tests of a partition into batches."""
+
+    STABLE = "stable"
+    DURATION = "duration"
+
+    # Prevent this class from being detected by pytest as a test class.
+    __test__ = False
+
+
 @dataclass(frozen=True)
 class TestDebugRequest:
     process: InteractiveProcess
@@ -663,6 +674,40 @@ class TestSubsystem(GoalSubsystem):
             """
         ),
     )
+    batch_scheduling = EnumOption(
+        default=TestBatchScheduling.STABLE,
+        advanced=True,
+        help=softwrap(
+            f"""
+            How to divide the files of batch-enabled test runners into batches.
+
+            With `{TestBatchScheduling.STABLE.value}`, batches are created at stable boundaries of
+            around `[test].batch_size` files, which maximizes cache hit rates.
+
+            With `{TestBatchScheduling.DURATION.value}`, the durations of previous runs of each
+            test are used to pack tests into batches which each take around
+            `[test].batch_target_duration` seconds, and the longest batches are started first.
+            This reduces the wall time of runs which are dominated by a few slow tests, but
+            batches are no longer stable as durations change, and so cache hit rates are lower.
+            Tests which have not been run before are assumed to take the average duration of the
+            other tests in their partition.
+
+            NOTE: This parameter has no effect on test runners/plugins that do not implement support
+            for batched testing.
+            """
+        ),
+    )
+    batch_target_duration = IntOption(
+        default=60,
+        advanced=True,
+        help=softwrap(
+            f"""
+            The target duration (in seconds) of each batch when `[test].batch_scheduling` is
+            `{TestBatchScheduling.DURATION.value}`. Batches never contain more than twice
+            `[test].batch_size` files.
+            """
+        ),
+    )
 
     show_rerun_command = BoolOption(
         default="CI" in os.environ,
@@ -801,6 +846,7 @@ async def _get_test_batches(
     targets_to_field_sets: TargetRootsToFieldSets,
     local_environment_name: ChosenLocalEnvironmentName,
     test_subsystem: TestSubsystem,
+    durations: _TestDurationHistory | None = None,
 ) -> list[TestRequest.Batch]:
     def partitions_get(request_type: type[TestRequest]) -> Get[Partitions]:
         partition_type = cast(TestRequest, request_type)
@@ -823,16 +869,88 @@ async def _get_test_batches(
         partitions_get(request_type) for request_type in core_request_types
     )
 
-    return [
-        request_type.Batch(
-            cast(TestRequest, request_type).tool_name, tuple(batch), partition.metadata
+    if durations is None:
+        return [
+            request_type.Batch(
+                cast(TestRequest, request_type).tool_name, tuple(batch), partition.metadata
+            )
+            for request_type, partitions in zip(core_request_types, all_partitions)
+            for partition in partitions
+            for batch in partition_sequentially(
+                partition.elements,
+                key=_test_batch_element_key,
+                size_target=test_subsystem.batch_size,
+                size_max=2 * test_subsystem.batch_size,
+            )
+        ]
+
+    estimated_batches: list[tuple[float, TestRequest.Batch]] = []
+    for request_type, partitions in zip(core_request_types, all_partitions):
+        for partition in partitions:
+            for estimated_duration, batch in _partition_by_duration(
+                partition.elements, test_subsystem, durations
+            ):
+                estimated_batches.append(
+                    (
+                        estimated_duration,
+                        request_type.Batch(
+                            cast(TestRequest, request_type).tool_name,
+                            tuple(batch),
+                            partition.metadata,
+                        ),
+                    )
+                )
+    # Start the longest running batches first, so that they do not determine the wall time of
+    # the run by starting last.
+    estimated_batches.sort(key=lambda estimated_batch: estimated_batch[0], reverse=True)
+    return [batch for _, batch in estimated_batches]
+
+
+def _test_batch_element_key(element: Any) -> str:
+    return str(element.address) if isinstance(element, FieldSet) else str(element)
+
+
+def _partition_by_duration(
+    elements: Iterable[Any],
+    test_subsystem: TestSubsystem,
+    durations: _TestDurationHistory,
+) -> list[tuple[float, list[Any]]]:
+    """Partition the elements of a partition into batches using the durations of previous runs.
+
+    Returns the estimated duration of each batch along with the batch.
+    """
+    elements = list(elements)
+    known_durations = {
+        key: duration
+        for key, duration in (
+            (key, durations.get(key)) for key in map(_test_batch_element_key, elements)
         )
-        for request_type, partitions in zip(core_request_types, all_partitions)
-        for partition in partitions
-        for batch in partition_sequentially(
-            partition.elements,
-            key=lambda x: str(x.address) if isinstance(x, FieldSet) else str(x),
-            size_target=test_subsystem.batch_size,
+        if duration is not None
+    }
+    if not known_durations:
+        # With nothing to go on, fall back to stable batches of equal (unknown) duration.
+        return [
+            (0.0, batch)
+            for batch in partition_sequentially(
+                elements,
+                key=_test_batch_element_key,
+                size_target=test_subsystem.batch_size,
+                size_max=2 * test_subsystem.batch_size,
+            )
+        ]
+
+    default_duration = sum(known_durations.values()) / len(known_durations)
+
+    def duration(element: Any) -> float:
+        return known_durations.get(_test_batch_element_key(element), default_duration)
+
+    return [
+        (sum(map(duration, batch)), batch)
+        for batch in partition_by_duration(
+            elements,
+            key=_test_batch_element_key,
+            duration=duration,
+            duration_target=test_subsystem.batch_target_duration,
             size_max=2 * test_subsystem.batch_size,
         )
     ]
@@ -878,6 +996,86 @@ async def _run_debug_tests(
     return Test(exit_code)
 
 
+class _TestDurationHistory:
+    """The durations of previous runs of tests, persisted in the workdir between runs.
+
+    Durations are stored as exponential moving averages (in seconds), keyed by address spec. Only
+    the most recently recorded entries are retained, to bound the size of the file.
+    """
+
+    _MAX_ENTRIES = 50_000
+    # The weight of a new duration relative to the existing average.
+    _SMOOTHING = 0.5
+
+    def __init__(self, path: str, durations: dict[str, float]) -> None:
+        self._path = path
+        self._durations = durations
+
+    @classmethod
+    def load(cls, path: str) -> _TestDurationHistory:
+        try:
+            with open(path) as fp:
+                durations = json.load(fp)
+            if not isinstance(durations, dict):
+                raise ValueError(f"Expected a JSON object, got {type(durations).__name__}.")
+        except FileNotFoundError:
+            durations = {}
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring invalid test duration history at {path}: {e}")
+            durations = {}
+        return cls(path, durations)
+
+    def get(self, key: str) -> float | None:
+        return self._durations.get(key)
+
+    def record(self, key: str, duration: float) -> None:
+        previous = self._durations.pop(key, None)
+        self._durations[key] = (
+            duration if previous is None else previous + self._SMOOTHING * (duration - previous)
+        )
+
+    def record_batch(self, keys: Sequence[str], duration: float) -> None:
+        """Record the duration of a batch of tests which ran in a single process.
+
+        How the duration divides between the tests of a batch is unknown. Tests without a duration
+        are attributed the remainder of the batch's duration beyond the known durations, so that a
+        new slow test is identified as such, rather than all tests of its batch. The rest of the
+        batch's duration is divided between the tests with known durations in proportion to those
+        durations, and recorded as usual: so if a batch runs twice as long as expected, each of its
+        known durations moves toward twice its previous value.
+        """
+        if len(keys) == 1:
+            self.record(keys[0], duration)
+            return
+        known = {key: self._durations[key] for key in keys if key in self._durations}
+        unknown = [key for key in keys if key not in known]
+        known_duration = sum(known.values())
+        unknown_share = max(duration - known_duration, 0.0) if unknown else 0.0
+        known_share = duration - unknown_share
+        for key, previous in known.items():
+            self.record(
+                key,
+                (
+                    known_share * previous / known_duration
+                    if known_duration > 0
+                    else known_share / len(known)
+                ),
+            )
+        for key in unknown:
+            self._durations[key] = unknown_share / len(unknown)
+
+    def save(self) -> None:
+        durations = dict(itertools.islice(reversed(self._durations.items()), self._MAX_ENTRIES))
+        tmp_path = f"{self._path}.tmp.{os.getpid()}"
+        try:
+            with safe_open(tmp_path, "w") as fp:
+                # Reverse again, so that the most recently recorded entries remain last.
+                json.dump(dict(reversed(durations.items())), fp)
+            os.replace(tmp_path, self._path)
+        except OSError as e:
+            logger.debug(f"Failed to write the test duration history to {self._path}: {e}")
+
+
 def _save_test_result_info_report_file(run_id: RunId, results: dict[str, dict]) -> None:
     """Save a JSON file with the information about the test results."""
     timestamp = datetime.now().strftime("%Y_%m_%d_%H_%M_%S")
@@ -896,6 +1094,7 @@ async def run_tests(
     distdir: DistDir,
     run_id: RunId,
     local_environment_name: ChosenLocalEnvironmentName,
+    global_options: GlobalOptions,
 ) -> Test:
     if test_subsystem.debug_adapter:
         goal_description = f"`{test_subsystem.name} --debug-adapter`"
@@ -919,12 +1118,21 @@ async def run_tests(
         ),
     )
 
+    durations = (
+        _TestDurationHistory.load(
+            os.path.join(global_options.pants_workdir, "test", "durations.json")
+        )
+        if test_subsystem.batch_scheduling == TestBatchScheduling.DURATION
+        else None
+    )
+
     request_types = union_membership.get(TestRequest)
     test_batches = await _get_test_batches(
         request_types,
         targets_to_valid_field_sets,
         local_environment_name,
         test_subsystem,
+        durations,
     )
 
     environment_names = await MultiGet(
@@ -972,6 +1180,11 @@ async def run_tests(
             test_result_info[result.addresses[0].spec] = {
                 "source": result.result_metadata.source(run_id).value
             }
+        if durations is not None and result.result_metadata.total_elapsed_ms is not None:
+            durations.record_batch(
+                [str(address) for address in result.addresses],
+                result.result_metadata.total_elapsed_ms / 1000,
+            )
         console.print_stderr(_format_test_summary(result, run_id, console))
 
         if result.extra_output and result.extra_output.files:
@@ -985,6 +1198,9 @@ async def run_tests(
                     f"Wrote extra output from test `{result.addresses[0]}` to `{path_prefix}`."
                 )
 
+    if durations is not None:
+        durations.save()
+
     rerun_command = _format_test_rerun_command(results)
     if rerun_command and test_subsystem.show_rerun_command:
         console.print_stderr(f"\n{rerun_command}")
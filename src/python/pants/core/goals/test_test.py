@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import os
 from abc import abstractmethod
 from dataclasses import dataclass
 from functools import partial
@@ -27,6 +28,7 @@ from pants.core.goals.test import (
     RuntimePackageDependenciesField,
     ShowOutput,
     Test,
+    TestBatchScheduling,
     TestDebugAdapterRequest,
     TestDebugRequest,
     TestFieldSet,
@@ -36,6 +38,8 @@ from pants.core.goals.test import (
     TestTimeoutField,
     _format_test_rerun_command,
     _format_test_summary,
+    _partition_by_duration,
+    _TestDurationHistory,
     build_runtime_package_dependencies,
     run_tests,
 )
@@ -76,6 +80,7 @@ from pants.engine.target import (
     TargetRootsToFieldSetsRequest,
 )
 from pants.engine.unions import UnionMembership
+from pants.option.global_options import GlobalOptions
 from pants.option.option_types import SkipOption
 from pants.option.subsystem import Subsystem
 from pants.testutil.option_util import create_goal_subsystem, create_subsystem
@@ -275,6 +280,7 @@ def run_test_rule(
     valid_targets: bool = True,
     show_rerun_command: bool = False,
     run_id: RunId = RunId(999),
+    batch_scheduling: TestBatchScheduling = TestBatchScheduling.STABLE,
 ) -> tuple[int, str]:
     test_subsystem = create_goal_subsystem(
         TestSubsystem,
@@ -289,6 +295,8 @@ def run_test_rule(
         extra_env_vars=[],
         shard="",
         batch_size=1,
+        batch_scheduling=batch_scheduling,
+        batch_target_duration=60,
         show_rerun_command=show_rerun_command,
     )
     debug_adapter_subsystem = create_subsystem(
@@ -296,6 +304,7 @@ def run_test_rule(
         host="127.0.0.1",
         port="5678",
     )
+    global_options = create_subsystem(GlobalOptions, pants_workdir=rule_runner.pants_workdir)
     workspace = Workspace(rule_runner.scheduler, _enforce_effects=False)
     union_membership = UnionMembership(
         {
@@ -356,6 +365,7 @@ def run_test_rule(
                 DistDir(relpath=Path("dist")),
                 run_id,
                 ChosenLocalEnvironmentName(EnvironmentName(None)),
+                global_options,
             ],
             mock_gets=[
                 MockGet(
@@ -835,6 +845,70 @@ def test_timeout_calculation() -> None:
     assert_timeout_calculated(field_value=10, timeouts_enabled=False, expected=None)
 
 
+def test_batch_scheduling_by_duration(rule_runner: PythonRuleRunner) -> None:
+    exit_code, _ = run_test_rule(
+        rule_runner,
+        request_type=ConditionallySucceedsRequest,
+        targets=[
+            make_target(Address("", target_name="good")),
+            make_target(Address("", target_name="bad")),
+        ],
+        batch_scheduling=TestBatchScheduling.DURATION,
+    )
+    assert exit_code == 27
+
+    durations = _TestDurationHistory.load(
+        os.path.join(rule_runner.pants_workdir, "test", "durations.json")
+    )
+    assert durations.get("//:good") == 0.999
+    assert durations.get("//:bad") == 0.999
+    assert durations.get("//:unknown") is None
+
+    durations.record("//:good", 2.999)
+    assert durations.get("//:good") == pytest.approx(1.999)
+
+
+def test_record_batch_duration() -> None:
+    durations = _TestDurationHistory("unused", {"fast": 1.0, "medium": 3.0})
+
+    # The remainder of the batch's duration beyond the known durations is attributed to the tests
+    # without a duration.
+    durations.record_batch(["fast", "medium", "slow"], 20.0)
+    assert durations.get("fast") == 1.0
+    assert durations.get("medium") == 3.0
+    assert durations.get("slow") == 16.0
+
+    # If the batch ran for less than its known durations, they are scaled down.
+    durations.record_batch(["new1", "new2", "fast"], 0.5)
+    assert durations.get("new1") == 0.0
+    assert durations.get("new2") == 0.0
+    assert durations.get("fast") == 0.75
+
+    # The known durations of a batch move toward their proportional share of its duration.
+    durations.record_batch(["fast", "medium"], 7.5)
+    assert durations.get("fast") == 1.125
+    assert durations.get("medium") == 4.5
+
+    # The duration of a test which ran alone is known exactly.
+    durations.record_batch(["slow"], 12.0)
+    assert durations.get("slow") == 14.0
+
+
+def test_partition_by_duration() -> None:
+    test_subsystem = create_subsystem(TestSubsystem, batch_size=2, batch_target_duration=10)
+    durations = _TestDurationHistory("unused", {"slow": 9.0, "medium": 5.0, "fast": 1.0})
+
+    # Unknown tests are assumed to take the mean duration of known tests in their partition, and
+    # the batches are returned longest first.
+    assert _partition_by_duration(["fast", "medium", "slow", "new"], test_subsystem, durations) == [
+        (10.0, ["fast", "slow"]),
+        (10.0, ["medium", "new"]),
+    ]
+
+    # Without any history, batches are created at stable boundaries.
+    assert _partition_by_duration(["new"], test_subsystem, durations) == [(0.0, ["new"])]
+
+
 def test_non_utf8_output() -> None:
     test_result = make_test_result(
         [],
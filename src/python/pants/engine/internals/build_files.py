@@ -4,18 +4,13 @@
 from __future__ import annotations
 
 import ast
-import builtins
 import itertools
 import logging
 import os.path
 import sys
-import typing
 from collections import defaultdict
 from dataclasses import dataclass
-from pathlib import PurePath
-from typing import Any, Sequence, cast
-
-import typing_extensions
+from typing import Sequence, cast
 
 from pants.build_graph.address import (
     Address,
@@ -28,6 +23,7 @@ from pants.build_graph.address import (
 from pants.engine.engine_aware import EngineAwareParameter
 from pants.engine.env_vars import CompleteEnvironmentVars, EnvironmentVars, EnvironmentVarsRequest
 from pants.engine.fs import DigestContents, FileContent, GlobMatchErrorBehavior, PathGlobs, Paths
+from pants.engine.internals import native_engine
 from pants.engine.internals.defaults import BuildFileDefaults, BuildFileDefaultsParserState
 from pants.engine.internals.dep_rules import (
     BuildFileDependencyRules,
@@ -39,8 +35,9 @@ from pants.engine.internals.parser import (
     BuildFilePreludeSymbols,
     BuildFileSymbolsInfo,
     Parser,
-    error_on_imports,
+    evaluate_prelude_files,
 )
+from pants.engine.internals.parser_pool import ParseResult, ParserPool
 from pants.engine.internals.session import SessionValues
 from pants.engine.internals.synthetic_targets import (
     SyntheticAddressMaps,
@@ -121,35 +118,14 @@ async def evaluate_preludes(
             glob_match_error_behavior=GlobMatchErrorBehavior.ignore,
         ),
     )
-    globals: dict[str, Any] = {
-        # Later entries have precendence replacing conflicting keys from previous entries, so we
-        # start with typing_extensions as the lowest prio source for global values.
-        **{name: getattr(typing_extensions, name) for name in typing_extensions.__all__},
-        **{name: getattr(typing, name) for name in typing.__all__},
-        **{name: getattr(builtins, name) for name in dir(builtins) if name.endswith("Error")},
-        # Ensure the globals for each prelude includes the builtin symbols (E.g. `python_sources`)
-        # and any build file aliases (e.g. from plugins)
-        **parser.symbols,
-    }
-    locals: dict[str, Any] = {}
-    env_vars: set[str] = set()
-    for file_content in prelude_digest_contents:
-        try:
-            file_content_str = file_content.content.decode()
-            content = compile(file_content_str, file_content.path, "exec", dont_inherit=True)
-            exec(content, globals, locals)
-        except Exception as e:
-            raise Exception(f"Error parsing prelude file {file_content.path}: {e}")
-        error_on_imports(file_content_str, file_content.path)
-        env_vars.update(BUILDFileEnvVarExtractor.get_env_vars(file_content))
-    # __builtins__ is a dict, so isn't hashable, and can't be put in a FrozenDict.
-    # Fortunately, we don't care about it - preludes should not be able to override builtins, so we just pop it out.
-    # TODO: Give a nice error message if a prelude tries to set and expose a non-hashable value.
-    locals.pop("__builtins__", None)
-    # Ensure preludes can reference each other by populating the shared globals object with references
-    # to the other symbols
-    globals.update(locals)
-    return BuildFilePreludeSymbols.create(locals, env_vars)
+    prelude_files = [(fc.path, fc.content.decode()) for fc in prelude_digest_contents]
+    symbols = evaluate_prelude_files(parser, prelude_files)
+    env_vars = set(
+        itertools.chain.from_iterable(
+            BUILDFileEnvVarExtractor.get_env_vars(fc) for fc in prelude_digest_contents
+        )
+    )
+    return BuildFilePreludeSymbols.create(symbols, env_vars)
 
 
 @rule
@@ -211,6 +187,19 @@ class AddressFamilyDir(EngineAwareParameter):
         return self.path
 
 
+@dataclass(frozen=True)
+class AncestorAddressFamilyDir(EngineAwareParameter):
+    """The directory to find the closest ancestor AddressFamily of.
+
+    The directory itself is not considered.
+    """
+
+    path: str
+
+    def debug_hint(self) -> str:
+        return self.path
+
+
 @dataclass(frozen=True)
 class OptionalAddressFamily:
     path: str
@@ -227,6 +216,25 @@ async def ensure_address_family(request: OptionalAddressFamily) -> AddressFamily
     return request.ensure()
 
 
+@rule
+async def find_closest_ancestor_address_family(
+    directory: AncestorAddressFamilyDir,
+) -> OptionalAddressFamily:
+    """Find the AddressFamily of the closest ancestor directory with BUILD files, if any.
+
+    Each directory depends only on its parent's family and, if the parent has no BUILD files, on
+    the parent's closest ancestor family. This keeps the number of graph edges linear in the number
+    of directories, since the lookups are shared by all directories below a common ancestor.
+    """
+    parent = os.path.dirname(directory.path)
+    if parent == directory.path:
+        return OptionalAddressFamily(parent)
+    maybe_parent = await Get(OptionalAddressFamily, AddressFamilyDir(parent))
+    if maybe_parent.address_family is not None or not parent:
+        return maybe_parent
+    return await Get(OptionalAddressFamily, AncestorAddressFamilyDir(parent))
+
+
 class BUILDFileEnvVarExtractor(ast.NodeVisitor):
     def __init__(self, filename: str):
         super().__init__()
@@ -275,6 +283,7 @@ class BUILDFileEnvVarExtractor(ast.NodeVisitor):
 @rule(desc="Search for addresses in BUILD files")
 async def parse_address_family(
     parser: Parser,
+    parser_pool: ParserPool,
     bootstrap_status: BootstrapStatus,
     build_file_options: BuildFileOptions,
     prelude_symbols: BuildFilePreludeSymbols,
@@ -307,19 +316,12 @@ async def parse_address_family(
     defaults = BuildFileDefaults({})
     dependents_rules: BuildFileDependencyRules | None = None
     dependencies_rules: BuildFileDependencyRules | None = None
-    parent_dirs = tuple(PurePath(directory.path).parents)
-    if parent_dirs:
-        maybe_parents = await MultiGet(
-            Get(OptionalAddressFamily, AddressFamilyDir(str(parent_dir)))
-            for parent_dir in parent_dirs
-        )
-        for maybe_parent in maybe_parents:
-            if maybe_parent.address_family is not None:
-                family = maybe_parent.address_family
-                defaults = family.defaults
-                dependents_rules = family.dependents_rules
-                dependencies_rules = family.dependencies_rules
-                break
+    maybe_parent = await Get(OptionalAddressFamily, AncestorAddressFamilyDir(directory.path))
+    if maybe_parent.address_family is not None:
+        family = maybe_parent.address_family
+        defaults = family.defaults
+        dependents_rules = family.dependents_rules
+        dependencies_rules = family.dependencies_rules
 
     defaults_parser_state = BuildFileDefaultsParserState.create(
         directory.path, defaults, registered_target_types, union_membership
@@ -360,20 +362,51 @@ async def parse_address_family(
         for fc in digest_contents
     )
 
-    declared_address_maps = [
-        AddressMap.parse(
-            fc.path,
-            fc.content.decode(),
-            parser,
-            prelude_symbols,
-            env_vars,
-            bootstrap_status.in_progress,
+    build_files = [
+        (fc.path, fc.content.decode(), env_vars)
+        for fc, env_vars in zip(digest_contents, all_env_vars)
+    ]
+    pool_result: ParseResult | None = None
+    if parser_pool.enabled and build_files:
+        prelude_digest_contents = await Get(
+            DigestContents,
+            PathGlobs(
+                build_file_options.prelude_globs,
+                glob_match_error_behavior=GlobMatchErrorBehavior.ignore,
+            ),
+        )
+        pool_result = await native_engine.await_future(
+            parser_pool.parse(
+                build_files,
+                [(fc.path, fc.content.decode()) for fc in prelude_digest_contents],
+                bootstrap_status.in_progress,
+                defaults_parser_state,
+                dependents_rules_parser_state,
+                dependencies_rules_parser_state,
+            )
+        )
+    if pool_result is not None:
+        (
+            declared_address_maps,
             defaults_parser_state,
             dependents_rules_parser_state,
             dependencies_rules_parser_state,
+        ) = pool_result
+    else:
+        declared_address_maps = tuple(
+            AddressMap.parse(
+                path,
+                content,
+                parser,
+                prelude_symbols,
+                env_vars,
+                bootstrap_status.in_progress,
+                defaults_parser_state,
+                dependents_rules_parser_state,
+                dependencies_rules_parser_state,
+            )
+            for path, content, env_vars in build_files
         )
-        for fc, env_vars in zip(digest_contents, all_env_vars)
-    ]
 
     # Freeze defaults and dependency rules
     frozen_defaults = defaults_parser_state.get_frozen_defaults()
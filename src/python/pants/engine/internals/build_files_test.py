@@ -18,6 +18,7 @@ from pants.engine.env_vars import CompleteEnvironmentVars, EnvironmentVars, Envi
 from pants.engine.fs import DigestContents, FileContent, PathGlobs
 from pants.engine.internals.build_files import (
     AddressFamilyDir,
+    AncestorAddressFamilyDir,
     BUILDFileEnvVarExtractor,
     BuildFileOptions,
     BuildFileSyntaxError,
@@ -30,6 +31,7 @@ from pants.engine.internals.dep_rules import MaybeBuildFileDependencyRulesImplem
 from pants.engine.internals.mapper import AddressFamily
 from pants.engine.internals.parametrize import Parametrize
 from pants.engine.internals.parser import BuildFilePreludeSymbols, BuildFileSymbolInfo, Parser
+from pants.engine.internals.parser_pool import ParserPool
 from pants.engine.internals.scheduler import ExecutionError
 from pants.engine.internals.session import SessionValues
 from pants.engine.internals.synthetic_targets import (
@@ -65,16 +67,19 @@ from pants.util.strutil import softwrap
 
 def test_parse_address_family_empty() -> None:
     """Test that parsing an empty BUILD file results in an empty AddressFamily."""
+    parser = Parser(
+        build_root="",
+        registered_target_types=RegisteredTargetTypes({}),
+        union_membership=UnionMembership({}),
+        object_aliases=BuildFileAliases(),
+        ignore_unrecognized_symbols=False,
+    )
     optional_af = run_rule_with_mocks(
         parse_address_family,
         rule_args=[
-            Parser(
-                build_root="",
-                registered_target_types=RegisteredTargetTypes({}),
-                union_membership=UnionMembership({}),
-                object_aliases=BuildFileAliases(),
-                ignore_unrecognized_symbols=False,
-            ),
+            parser,
+            # NB: A disabled pool, so BUILD files are parsed in-process.
+            ParserPool(parser, 0),
             BootstrapStatus(in_progress=False),
             BuildFileOptions(("BUILD",)),
             BuildFilePreludeSymbols(FrozenDict(), ()),
@@ -92,7 +97,7 @@ def test_parse_address_family_empty() -> None:
             ),
             MockGet(
                 output_type=OptionalAddressFamily,
-                input_types=(AddressFamilyDir,),
+                input_types=(AncestorAddressFamilyDir,),
                 mock=lambda _: OptionalAddressFamily("/dev"),
             ),
             MockGet(
@@ -115,16 +120,19 @@ def test_parse_address_family_empty() -> None:
 
 
 def test_extend_synthetic_target() -> None:
+    parser = Parser(
+        build_root="",
+        registered_target_types=RegisteredTargetTypes({"resource": ResourceTarget}),
+        union_membership=UnionMembership({}),
+        object_aliases=BuildFileAliases(),
+        ignore_unrecognized_symbols=False,
+    )
     optional_af = run_rule_with_mocks(
         parse_address_family,
         rule_args=[
-            Parser(
-                build_root="",
-                registered_target_types=RegisteredTargetTypes({"resource": ResourceTarget}),
-                union_membership=UnionMembership({}),
-                object_aliases=BuildFileAliases(),
-                ignore_unrecognized_symbols=False,
-            ),
+            parser,
+            # NB: A disabled pool, so BUILD files are parsed in-process.
+            ParserPool(parser, 0),
             BootstrapStatus(in_progress=False),
             BuildFileOptions(("BUILD",)),
             BuildFilePreludeSymbols(FrozenDict(), ()),
@@ -152,7 +160,7 @@ def test_extend_synthetic_target() -> None:
             ),
             MockGet(
                 output_type=OptionalAddressFamily,
-                input_types=(AddressFamilyDir,),
+                input_types=(AncestorAddressFamilyDir,),
                 mock=lambda _: OptionalAddressFamily(
                     "/",
                     address_family=AddressFamily.create(
@@ -574,7 +582,10 @@ def test_resolve_address() -> None:
 @pytest.fixture
 def target_adaptor_rule_runner() -> RuleRunner:
     return RuleRunner(
-        rules=[QueryRule(TargetAdaptor, (TargetAdaptorRequest,))],
+        rules=[
+            QueryRule(TargetAdaptor, (TargetAdaptorRequest,)),
+            QueryRule(OptionalAddressFamily, (AncestorAddressFamilyDir,)),
+        ],
         target_types=[MockTgt, MockGeneratedTarget, MockTargetGenerator],
         objects={"parametrize": Parametrize},
     )
@@ -720,6 +731,40 @@ def test_inherit_defaults(target_adaptor_rule_runner: RuleRunner) -> None:
     assert target_adaptor.kwargs["tags"] == ("root",)
 
 
+def test_inherit_defaults_from_closest_ancestor(target_adaptor_rule_runner: RuleRunner) -> None:
+    target_adaptor_rule_runner.write_files(
+        {
+            "BUILD": """__defaults__(all=dict(tags=["root"]))""",
+            "a/BUILD": """__defaults__(all=dict(tags=["a"]))""",
+            "a/b/c/d/BUILD": "mock_tgt()",
+            "a/b/c/d/e/f/BUILD": "mock_tgt()",
+            # Directories without BUILD files do not affect the inherited defaults.
+            "a/b/c/README": "",
+        }
+    )
+    for spec_path in ("a/b/c/d", "a/b/c/d/e/f"):
+        target_adaptor = target_adaptor_rule_runner.request(
+            TargetAdaptor,
+            [TargetAdaptorRequest(Address(spec_path), description_of_origin="tests")],
+        )
+        assert target_adaptor.kwargs["tags"] == ("a",)
+
+    ancestor = target_adaptor_rule_runner.request(
+        OptionalAddressFamily, [AncestorAddressFamilyDir("a/b/c/d/e/f")]
+    )
+    assert ancestor.path == "a/b/c/d"
+    assert ancestor.address_family is not None
+
+    root_ancestor = target_adaptor_rule_runner.request(
+        OptionalAddressFamily, [AncestorAddressFamilyDir("a")]
+    )
+    assert root_ancestor.path == ""
+    assert root_ancestor.address_family is not None
+    assert target_adaptor_rule_runner.request(
+        OptionalAddressFamily, [AncestorAddressFamilyDir("")]
+    ) == OptionalAddressFamily("")
+
+
 def test_parametrize_defaults(target_adaptor_rule_runner: RuleRunner) -> None:
     target_adaptor_rule_runner.write_files(
         {
@@ -9,7 +9,8 @@ import itertools
 import json
 import logging
 import os.path
-from collections import defaultdict
+from bisect import bisect_left
+from collections import defaultdict, deque
 from dataclasses import dataclass
 from pathlib import PurePath
 from typing import (
@@ -678,11 +679,24 @@ async def find_all_unexpanded_targets() -> AllUnexpandedTargets:
 # -----------------------------------------------------------------------------------------------
 
 
+def _format_cycle(subject: Address, path: tuple[Address, ...]) -> str:
+    return "\n".join((f"-> {a}" if a == subject else f"   {a}") for a in path)
+
+
 class CycleException(Exception):
-    def __init__(self, subject: Address, path: tuple[Address, ...]) -> None:
-        path_string = "\n".join((f"-> {a}" if a == subject else f"   {a}") for a in path)
+    def __init__(
+        self,
+        subject: Address,
+        path: tuple[Address, ...],
+        additional_cycles: tuple[tuple[Address, tuple[Address, ...]], ...] = (),
+    ) -> None:
+        additional_cycles_string = "".join(
+            f"\n\nThe dependency graph also contained a cycle:\n{_format_cycle(*cycle)}"
+            for cycle in additional_cycles
+        )
         super().__init__(
-            f"The dependency graph contained a cycle:\n{path_string}\n\nTo fix this, first verify "
+            f"The dependency graph contained a cycle:\n{_format_cycle(subject, path)}"
+            f"{additional_cycles_string}\n\nTo fix this, first verify "
             "if your code has an actual import cycle. If it does, you likely need to re-architect "
             "your code to avoid the cycle.\n\nIf there is no cycle in your code, then you may need "
             "to use more granular targets. Split up the problematic targets into smaller targets "
@@ -694,55 +708,112 @@ class CycleException(Exception):
         )
         self.subject = subject
         self.path = path
+        self.additional_cycles = additional_cycles
+
+
+def _strongly_connected_components(
+    dependency_mapping: Mapping[Address, tuple[Address, ...]],
+) -> tuple[tuple[Address, ...], ...]:
+    """Compute the strongly connected components of the given graph.
+
+    Because this is Tarjan's SCC, components are returned in reverse topological order.
+    """
+    return tuple(
+        tuple(component)
+        for component in native_engine.strongly_connected_components(
+            list(dependency_mapping.items())
+        )
+    )
+
+
+def _is_cyclic(
+    component: Sequence[Address], dependency_mapping: Mapping[Address, Sequence[Address]]
+) -> bool:
+    return len(component) > 1 or component[0] in dependency_mapping[component[0]]
+
+
+def _find_cycle(
+    entry: Address, members: set[Address], dependency_mapping: Mapping[Address, tuple[Address, ...]]
+) -> tuple[Address, ...]:
+    """Find the shortest cycle from `entry` back to itself which only passes through `members`."""
+    parents: dict[Address, Address] = {}
+    queue = deque([entry])
+    while queue:
+        address = queue.popleft()
+        for dep_address in dependency_mapping[address]:
+            if dep_address == entry:
+                cycle = [address]
+                while cycle[-1] != entry:
+                    cycle.append(parents[cycle[-1]])
+                return (*reversed(cycle), entry)
+            if dep_address in members and dep_address not in parents:
+                parents[dep_address] = address
+                queue.append(dep_address)
+    raise AssertionError(f"The strongly connected component of {entry} did not contain a cycle.")
 
 
 def _detect_cycles(
-    roots: tuple[Address, ...], dependency_mapping: dict[Address, tuple[Address, ...]]
+    roots: tuple[Address, ...],
+    dependency_mapping: Mapping[Address, tuple[Address, ...]],
+    components: Iterable[Sequence[Address]],
 ) -> None:
-    path_stack: OrderedSet[Address] = OrderedSet()
-    visited: set[Address] = set()
-
-    def maybe_report_cycle(address: Address) -> None:
-        # NB: File-level dependencies are cycle tolerant.
-        if address.is_file_target or address not in path_stack:
-            return
-
-        # The path of the cycle is shorter than the entire path to the cycle: if the suffix of
-        # the path representing the cycle contains a file dep, it is ignored.
-        in_cycle = False
-        for path_address in path_stack:
-            if in_cycle and path_address.is_file_target:
-                # There is a file address inside the cycle: do not report it.
-                return
-            elif in_cycle:
-                # Not a file address.
-                continue
-            else:
-                # We're entering the suffix of the path that contains the cycle if we've reached
-                # the address in question.
-                in_cycle = path_address == address
-        # If we did not break out early, it's because there were no file addresses in the cycle.
-        raise CycleException(address, (*path_stack, address))
-
-    def visit(address: Address):
-        if address in visited:
-            maybe_report_cycle(address)
-            return
-        path_stack.add(address)
-        visited.add(address)
+    """Raise a `CycleException` describing all cycles in the graph between non-file targets.
 
+    NB: File-level dependencies are cycle tolerant: a cycle is only reported if none of its members
+    are file targets. So a strongly connected component containing file targets is only reported if
+    its non-file targets form a cycle on their own.
+    """
+    cyclic_members: list[set[Address]] = []
+    for component in components:
+        if not _is_cyclic(component, dependency_mapping):
+            continue
+        if not any(address.is_file_target for address in component):
+            cyclic_members.append(set(component))
+            continue
+        non_file_members = {address for address in component if not address.is_file_target}
+        non_file_mapping = {
+            address: tuple(d for d in dependency_mapping[address] if d in non_file_members)
+            for address in sorted(non_file_members)
+        }
+        cyclic_members.extend(
+            set(sub_component)
+            for sub_component in _strongly_connected_components(non_file_mapping)
+            if _is_cyclic(sub_component, non_file_mapping)
+        )
+    if not cyclic_members:
+        return
+
+    # Find the shortest path from the roots to every target, in order to report how each cycle was
+    # reached, and to report the cycles in a stable order.
+    parents: dict[Address, Address | None] = dict.fromkeys(roots)
+    queue = deque(parents)
+    while queue:
+        address = queue.popleft()
         for dep_address in dependency_mapping[address]:
-            visit(dep_address)
-
-        path_stack.remove(address)
+            if dep_address not in parents:
+                parents[dep_address] = address
+                queue.append(dep_address)
+    discovery_order = {address: i for i, address in enumerate(parents)}
+
+    cycles = []
+    for members in cyclic_members:
+        entry = min(members, key=discovery_order.__getitem__)
+        path_to_entry = []
+        parent = parents[entry]
+        while parent is not None:
+            path_to_entry.append(parent)
+            parent = parents[parent]
+        path = (
+            *reversed(path_to_entry),
+            *_find_cycle(entry, members, dependency_mapping),
+        )
+        cycles.append((discovery_order[entry], entry, path))
+    cycles.sort(key=lambda cycle: cycle[0])
 
-    for root in roots:
-        visit(root)
-        if path_stack:
-            raise AssertionError(
-                f"The stack of visited nodes should have been empty at the end of recursion, "
-                f"but it still contained: {path_stack}"
-            )
+    (_, subject, path), *additional_cycles = cycles
+    raise CycleException(
+        subject, path, tuple((entry, path) for _, entry, path in additional_cycles)
+    )
 
 
 @dataclass(frozen=True)
@@ -756,6 +827,8 @@ class _DependencyMapping:
     mapping: FrozenDict[Address, tuple[Address, ...]]
     visited: FrozenOrderedSet[Target]
     roots_as_targets: Collection[Target]
+    # The strongly connected components of `mapping`, in reverse topological order.
+    components: tuple[tuple[Address, ...], ...]
 
 
 @rule
@@ -810,9 +883,10 @@ async def transitive_dependency_mapping(request: _DependencyMappingRequest) -> _
     # is because expanding from the `Addresses` -> `Targets` may have resulted in generated
     # targets being used, so we need to use `roots_as_targets` to have this expansion.
     # TODO(#12871): Fix this to not be based on generated targets.
-    _detect_cycles(tuple(t.address for t in roots_as_targets), dependency_mapping)
+    components = _strongly_connected_components(dependency_mapping)
+    _detect_cycles(tuple(t.address for t in roots_as_targets), dependency_mapping, components)
     return _DependencyMapping(
-        FrozenDict(dependency_mapping), FrozenOrderedSet(visited), roots_as_targets
+        FrozenDict(dependency_mapping), FrozenOrderedSet(visited), roots_as_targets, components
     )
 
 
@@ -912,13 +986,10 @@ async def coarsened_targets(
         t.address: t for t in [*dependency_mapping.visited, *dependency_mapping.roots_as_targets]
     }
 
-    # Because this is Tarjan's SCC (TODO: update signature to guarantee), components are returned
-    # in reverse topological order. We can thus assume when building the structure shared
-    # `CoarsenedTarget` instances that each instance will already have had its dependencies
-    # constructed.
-    components = native_engine.strongly_connected_components(
-        list(dependency_mapping.mapping.items())
-    )
+    # Because the components are returned in reverse topological order, we can assume when
+    # building the structure shared `CoarsenedTarget` instances that each instance will already
+    # have had its dependencies constructed.
+    components = dependency_mapping.components
 
     coarsened_targets: dict[Address, CoarsenedTarget] = {}
     root_coarsened_targets = []
@@ -1085,6 +1156,61 @@ class Owners(FrozenOrderedSet[Address]):
     pass
 
 
+class _SourcesOwnersIndex:
+    """An index of candidate owning targets, used to match many files against many targets.
+
+    Targets whose `sources` are all literal file paths (which includes all file-level generated
+    targets) are indexed by path, so that finding them is a lookup per file. The remaining targets,
+    which use globs, are only matched against the files below their own directory, since `sources`
+    may not reference files in parent directories.
+    """
+
+    _GLOB_CHARS = frozenset("*?[]{}")
+
+    def __init__(self, candidate_tgts: Iterable[Target]) -> None:
+        self._literal_owners: DefaultDict[str, list[Address]] = defaultdict(list)
+        self._glob_owners: list[Target] = []
+        for tgt in candidate_tgts:
+            filespec = tgt.get(SourcesField).filespec
+            if "excludes" not in filespec and all(
+                self._is_literal(include) for include in filespec["includes"]
+            ):
+                for include in filespec["includes"]:
+                    self._literal_owners[include].append(tgt.address)
+            else:
+                self._glob_owners.append(tgt)
+
+    @classmethod
+    def _is_literal(cls, include: str) -> bool:
+        return not cls._GLOB_CHARS.intersection(include) and os.path.normpath(include) == include
+
+    def matches(self, files: Iterable[str]) -> dict[Address, set[str]]:
+        """Return the matching files for each candidate target which matches any of the files."""
+        result: DefaultDict[Address, set[str]] = defaultdict(set)
+        sorted_files = sorted(files)
+        for file in sorted_files:
+            for address in self._literal_owners.get(file, ()):
+                result[address].add(file)
+
+        for tgt in self._glob_owners:
+            spec_path = tgt.address.spec_path
+            if spec_path:
+                # All files below `spec_path/` sort before `spec_path0`, since `/` precedes `0`.
+                candidate_files = sorted_files[
+                    bisect_left(sorted_files, f"{spec_path}/") : bisect_left(
+                        sorted_files, f"{spec_path}0"
+                    )
+                ]
+            else:
+                candidate_files = sorted_files
+            if not candidate_files:
+                continue
+            matching_files = tgt.get(SourcesField).filespec_matcher.matches(candidate_files)
+            if matching_files:
+                result[tgt.address].update(matching_files)
+        return result
+
+
 @rule(desc="Find which targets own certain files", _masked_types=[EnvironmentName])
 async def find_owners(
     owners_request: OwnersRequest,
@@ -1157,6 +1283,18 @@ async def find_owners(
             candidate_tgts = deleted_candidate_tgts
             sources_set = deleted_files
 
+        if not candidate_tgts:
+            continue
+
+        matches = _SourcesOwnersIndex(candidate_tgts).matches(sources_set)
+        for address, matching_files in matches.items():
+            unmatched_sources -= matching_files
+            result.add(address)
+
+        if not owners_request.match_if_owning_build_file_included_in_sources:
+            continue
+
+        unmatched_candidate_tgts = [tgt for tgt in candidate_tgts if tgt.address not in matches]
         build_file_addresses = await MultiGet(  # noqa: PNT30: requires triage
             Get(
                 BuildFileAddress,
@@ -1164,22 +1302,11 @@ async def find_owners(
                     tgt.address, description_of_origin="<owners rule - cannot trigger>"
                 ),
             )
-            for tgt in candidate_tgts
+            for tgt in unmatched_candidate_tgts
         )
-
-        for candidate_tgt, bfa in zip(candidate_tgts, build_file_addresses):
-            matching_files = set(
-                candidate_tgt.get(SourcesField).filespec_matcher.matches(list(sources_set))
-            )
-
-            if not matching_files and not (
-                owners_request.match_if_owning_build_file_included_in_sources
-                and bfa.rel_path in sources_set
-            ):
-                continue
-
-            unmatched_sources -= matching_files
-            result.add(candidate_tgt.address)
+        for candidate_tgt, bfa in zip(unmatched_candidate_tgts, build_file_addresses):
+            if bfa.rel_path in sources_set:
+                result.add(candidate_tgt.address)
 
     if (
         unmatched_sources
@@ -27,6 +27,7 @@ from pants.engine.internals.graph import (
     TransitiveExcludesNotSupportedError,
     _DependencyMapping,
     _DependencyMappingRequest,
+    _SourcesOwnersIndex,
     _TargetParametrizations,
     warn_deprecated_field_type,
 )
@@ -552,6 +553,7 @@ def assert_failed_cycle(
     root_target_name: str,
     subject_target_name: str,
     path_target_names: Tuple[str, ...],
+    additional_cycles: Tuple[Tuple[str, Tuple[str, ...]], ...] = (),
 ) -> None:
     with pytest.raises(ExecutionError) as e:
         rule_runner.request(
@@ -562,6 +564,10 @@ def assert_failed_cycle(
     assert isinstance(cycle_exception, CycleException)
     assert cycle_exception.subject == Address("", target_name=subject_target_name)
     assert cycle_exception.path == tuple(Address("", target_name=p) for p in path_target_names)
+    assert cycle_exception.additional_cycles == tuple(
+        (Address("", target_name=subject), tuple(Address("", target_name=p) for p in path))
+        for subject, path in additional_cycles
+    )
 
 
 def test_dep_cycle_self(transitive_targets_rule_runner: RuleRunner) -> None:
@@ -625,6 +631,28 @@ def test_dep_cycle_indirect(transitive_targets_rule_runner: RuleRunner) -> None:
     )
 
 
+def test_dep_cycles_all_reported(transitive_targets_rule_runner: RuleRunner) -> None:
+    transitive_targets_rule_runner.write_files(
+        {
+            "BUILD": dedent(
+                """\
+                target(name='t1', dependencies=[':t2', ':t4'])
+                target(name='t2', dependencies=[':t3'])
+                target(name='t3', dependencies=[':t2'])
+                target(name='t4', dependencies=[':t4'])
+                """
+            )
+        }
+    )
+    assert_failed_cycle(
+        transitive_targets_rule_runner,
+        root_target_name="t1",
+        subject_target_name="t2",
+        path_target_names=("t1", "t2", "t3", "t2"),
+        additional_cycles=(("t4", ("t1", "t4", "t4")),),
+    )
+
+
 def test_dep_no_cycle_indirect(transitive_targets_rule_runner: RuleRunner) -> None:
     transitive_targets_rule_runner.write_files(
         {
@@ -980,6 +1008,55 @@ def test_owners_build_file(owners_rule_runner: RuleRunner) -> None:
     )
 
 
+def test_sources_owners_index() -> None:
+    def tgt(spec_path: str, name: str, sources: list[str]) -> Target:
+        return MockTarget(
+            {MockMultipleSourcesField.alias: sources}, Address(spec_path, target_name=name)
+        )
+
+    def generated(spec_path: str, relative_file_path: str) -> Target:
+        return MockGeneratedTarget(
+            {MockSingleSourceField.alias: relative_file_path},
+            Address(spec_path, target_name="gen", relative_file_path=relative_file_path),
+        )
+
+    root = tgt("", "root", ["*.txt"])
+    foo_glob = tgt("src/foo", "glob", ["**/*.txt"])
+    foo_literal = tgt("src/foo", "literal", ["a.txt", "sub/b.txt"])
+    foo_excludes = tgt("src/foo", "excludes", ["a.txt", "sub/b.txt", "!sub/b.txt"])
+    foo_mixed = tgt("src/foo", "mixed", ["a.txt", "*.py"])
+    foo_bar = tgt("src/foo-bar", "glob", ["*.txt"])
+    foo_generated = generated("src/foo", "a.txt")
+
+    index = _SourcesOwnersIndex(
+        [root, foo_glob, foo_literal, foo_excludes, foo_mixed, foo_bar, foo_generated]
+    )
+    files = [
+        "top.txt",
+        "src/foo/a.txt",
+        "src/foo/c.py",
+        "src/foo/sub/b.txt",
+        "src/foo-bar/d.txt",
+        "src/foo.txt",
+    ]
+    assert index.matches(files) == {
+        # A glob at the root only matches its own directory, not every file below it.
+        root.address: {"top.txt"},
+        # Siblings sharing a prefix with the directory are not candidates for its globs.
+        foo_glob.address: {"src/foo/a.txt", "src/foo/sub/b.txt"},
+        foo_literal.address: {"src/foo/a.txt", "src/foo/sub/b.txt"},
+        foo_excludes.address: {"src/foo/a.txt"},
+        foo_mixed.address: {"src/foo/a.txt", "src/foo/c.py"},
+        foo_bar.address: {"src/foo-bar/d.txt"},
+        foo_generated.address: {"src/foo/a.txt"},
+    }
+    assert index.matches(["src/foo/sub/b.txt"]) == {
+        foo_glob.address: {"src/foo/sub/b.txt"},
+        foo_literal.address: {"src/foo/sub/b.txt"},
+    }
+    assert index.matches(["other/a.txt"]) == {}
+
+
 # -----------------------------------------------------------------------------------------------
 # Test file-level target generation and parameterization.
 # -----------------------------------------------------------------------------------------------
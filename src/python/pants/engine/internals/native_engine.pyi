@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import Future
 from datetime import datetime
 from io import RawIOBase
 from typing import (
@@ -575,6 +576,7 @@ async def execute_process(
 async def digest_subset_to_digest(digest_subset: DigestSubset) -> Digest: ...
 async def session_values() -> SessionValues: ...
 async def run_id() -> RunId: ...
+async def await_future(future: Future[T]) -> T: ...
 async def interactive_process(
     process: InteractiveProcess, process_execution_environment: ProcessExecutionEnvironment
 ) -> InteractiveProcessResult: ...
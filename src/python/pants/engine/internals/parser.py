@@ -3,9 +3,14 @@
 
 from __future__ import annotations
 
+import builtins
+import functools
+import hashlib
+import importlib.util
 import inspect
 import itertools
 import logging
+import marshal
 import re
 import threading
 import tokenize
@@ -15,6 +20,7 @@ from dataclasses import InitVar, dataclass, field
 from difflib import get_close_matches
 from io import StringIO
 from pathlib import PurePath
+from types import CodeType
 from typing import Annotated, Any, Callable, Iterable, Mapping, TypeVar
 
 import typing_extensions
@@ -29,6 +35,7 @@ from pants.engine.internals.dep_rules import BuildFileDependencyRulesParserState
 from pants.engine.internals.target_adaptor import TargetAdaptor
 from pants.engine.target import Field, ImmutableValue, RegisteredTargetTypes
 from pants.engine.unions import UnionMembership
+from pants.util.disk_cache import DiskCache
 from pants.util.docutil import doc_url
 from pants.util.frozendict import FrozenDict
 from pants.util.memo import memoized_property
@@ -350,6 +357,43 @@ class Registrar:
         return resolve_field_default
 
 
+class BuildFileCodeCache:
+    """An on-disk cache of compiled BUILD file code objects.
+
+    Entries are keyed by the BUILD file path and content, the interpreter's bytecode version and a
+    caller provided salt (the fingerprint of the registered BUILD file symbols), so the cache may be
+    shared across runs, pantsd restarts and Pants versions.
+    """
+
+    def __init__(self, disk_cache: DiskCache) -> None:
+        self._disk_cache = disk_cache
+
+    @staticmethod
+    def _key(filepath: str, build_file_content: str, salt: str) -> str:
+        hasher = hashlib.sha256(importlib.util.MAGIC_NUMBER)
+        for part in (salt, filepath, build_file_content):
+            hasher.update(b"\0")
+            hasher.update(part.encode())
+        return hasher.hexdigest()
+
+    def compile(self, filepath: str, build_file_content: str, salt: str) -> CodeType:
+        key = self._key(filepath, build_file_content, salt)
+        cached = self._disk_cache.get(key)
+        if cached is not None:
+            try:
+                code = marshal.loads(cached)
+            except (EOFError, ValueError, TypeError):
+                code = None
+            if isinstance(code, CodeType):
+                return code
+            logger.debug(f"Discarding corrupt cached code for {filepath}.")
+            self._disk_cache.delete(key)
+
+        code = compile(build_file_content, filepath, "exec", dont_inherit=True)
+        self._disk_cache.put(key, marshal.dumps(code))
+        return code
+
+
 class Parser:
     def __init__(
         self,
@@ -359,7 +403,16 @@ class Parser:
         union_membership: UnionMembership,
         object_aliases: BuildFileAliases,
         ignore_unrecognized_symbols: bool,
+        code_cache: BuildFileCodeCache | None = None,
     ) -> None:
+        self._init_kwargs = dict(
+            build_root=build_root,
+            registered_target_types=registered_target_types,
+            union_membership=union_membership,
+            object_aliases=object_aliases,
+            ignore_unrecognized_symbols=ignore_unrecognized_symbols,
+            code_cache=code_cache,
+        )
         self._symbols_info, self._parse_state = self._generate_symbols(
             build_root,
             object_aliases,
@@ -367,6 +420,15 @@ class Parser:
             union_membership,
         )
         self.ignore_unrecognized_symbols = ignore_unrecognized_symbols
+        self._code_cache = code_cache
+        self._symbols_fingerprint = hashlib.sha256(
+            "\0".join(sorted(self._symbols_info.info)).encode()
+        ).hexdigest()
+
+    def __reduce__(self):
+        # NB: The symbols close over the (thread local) parse state, so they are regenerated when
+        # unpickling rather than pickled.
+        return functools.partial(Parser, **self._init_kwargs), ()
 
     @staticmethod
     def _generate_symbols(
@@ -419,6 +481,11 @@ class Parser:
     def symbols(self) -> FrozenDict[str, Any]:
         return self._symbols_info.symbols
 
+    def _compile(self, filepath: str, build_file_content: str) -> CodeType:
+        if self._code_cache is None:
+            return compile(build_file_content, filepath, "exec", dont_inherit=True)
+        return self._code_cache.compile(filepath, build_file_content, self._symbols_fingerprint)
+
     def parse(
         self,
         filepath: str,
@@ -446,9 +513,9 @@ class Parser:
 
         if self.ignore_unrecognized_symbols:
             defined_symbols = set()
+            code = self._compile(filepath, build_file_content)
             while True:
                 try:
-                    code = compile(build_file_content, filepath, "exec", dont_inherit=True)
                     exec(code, global_symbols)
                 except NameError as e:
                     bad_symbol = _extract_symbol_from_name_error(e)
@@ -475,7 +542,7 @@ class Parser:
             return self._parse_state.parsed_targets()
 
         try:
-            code = compile(build_file_content, filepath, "exec", dont_inherit=True)
+            code = self._compile(filepath, build_file_content)
             exec(code, global_symbols)
         except NameError as e:
             frame = traceback.extract_tb(e.__traceback__, limit=-1)[0]
@@ -528,6 +595,38 @@ def error_on_imports(build_file_content: str, filepath: str) -> None:
         )
 
 
+def evaluate_prelude_files(
+    parser: Parser, prelude_files: Iterable[tuple[str, str]]
+) -> dict[str, Any]:
+    """Evaluate the given `(path, content)` prelude files, and return the symbols they define."""
+    globals: dict[str, Any] = {
+        # Later entries have precendence replacing conflicting keys from previous entries, so we
+        # start with typing_extensions as the lowest prio source for global values.
+        **{name: getattr(typing_extensions, name) for name in typing_extensions.__all__},
+        **{name: getattr(typing, name) for name in typing.__all__},
+        **{name: getattr(builtins, name) for name in dir(builtins) if name.endswith("Error")},
+        # Ensure the globals for each prelude includes the builtin symbols (E.g. `python_sources`)
+        # and any build file aliases (e.g. from plugins)
+        **parser.symbols,
+    }
+    locals: dict[str, Any] = {}
+    for path, content_str in prelude_files:
+        try:
+            content = compile(content_str, path, "exec", dont_inherit=True)
+            exec(content, globals, locals)
+        except Exception as e:
+            raise Exception(f"Error parsing prelude file {path}: {e}")
+        error_on_imports(content_str, path)
+    # __builtins__ is a dict, so isn't hashable, and can't be put in a FrozenDict.
+    # Fortunately, we don't care about it - preludes should not be able to override builtins, so we just pop it out.
+    # TODO: Give a nice error message if a prelude tries to set and expose a non-hashable value.
+    locals.pop("__builtins__", None)
+    # Ensure preludes can reference each other by populating the shared globals object with references
+    # to the other symbols
+    globals.update(locals)
+    return locals
+
+
 def _extract_symbol_from_name_error(err: NameError) -> str:
     result = re.match(r"^name '(\w*)'", err.args[0])
     if result is None:
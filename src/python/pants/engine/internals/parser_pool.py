@@ -0,0 +1,206 @@
+# Copyright 2025 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import pickle
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Sequence, Tuple
+
+from pants.engine.env_vars import EnvironmentVars
+from pants.engine.internals.defaults import BuildFileDefaultsParserState
+from pants.engine.internals.dep_rules import BuildFileDependencyRulesParserState
+from pants.engine.internals.mapper import AddressMap
+from pants.engine.internals.parser import BuildFilePreludeSymbols, Parser, evaluate_prelude_files
+
+logger = logging.getLogger(__name__)
+
+
+ParseResult = Tuple[
+    Tuple[AddressMap, ...],
+    BuildFileDefaultsParserState,
+    "BuildFileDependencyRulesParserState | None",
+    "BuildFileDependencyRulesParserState | None",
+]
+
+
+class ParserPool:
+    """Evaluates BUILD files in a pool of worker processes.
+
+    BUILD file evaluation is pure Python, and so is limited to a single core by the GIL regardless
+    of how many engine threads request it. The pool is created alongside the `Scheduler`, by which
+    time the engine's threads (and in pantsd, the daemon's) are running: the workers are therefore
+    started with the `forkserver` start method rather than forked from this process, which could
+    leave a worker holding a lock that was held by one of those threads. The `Parser` is pickled to
+    the workers (and its symbols regenerated there), and the workers evaluate the prelude files
+    themselves, since prelude symbols cannot be pickled. Only the BUILD and prelude file contents,
+    the parser states and the resulting `AddressMap`s cross the process boundary.
+
+    Workers are never restarted: if the pool breaks, BUILD files are evaluated in-process from then
+    on. The pool must be shut down when its `Scheduler` is discarded.
+    """
+
+    def __init__(self, parser: Parser, max_workers: int) -> None:
+        self._lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+        if max_workers <= 0:
+            return
+        try:
+            initargs = (pickle.dumps(parser),)
+        except Exception as e:
+            # E.g. a plugin registered a BUILD file symbol which cannot be pickled.
+            logger.warning(
+                f"The BUILD file parser cannot be sent to worker processes, so BUILD files will be "
+                f"parsed in-process: {e!r}"
+            )
+            return
+        mp_context = multiprocessing.get_context("forkserver")
+        # NB: The fork server imports the parser (and so most of the engine) once, rather than each
+        # worker importing it.
+        mp_context.set_forkserver_preload([__name__])
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=initargs,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self._executor is not None
+
+    def parse(
+        self,
+        build_files: Sequence[tuple[str, str, EnvironmentVars]],
+        prelude_files: Sequence[tuple[str, str]],
+        is_bootstrap: bool,
+        defaults: BuildFileDefaultsParserState,
+        dependents_rules: BuildFileDependencyRulesParserState | None,
+        dependencies_rules: BuildFileDependencyRulesParserState | None,
+    ) -> Future[ParseResult | None]:
+        """Parse the BUILD files of a single directory in a worker process.
+
+        The returned future does not block: use `native_engine.await_future` to await it from a
+        `@rule`. The parser states are not modified: updated copies of them are returned instead.
+
+        Resolves to None if the BUILD files could not be parsed in the pool, in which case the
+        caller should parse them in-process. That includes errors in the BUILD files themselves,
+        which are then raised in-process with the usual context.
+        """
+        result: Future[ParseResult | None] = Future()
+        if self._executor is None:
+            result.set_result(None)
+            return result
+
+        description = ", ".join(path for path, _, _ in build_files)
+        try:
+            future = self._executor.submit(
+                _parse_in_worker,
+                tuple(build_files),
+                tuple(prelude_files),
+                is_bootstrap,
+                defaults,
+                dependents_rules,
+                dependencies_rules,
+            )
+        except Exception as e:
+            # The pool is broken (e.g. a worker was killed) or shut down: it is not restarted.
+            self._disable(e)
+            result.set_result(None)
+            return result
+
+        def on_done(future: Future[ParseResult | None]) -> None:
+            if future.cancelled():
+                # The pool was shut down.
+                result.set_result(None)
+                return
+            try:
+                result.set_result(future.result())
+            except Exception as e:
+                if isinstance(e, BrokenProcessPool):
+                    self._disable(e)
+                elif self.enabled:
+                    logger.warning(
+                        f"Failed to parse {description} in the BUILD file parser pool, falling "
+                        f"back to parsing in-process: {e!r}"
+                    )
+                result.set_result(None)
+
+        future.add_done_callback(on_done)
+        return result
+
+    def shutdown(self) -> None:
+        """Stop the workers, without waiting for them.
+
+        Pending parses resolve to None, and so are completed in-process.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _disable(self, e: Exception) -> None:
+        if not self.enabled:
+            return
+        logger.warning(
+            f"The BUILD file parser pool failed, so BUILD files will be parsed in-process from now "
+            f"on: {e!r}"
+        )
+        self.shutdown()
+
+
+# The state of a worker process: the parser is unpickled when the worker starts, and the most
+# recently used preludes are evaluated in the worker.
+_worker_parser: Parser | None = None
+_worker_prelude: tuple[tuple[tuple[str, str], ...], BuildFilePreludeSymbols] | None = None
+
+
+def _init_worker(pickled_parser: bytes) -> None:
+    global _worker_parser
+    _worker_parser = pickle.loads(pickled_parser)
+
+
+def _worker_prelude_symbols(prelude_files: tuple[tuple[str, str], ...]) -> BuildFilePreludeSymbols:
+    global _worker_prelude
+    assert _worker_parser is not None
+    if _worker_prelude is None or _worker_prelude[0] != prelude_files:
+        # NB: The env vars referenced by the preludes are only used to compute the `env_vars` of
+        # each BUILD file, which is done before the BUILD files are sent to the pool.
+        symbols = evaluate_prelude_files(_worker_parser, prelude_files)
+        _worker_prelude = (prelude_files, BuildFilePreludeSymbols.create(symbols, ()))
+    return _worker_prelude[1]
+
+
+def _parse_in_worker(
+    build_files: tuple[tuple[str, str, EnvironmentVars], ...],
+    prelude_files: tuple[tuple[str, str], ...],
+    is_bootstrap: bool,
+    defaults: BuildFileDefaultsParserState,
+    dependents_rules: BuildFileDependencyRulesParserState | None,
+    dependencies_rules: BuildFileDependencyRulesParserState | None,
+) -> ParseResult | None:
+    assert _worker_parser is not None
+    try:
+        prelude_symbols = _worker_prelude_symbols(prelude_files)
+        address_maps = tuple(
+            AddressMap.parse(
+                path,
+                content,
+                _worker_parser,
+                prelude_symbols,
+                env_vars,
+                is_bootstrap,
+                defaults,
+                dependents_rules,
+                dependencies_rules,
+            )
+            for path, content, env_vars in build_files
+        )
+    except Exception:
+        # An error in the BUILD files (or preludes), which the caller will raise in-process.
+        return None
+    return address_maps, defaults, dependents_rules, dependencies_rules
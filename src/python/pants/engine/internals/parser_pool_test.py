@@ -0,0 +1,112 @@
+# Copyright 2025 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+from pants.build_graph.build_file_aliases import BuildFileAliases
+from pants.core.target_types import GenericTarget
+from pants.engine.env_vars import EnvironmentVars
+from pants.engine.internals.defaults import BuildFileDefaults, BuildFileDefaultsParserState
+from pants.engine.internals.mapper import AddressMap
+from pants.engine.internals.parser import BuildFilePreludeSymbols, Parser, evaluate_prelude_files
+from pants.engine.internals.parser_pool import ParserPool
+from pants.engine.target import RegisteredTargetTypes
+from pants.engine.unions import UnionMembership
+
+registered_target_types = RegisteredTargetTypes({"target": GenericTarget})
+union_membership = UnionMembership({})
+
+
+@pytest.fixture
+def parser() -> Parser:
+    return Parser(
+        build_root="",
+        registered_target_types=registered_target_types,
+        union_membership=union_membership,
+        object_aliases=BuildFileAliases(),
+        ignore_unrecognized_symbols=False,
+    )
+
+
+@pytest.fixture
+def defaults() -> BuildFileDefaultsParserState:
+    return BuildFileDefaultsParserState.create(
+        "dir", BuildFileDefaults({}), registered_target_types, union_membership
+    )
+
+
+def test_parse_in_pool(parser: Parser, defaults: BuildFileDefaultsParserState) -> None:
+    # The workers are started before the prelude exists, and evaluate it themselves.
+    pool = ParserPool(parser, 2)
+    assert pool.enabled
+
+    prelude_files = [("prelude.py", "def macro(name):\n    target(name=name, tags=['macro'])\n")]
+    build_files = [
+        (
+            "dir/BUILD",
+            "__defaults__(all=dict(tags=['a']))\ntarget(name='one')",
+            EnvironmentVars({}),
+        ),
+        ("dir/BUILD.other", "target(name='two', description=env('DESC'))", EnvironmentVars({})),
+        ("dir/BUILD.macro", "macro(name='three')", EnvironmentVars({})),
+    ]
+    result = pool.parse(build_files, prelude_files, False, defaults, None, None).result(timeout=60)
+    assert result is not None
+    address_maps, pool_defaults, dependents_rules, dependencies_rules = result
+
+    prelude_symbols = BuildFilePreludeSymbols.create(
+        evaluate_prelude_files(parser, prelude_files), ()
+    )
+    expected_address_maps = tuple(
+        AddressMap.parse(
+            path, content, parser, prelude_symbols, env_vars, False, defaults, None, None
+        )
+        for path, content, env_vars in build_files
+    )
+    assert address_maps == expected_address_maps
+    assert pool_defaults.get_frozen_defaults() == defaults.get_frozen_defaults()
+    assert dependents_rules is None
+    assert dependencies_rules is None
+
+    # Errors in BUILD files are not raised by the pool, but are left for the caller to raise
+    # in-process.
+    build_files = [("dir/BUILD", "target(", EnvironmentVars({}))]
+    assert pool.parse(build_files, (), False, defaults, None, None).result(timeout=60) is None
+    assert pool.enabled
+
+
+def test_parse_in_pool_failure(
+    parser: Parser, defaults: BuildFileDefaultsParserState, caplog
+) -> None:
+    # A value defined by a prelude cannot be pickled to be sent back from the worker.
+    pool = ParserPool(parser, 1)
+    prelude_files = [("prelude.py", "def f():\n    pass\n")]
+    build_files = [("dir/BUILD", "target(name='one', tags=[f])", EnvironmentVars({}))]
+    with caplog.at_level(logging.WARNING):
+        future = pool.parse(build_files, prelude_files, False, defaults, None, None)
+        assert future.result(timeout=60) is None
+    assert "Failed to parse dir/BUILD in the BUILD file parser pool" in caplog.text
+    assert pool.enabled
+
+
+def test_shutdown(parser: Parser, defaults: BuildFileDefaultsParserState, caplog) -> None:
+    pool = ParserPool(parser, 1)
+    build_files = [("dir/BUILD", "target(name='one')", EnvironmentVars({}))]
+    assert pool.parse(build_files, (), False, defaults, None, None).result(timeout=60) is not None
+
+    with caplog.at_level(logging.WARNING):
+        pool.shutdown()
+        assert not pool.enabled
+        assert pool.parse(build_files, (), False, defaults, None, None).result() is None
+    assert not caplog.records
+
+
+def test_disabled_pool(parser: Parser, defaults: BuildFileDefaultsParserState) -> None:
+    pool = ParserPool(parser, 0)
+    assert not pool.enabled
+    build_files = [("dir/BUILD", "target(name='one')", EnvironmentVars({}))]
+    assert pool.parse(build_files, (), False, defaults, None, None).result() is None
@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import re
+from pathlib import Path
 from textwrap import dedent
 from typing import Any
 
@@ -15,6 +16,7 @@ from pants.engine.addresses import Address
 from pants.engine.env_vars import EnvironmentVars
 from pants.engine.internals.defaults import BuildFileDefaults, BuildFileDefaultsParserState
 from pants.engine.internals.parser import (
+    BuildFileCodeCache,
     BuildFilePreludeSymbols,
     ParseError,
     Parser,
@@ -23,6 +25,7 @@ from pants.engine.internals.parser import (
 from pants.engine.target import InvalidFieldException, RegisteredTargetTypes, StringField
 from pants.engine.unions import UnionMembership
 from pants.testutil.pytest_util import no_exception
+from pants.util.disk_cache import DiskCache
 from pants.util.docutil import doc_url
 from pants.util.frozendict import FrozenDict
 from pants.util.strutil import softwrap
@@ -255,3 +258,49 @@ def test_unrecognized_symbol_in_prelude(
         'build_file_dir', 'caof', 'env', 'macro', 'obj']
         """
     )
+
+
+def test_code_cache(tmp_path: Path, defaults_parser_state: BuildFileDefaultsParserState) -> None:
+    def parse(content: str) -> list[str]:
+        parser = Parser(
+            build_root="",
+            registered_target_types=RegisteredTargetTypes({"tgt": GenericTarget}),
+            union_membership=UnionMembership({}),
+            object_aliases=BuildFileAliases(),
+            ignore_unrecognized_symbols=False,
+            code_cache=BuildFileCodeCache(DiskCache(str(tmp_path), 1_000_000)),
+        )
+        targets = parser.parse(
+            "dir/BUILD",
+            content,
+            BuildFilePreludeSymbols.create({}, ()),
+            EnvironmentVars({}),
+            False,
+            defaults_parser_state,
+            dependents_rules=None,
+            dependencies_rules=None,
+        )
+        return [tgt.name for tgt in targets]
+
+    def cache_entries() -> list[Path]:
+        return sorted(p for p in tmp_path.rglob("*") if p.is_file())
+
+    assert parse("tgt(name='a')") == ["a"]
+    assert len(cache_entries()) == 1
+
+    # A fresh parser re-uses the cached code object.
+    assert parse("tgt(name='a')") == ["a"]
+    assert len(cache_entries()) == 1
+
+    # Changed content is a new cache entry.
+    assert parse("tgt(name='b')") == ["b"]
+    assert len(cache_entries()) == 2
+
+    # Corrupt entries are discarded and replaced.
+    for entry in cache_entries():
+        entry.write_bytes(b"not marshalled code")
+    assert parse("tgt(name='a')") == ["a"]
+    assert sorted(entry.read_bytes() == b"not marshalled code" for entry in cache_entries()) == [
+        False,
+        True,
+    ]
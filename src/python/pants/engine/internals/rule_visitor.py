@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 import ast
+import builtins
+import hashlib
 import inspect
 import itertools
+import json
 import logging
 import sys
 from contextlib import contextmanager
 from functools import partial
-from typing import Any, Callable, Iterator, List, Sequence, get_type_hints
+from typing import Any, Callable, Iterable, Iterator, List, Sequence, get_type_hints
 
 import typing_extensions
 
@@ -21,9 +24,11 @@ from pants.engine.internals.selectors import (
     GetParseError,
     MultiGet,
 )
+from pants.util.disk_cache import DiskCache, persistent_cache
 from pants.util.memo import memoized
 from pants.util.strutil import softwrap
 from pants.util.typing import patch_forward_ref
+from pants.version import VERSION
 
 logger = logging.getLogger(__name__)
 patch_forward_ref()
@@ -65,12 +70,21 @@ class _TypeStack:
         #  gather all rules in a module and assign them ids, and only then run
         #  collect_awaitables() on those rules.
         self.push({func.__name__: func})
+        # Names resolved from the frames above rather than from rule-local frames, which determine
+        # whether a cached analysis is still valid.
+        self._static_depth = len(self._stack)
+        self.static_lookups: dict[str, Any] = {}
 
     def __getitem__(self, name: str) -> Any:
-        for ns in reversed(self._stack):
+        for depth in range(len(self._stack) - 1, -1, -1):
+            ns = self._stack[depth]
             if name in ns:
+                if depth < self._static_depth:
+                    self.static_lookups[name] = ns[name]
                 return ns[name]
-        return self.root.__builtins__.get(name, None)
+        value = self.root.__builtins__.get(name, None)
+        self.static_lookups[name] = value
+        return value
 
     def __setitem__(self, name: str, value: Any) -> None:
         self._stack[-1][name] = value
@@ -145,6 +159,10 @@ class _AwaitableCollector(ast.NodeVisitor):
 
         self.types = _TypeStack(func)
         self.awaitables: List[AwaitableConstraints] = []
+        # Rule helpers whose awaitables were inlined, as `(start, end, helper)` slices of
+        # `self.awaitables`, and every object consulted during the analysis.
+        self.helper_calls: List[tuple[int, int, Callable]] = []
+        self.consulted: List[Any] = []
         self.visit(ast.parse(source))
 
     def _format(self, node: ast.AST, msg: str) -> str:
@@ -168,8 +186,10 @@ class _AwaitableCollector(ast.NodeVisitor):
 
         name = names.pop()
         result = self.types[name]
+        self.consulted.append(result)
         while result is not None and names:
             result = _lookup_annotation(result, names.pop())
+            self.consulted.append(result)
         return result
 
     def _missing_type_error(self, node: ast.AST, context: str) -> str:
@@ -314,7 +334,9 @@ class _AwaitableCollector(ast.NodeVisitor):
                 self.awaitables.append(self._get_byname_awaitable(rule_id, func, call_node))
             elif inspect.iscoroutinefunction(func) or _returns_awaitable(func):
                 # Is a call to a "rule helper".
+                start = len(self.awaitables)
                 self.awaitables.extend(collect_awaitables(func))
+                self.helper_calls.append((start, len(self.awaitables), func))
 
         self.generic_visit(call_node)
 
@@ -389,6 +411,208 @@ class _AwaitableCollector(ast.NodeVisitor):
                 )
 
 
+def _object_ref(obj: Any) -> str:
+    """A string which identifies a module, class or function by where it is defined."""
+    if inspect.ismodule(obj):
+        return f"module:{obj.__name__}"
+    if inspect.isclass(obj) or inspect.isfunction(obj):
+        return f"{obj.__module__}:{obj.__qualname__}"
+    if obj is None:
+        return "None"
+    return f"instance:{_object_ref(type(obj))}"
+
+
+def _resolve_ref(ref: str) -> Any:
+    """The class or function identified by the given `_object_ref`, or None.
+
+    Modules are not imported: anything that a rule refers to was already imported by its module.
+    """
+    module_name, _, qualname = ref.partition(":")
+    result: Any = sys.modules.get(module_name)
+    for name in qualname.split("."):
+        result = getattr(result, name, None)
+    return result
+
+
+def _dependency_modules(obj: Any) -> Iterator[str]:
+    """The names of the modules whose source determines what the rule visitor derives from obj."""
+    if inspect.ismodule(obj):
+        yield obj.__name__
+        return
+    module = getattr(obj, "__module__", None)
+    if isinstance(module, str):
+        yield module
+    cls = obj if inspect.isclass(obj) else type(obj)
+    for base in cls.__mro__:
+        yield base.__module__
+
+
+@memoized
+def _source_fingerprint(path: str) -> str | None:
+    try:
+        with open(path, "rb") as fp:
+            return hashlib.sha256(fp.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def _module_source(module_name: str) -> str | None:
+    # NB: Native extensions are covered by the Pants version instead, and are too large to hash.
+    path = getattr(sys.modules.get(module_name), "__file__", None)
+    return path if path and path.endswith(".py") else None
+
+
+def _static_lookup(func: Callable, name: str) -> Any:
+    """Equivalent to the lookup of name by `_TypeStack` for a function without closures."""
+    if name == func.__name__:
+        return func
+    module_dict = sys.modules[func.__module__].__dict__
+    if name in module_dict:
+        return module_dict[name]
+    return builtins.__dict__.get(name)
+
+
+class _AwaitablesCache:
+    """A persistent cache of the awaitables that the rule visitor finds in rules and rule helpers.
+
+    Entries are keyed by the source of the function's module and its qualified name. Since the
+    analysis also depends on the objects that the function refers to, each entry records:
+      * the fingerprints of the sources of the modules of all objects which were consulted
+      * the objects to which names in the module resolved
+    and is only used if both are unchanged. Types are stored by reference, and rule helpers are
+    stored as calls to `collect_awaitables`, so that their own entries are validated separately.
+    """
+
+    _VERSION = 1
+
+    def __init__(self, disk_cache: DiskCache) -> None:
+        self._disk_cache = disk_cache
+
+    def key(self, func: Callable) -> str | None:
+        if func.__closure__ or "<locals>" in func.__qualname__:
+            return None
+        module_source = _module_source(func.__module__)
+        module_fingerprint = module_source and _source_fingerprint(module_source)
+        if not module_fingerprint:
+            return None
+        h = hashlib.sha256()
+        h.update(f"{self._VERSION} {VERSION} {sys.version}\n".encode())
+        h.update(f"{func.__module__}:{func.__qualname__} {module_fingerprint}\n".encode())
+        return h.hexdigest()
+
+    def get(self, key: str, func: Callable) -> List[AwaitableConstraints] | None:
+        cached = self._disk_cache.get(key)
+        if cached is None:
+            return None
+        try:
+            entry = json.loads(cached)
+            if any(_source_fingerprint(path) != fp for path, fp in entry["sources"].items()):
+                return None
+            if any(
+                _object_ref(_static_lookup(func, name)) != ref
+                for name, ref in entry["names"].items()
+            ):
+                return None
+            awaitables: List[AwaitableConstraints] = []
+            for item in entry["items"]:
+                if item[0] == "helper":
+                    helper = _resolve_ref(item[1])
+                    if helper is None:
+                        return None
+                    awaitables.extend(collect_awaitables(helper))
+                    continue
+                _, rule_id, output_ref, explicit_args_arity, input_refs, is_effect = item
+                types = [_resolve_ref(ref) for ref in (output_ref, *input_refs)]
+                if not all(isinstance(t, type) for t in types):
+                    return None
+                awaitables.append(
+                    AwaitableConstraints(
+                        rule_id, types[0], explicit_args_arity, tuple(types[1:]), is_effect
+                    )
+                )
+            return awaitables
+        except (ValueError, KeyError, TypeError):
+            logger.debug(f"Discarding corrupt cached awaitables for {func.__qualname__}.")
+            self._disk_cache.delete(key)
+            return None
+
+    def put(self, key: str, collector: _AwaitableCollector) -> None:
+        items: list[list[Any]] = []
+
+        def add_awaitables(awaitables: Iterable[AwaitableConstraints]) -> None:
+            for awaitable in awaitables:
+                items.append(
+                    [
+                        "awaitable",
+                        awaitable.rule_id,
+                        self._checked_ref(awaitable.output_type),
+                        awaitable.explicit_args_arity,
+                        [self._checked_ref(t) for t in awaitable.input_types],
+                        awaitable.is_effect,
+                    ]
+                )
+
+        index = 0
+        for start, end, helper in collector.helper_calls:
+            add_awaitables(collector.awaitables[index:start])
+            items.append(["helper", self._checked_ref(helper)])
+            index = end
+        add_awaitables(collector.awaitables[index:])
+
+        for item in items:
+            refs = [item[1]] if item[0] == "helper" else [item[2], *item[4]]
+            if None in refs:
+                # Some type or helper cannot be referred to by name, so the entry would not be
+                # usable.
+                return
+
+        sources = {}
+        for obj in itertools.chain(
+            (collector.func,), collector.consulted, collector.types.static_lookups.values()
+        ):
+            for module_name in _dependency_modules(obj):
+                path = _module_source(module_name)
+                if path:
+                    sources[path] = _source_fingerprint(path)
+        entry = {
+            "sources": sources,
+            "names": {
+                name: _object_ref(value) for name, value in collector.types.static_lookups.items()
+            },
+            "items": items,
+        }
+        self._disk_cache.put(key, json.dumps(entry, sort_keys=True).encode())
+
+    @staticmethod
+    def _checked_ref(obj: Any) -> str | None:
+        """A reference to the given object, or None if it could not be resolved back to it."""
+        ref = _object_ref(obj)
+        return ref if _resolve_ref(ref) is obj else None
+
+
+_awaitables_cache: _AwaitablesCache | None = None
+
+
+def configure_awaitables_cache(caches_dir: str, max_size_bytes: int) -> None:
+    """Configure the persistent cache used by `collect_awaitables`, below `caches_dir`.
+
+    This must be called before the modules containing rules are imported for it to have an effect.
+    Passing a `max_size_bytes` of 0 disables the cache.
+    """
+    global _awaitables_cache
+    disk_cache = persistent_cache(caches_dir, "rule_awaitables", max_size_bytes)
+    _awaitables_cache = _AwaitablesCache(disk_cache) if disk_cache is not None else None
+
+
 @memoized
 def collect_awaitables(func: Callable) -> List[AwaitableConstraints]:
-    return _AwaitableCollector(func).awaitables
+    cache = _awaitables_cache
+    key = cache.key(func) if cache is not None else None
+    if cache is not None and key is not None:
+        cached = cache.get(key, func)
+        if cached is not None:
+            return cached
+    collector = _AwaitableCollector(func)
+    if cache is not None and key is not None:
+        cache.put(key, collector)
+    return collector.awaitables
@@ -3,12 +3,14 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from typing import Iterable
 
 import pytest
 
 from pants.base.exceptions import RuleTypeError
+from pants.engine.internals import rule_visitor
 from pants.engine.internals.rule_visitor import collect_awaitables
 from pants.engine.internals.selectors import Get, GetParseError, MultiGet
 from pants.engine.rules import implicitly, rule
@@ -369,3 +371,36 @@ def test_union_types() -> None:
         Get(str, mc.b)
 
     assert_awaitables(somerule, [(str, bool)])
+
+
+@pytest.fixture
+def awaitables_cache(tmp_path) -> Iterable[None]:
+    rule_visitor.configure_awaitables_cache(str(tmp_path), 1_000_000)
+    collect_awaitables.clear()
+    yield
+    rule_visitor.configure_awaitables_cache(str(tmp_path), 0)
+    collect_awaitables.clear()
+
+
+def test_persistent_cache(awaitables_cache, monkeypatch) -> None:
+    expected = collect_awaitables(_top_helper)
+    assert [(get.output_type, get.input_types) for get in expected] == [
+        (str, (int,)),
+        (int, (str,)),
+    ]
+
+    def fail(func):
+        raise AssertionError(f"Should not have analyzed {func.__name__}.")
+
+    collect_awaitables.clear()
+    with monkeypatch.context() as m:
+        m.setattr(rule_visitor, "_AwaitableCollector", fail)
+        assert collect_awaitables(_top_helper) == expected
+
+    # Changing what a name in the module resolves to invalidates the cached entry.
+    collect_awaitables.clear()
+    monkeypatch.setattr(sys.modules[__name__], "INT", bool)
+    assert [(get.output_type, get.input_types) for get in collect_awaitables(_top_helper)] == [
+        (str, (bool,)),
+        (bool, (str,)),
+    ]
@@ -69,7 +69,12 @@ from pants.util.collections import ensure_list, ensure_str_list
 from pants.util.dirutil import fast_relpath
 from pants.util.docutil import bin_name, doc_url
 from pants.util.frozendict import FrozenDict
-from pants.util.memo import memoized_classproperty, memoized_method, memoized_property
+from pants.util.memo import (
+    memoized,
+    memoized_classproperty,
+    memoized_method,
+    memoized_property,
+)
 from pants.util.ordered_set import FrozenOrderedSet
 from pants.util.strutil import bullet_list, help_text, pluralize, softwrap
 
@@ -243,6 +248,62 @@ class FieldDefaults:
 # the precise Field returned.
 _F = TypeVar("_F", bound=Field)
 
+# Field instances which are shared between targets: see `_create_field`. The cache is cleared when
+# it reaches its maximum size, which bounds the memory used by raw values which are never repeated.
+_interned_fields: dict[tuple[type[Field], Any], Field] = {}
+_MAX_INTERNED_FIELDS = 100_000
+
+
+@memoized
+def _is_internable_field_type(field_type: type[Field]) -> bool:
+    """Whether the value of the field type is known to not depend on the address of its target.
+
+    That is the case for fields which do not store their address, and which compute their value
+    using one of the field templates in this module, which only use the address in error messages.
+    """
+    compute_value = getattr(field_type.compute_value, "__func__", None)
+    return (
+        not issubclass(field_type, AsyncFieldMixin)
+        and field_type.__new__ is Field.__new__
+        and field_type.__init__ is Field.__init__
+        and getattr(compute_value, "__module__", None) == __name__
+    )
+
+
+def _field_interning_key(field_type: type[Field], raw_value: Any) -> Any | None:
+    if raw_value is NO_VALUE:
+        return (field_type, NO_VALUE)
+    # Fields which are explicitly set may log a deprecation warning for their target.
+    if field_type.removal_version is not None:
+        return None
+    # NB: The type is part of the key so that e.g. `True` and `1` are not conflated.
+    if type(raw_value) in (str, int, bool, type(None)):
+        return (field_type, type(raw_value), raw_value)
+    if type(raw_value) in (list, tuple) and all(type(v) is str for v in raw_value):
+        return (field_type, type(raw_value), tuple(raw_value))
+    return None
+
+
+def _create_field(field_type: type[_F], raw_value: Any, address: Address) -> _F:
+    """Create a field for a target, sharing an existing instance if one is known to be equivalent.
+
+    Most targets leave most of their fields at their defaults, and target generators give the
+    targets they generate the same values, so sharing immutable field instances between targets
+    greatly reduces the memory used by targets.
+    """
+    if not _is_internable_field_type(field_type):
+        return field_type(raw_value, address)
+    key = _field_interning_key(field_type, raw_value)
+    if key is None:
+        return field_type(raw_value, address)
+    field = _interned_fields.get(key)
+    if field is None:
+        field = field_type(raw_value, address)
+        if len(_interned_fields) >= _MAX_INTERNED_FIELDS:
+            _interned_fields.clear()
+        _interned_fields[key] = field
+    return cast(_F, field)
+
 
 @dataclass(frozen=True)
 class Target:
@@ -264,7 +325,17 @@ class Target:
     deprecated_alias: ClassVar[str | None] = None
     deprecated_alias_removal_version: ClassVar[str | None] = None
 
-    # These get calculated in the constructor
+    # These get calculated in the constructor.
+    # NB: They are stored in slots, so that the `__dict__` of a target (subclasses still have one)
+    # is never allocated. See `__getstate__` for copying and pickling.
+    __slots__ = (
+        "address",
+        "field_values",
+        "residence_dir",
+        "name_explicitly_set",
+        "description_of_origin",
+        "origin_sources_blocks",
+    )
     address: Address
     field_values: FrozenDict[type[Field], Field]
     residence_dir: str
@@ -382,13 +453,13 @@ class Target:
                     f"the target type `{self.alias}`: {sorted(valid_aliases)}.",
                 )
             field_type = aliases_to_field_types[alias]
-            field_values[field_type] = field_type(value, address)
+            field_values[field_type] = _create_field(field_type, value, address)
 
         # For undefined fields, mark the raw value as missing.
         for field_type in all_field_types:
             if field_type in field_values:
                 continue
-            field_values[field_type] = field_type(NO_VALUE, address)
+            field_values[field_type] = _create_field(field_type, NO_VALUE, address)
         return FrozenDict(
             sorted(
                 field_values.items(),
@@ -436,6 +507,17 @@ class Target:
     def __hash__(self) -> int:
         return hash((self.__class__, self.address, self.residence_dir, self.field_values))
 
+    def __getstate__(self) -> dict[str, Any]:
+        # NB: The default state of an object with slots is restored with `setattr`, which a frozen
+        # dataclass does not allow.
+        state = dict(getattr(self, "__dict__", {}))
+        state.update((name, getattr(self, name)) for name in Target.__slots__)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
     def __eq__(self, other: Union[Target, Any]) -> bool:
         if not isinstance(other, Target):
             return NotImplemented
@@ -0,0 +1,77 @@
+# Copyright 2025 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import tracemalloc
+from typing import Any
+
+import pytest
+
+from pants.engine import target
+from pants.engine.addresses import Address
+from pants.engine.target import BoolField, IntField, StringField, StringSequenceField, Target
+
+_TARGET_COUNT = 10_000
+_MAX_SHARED_RATIO = 0.8
+
+
+class ExampleBool(BoolField):
+    alias = "example_bool"
+    default = False
+
+
+class ExampleInt(IntField):
+    alias = "example_int"
+    default = 0
+
+
+class ExampleString(StringField):
+    alias = "example_string"
+
+
+class ExampleTags(StringSequenceField):
+    alias = "example_tags"
+
+
+class ExampleTarget(Target):
+    alias = "example"
+    core_fields = (ExampleBool, ExampleInt, ExampleString, ExampleTags)
+
+
+def _bytes_per_target() -> float:
+    # As for generated targets, explicitly set values are shared by all of the targets.
+    tags = ["a", "b"]
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        targets = [
+            ExampleTarget(
+                {"example_string": "value", "example_tags": tags},
+                Address("src", target_name="example", generated_name=str(i)),
+            )
+            for i in range(_TARGET_COUNT)
+        ]
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(targets) == _TARGET_COUNT
+    return (after - before) / _TARGET_COUNT
+
+
+def test_bench_target_memory(monkeypatch: pytest.MonkeyPatch) -> None:
+    shared = _bytes_per_target()
+
+    def create_field(field_type: type[target.Field], raw_value: Any, address: Address) -> Any:
+        return field_type(raw_value, address)
+
+    monkeypatch.setattr(target, "_create_field", create_field)
+    unshared = _bytes_per_target()
+
+    # Sharing fields saves about a third of the memory of each of these targets: require at least
+    # a fifth, to allow for differences between interpreter versions.
+    ratio = shared / unshared
+    assert ratio <= _MAX_SHARED_RATIO, (
+        f"{unshared:.0f} bytes per target before sharing fields, {shared:.0f} after: "
+        f"{ratio:.2f} of the original, expected at most {_MAX_SHARED_RATIO}"
+    )
@@ -1,8 +1,10 @@
 # Copyright 2020 Pants project contributors (see CONTRIBUTORS.md).
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
+import copy
 import re
 import string
+from abc import ABC
 from collections import namedtuple
 from dataclasses import FrozenInstanceError, dataclass
 from enum import Enum
@@ -159,6 +161,50 @@ def test_field_and_target_eq() -> None:
     assert hash(tgt) != hash(subclass_tgt)
 
 
+def test_fields_shared_between_targets() -> None:
+    tgt1 = FortranTarget({"version": "dev0"}, Address("", target_name="t1"))
+    tgt2 = FortranTarget({"version": "dev0"}, Address("", target_name="t2"))
+    tgt3 = FortranTarget({"version": "dev1"}, Address("", target_name="t3"))
+    assert tgt1[FortranVersion] is tgt2[FortranVersion]
+    assert tgt1[FortranVersion] is not tgt3[FortranVersion]
+    assert tgt3[FortranVersion].value == "dev1"
+
+    # Fields which compute their own values might use the address to do so, so are not shared.
+    assert tgt1[FortranExtensions] == tgt2[FortranExtensions]
+    assert tgt1[FortranExtensions] is not tgt2[FortranExtensions]
+
+    class ExampleField(StringField, AsyncFieldMixin):
+        alias = "field"
+        default = "default"
+
+    class ExampleTarget(Target):
+        alias = "example"
+        core_fields = (ExampleField, UnrelatedField)
+
+    tgt1 = ExampleTarget({}, Address("", target_name="t1"))
+    tgt2 = ExampleTarget({}, Address("", target_name="t2"))
+    assert tgt1[UnrelatedField] is tgt2[UnrelatedField]
+    assert tgt1[ExampleField].address == tgt1.address
+    assert tgt2[ExampleField].address == tgt2.address
+
+
+def test_target_copy() -> None:
+    class ExampleTarget(FortranTarget, ABC):
+        pass
+
+    for target_type in (FortranTarget, ExampleTarget):
+        tgt = target_type({"version": "dev0"}, Address("", target_name="lib"))
+        # The fields are stored in slots, so the `__dict__` of the target is never used.
+        assert not tgt.__dict__
+        copied = copy.copy(tgt)
+        assert copied == tgt
+        assert copied is not tgt
+        assert copied.description_of_origin == tgt.description_of_origin
+        assert copied.origin_sources_blocks == tgt.origin_sources_blocks
+        assert copied.name_explicitly_set == tgt.name_explicitly_set
+        assert not copied.__dict__
+
+
 def test_invalid_fields_rejected() -> None:
     with pytest.raises(InvalidTargetException) as exc:
         FortranTarget({"invalid_field": True}, Address("", target_name="lib"))
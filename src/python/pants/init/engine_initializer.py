@@ -30,7 +30,8 @@ from pants.engine.internals import (
     synthetic_targets,
 )
 from pants.engine.internals.native_engine import PyExecutor, PySessionCancellationLatch
-from pants.engine.internals.parser import Parser
+from pants.engine.internals.parser import BuildFileCodeCache, Parser
+from pants.engine.internals.parser_pool import ParserPool
 from pants.engine.internals.scheduler import Scheduler, SchedulerSession
 from pants.engine.internals.selectors import Params
 from pants.engine.internals.session import SessionValues
@@ -49,6 +50,7 @@ from pants.option.global_options import (
 )
 from pants.option.option_value_container import OptionValueContainer
 from pants.option.subsystem import Subsystem
+from pants.util.disk_cache import persistent_cache
 from pants.util.docutil import bin_name
 from pants.util.logging import LogLevel
 from pants.util.ordered_set import FrozenOrderedSet
@@ -65,6 +67,12 @@ class GraphScheduler:
 
     scheduler: Scheduler
     goal_map: Any
+    parser_pool: ParserPool
+
+    def shutdown(self) -> None:
+        """Shut down the Scheduler, and the BUILD file parser pool it was using."""
+        self.parser_pool.shutdown()
+        self.scheduler.shutdown()
 
     def new_session(
         self,
@@ -194,6 +202,11 @@ class EngineInitializer:
         executor = executor or GlobalOptions.create_py_executor(bootstrap_options)
         execution_options = ExecutionOptions.from_options(bootstrap_options, dynamic_remote_options)
         local_store_options = LocalStoreOptions.from_options(bootstrap_options)
+        build_file_code_disk_cache = persistent_cache(
+            bootstrap_options.persistent_caches_dir,
+            "build_file_code",
+            bootstrap_options.build_file_code_cache_max_size_bytes,
+        )
         return EngineInitializer.setup_graph_extended(
             build_configuration,
             execution_options,
@@ -209,6 +222,12 @@ class EngineInitializer:
             engine_visualize_to=bootstrap_options.engine_visualize_to,
             watch_filesystem=bootstrap_options.watch_filesystem,
             is_bootstrap=is_bootstrap,
+            build_file_code_cache=(
+                BuildFileCodeCache(build_file_code_disk_cache)
+                if build_file_code_disk_cache is not None
+                else None
+            ),
+            build_file_parse_workers=bootstrap_options.build_file_parse_workers,
         )
 
     @staticmethod
@@ -228,6 +247,8 @@ class EngineInitializer:
         engine_visualize_to: str | None = None,
         watch_filesystem: bool = True,
         is_bootstrap: bool = False,
+        build_file_code_cache: BuildFileCodeCache | None = None,
+        build_file_parse_workers: int = 0,
     ) -> GraphScheduler:
         build_root_path = build_root or get_buildroot()
 
@@ -239,13 +260,11 @@ class EngineInitializer:
 
         @rule
         def parser_singleton() -> Parser:
-            return Parser(
-                build_root=build_root_path,
-                registered_target_types=registered_target_types,
-                union_membership=union_membership,
-                object_aliases=build_configuration.registered_aliases,
-                ignore_unrecognized_symbols=is_bootstrap,
-            )
+            return parser
+
+        @rule
+        def parser_pool_singleton() -> ParserPool:
+            return parser_pool
 
         @rule
         def bootstrap_status() -> BootstrapStatus:
@@ -329,6 +348,17 @@ class EngineInitializer:
             )
         )
 
+        parser = Parser(
+            build_root=build_root_path,
+            registered_target_types=registered_target_types,
+            union_membership=union_membership,
+            object_aliases=build_configuration.registered_aliases,
+            ignore_unrecognized_symbols=is_bootstrap,
+            code_cache=build_file_code_cache,
+        )
+        # NB: The short-lived bootstrap scheduler does not use a pool.
+        parser_pool = ParserPool(parser, 0 if is_bootstrap else build_file_parse_workers)
+
         def ensure_absolute_path(v: str) -> str:
             return Path(v).resolve().as_posix()
 
@@ -354,7 +384,7 @@ class EngineInitializer:
             watch_filesystem=watch_filesystem,
         )
 
-        return GraphScheduler(scheduler, goal_map)
+        return GraphScheduler(scheduler, goal_map, parser_pool)
 
 
 class GoalNotActivatedException(Exception):
@@ -15,6 +15,7 @@ import pkg_resources
 
 from pants.build_graph.build_configuration import BuildConfiguration
 from pants.engine.env_vars import CompleteEnvironmentVars
+from pants.engine.internals import rule_visitor
 from pants.engine.internals.native_engine import PyExecutor
 from pants.engine.unions import UnionMembership
 from pants.help.flag_error_help_printer import FlagErrorHelpPrinter
@@ -28,6 +29,7 @@ from pants.init.plugin_resolver import PluginResolver
 from pants.init.plugin_resolver import rules as plugin_resolver_rules
 from pants.option.errors import UnknownFlagsError
 from pants.option.global_options import DynamicRemoteOptions
+from pants.option.option_value_container import OptionValueContainer
 from pants.option.options import Options
 from pants.option.options_bootstrapper import OptionsBootstrapper
 from pants.util.requirements import parse_requirements_file
@@ -48,6 +50,7 @@ def _initialize_build_configuration(
     """
 
     bootstrap_options = options_bootstrapper.bootstrap_options.for_global_scope()
+    _configure_rule_awaitables_cache(bootstrap_options)
 
     # Add any extra paths to python path (e.g., for loading extra source backends).
     for path in bootstrap_options.pythonpath:
@@ -66,6 +69,14 @@ def _initialize_build_configuration(
     )
 
 
+def _configure_rule_awaitables_cache(bootstrap_options: OptionValueContainer) -> None:
+    # NB: This must happen before backends are loaded, since their rules are analyzed on import.
+    rule_visitor.configure_awaitables_cache(
+        bootstrap_options.persistent_caches_dir,
+        bootstrap_options.rule_awaitables_cache_max_size_bytes,
+    )
+
+
 def _collect_backends_requirements(backends: List[str]) -> List[str]:
     """Collects backend package dependencies, in case those are declared in an adjacent
     requirements.txt. Ignores any loading errors, assuming those will be later on handled by the
@@ -107,6 +118,7 @@ def _collect_backends_requirements(backends: List[str]) -> List[str]:
 def create_bootstrap_scheduler(
     options_bootstrapper: OptionsBootstrapper, executor: PyExecutor
 ) -> BootstrapScheduler:
+    _configure_rule_awaitables_cache(options_bootstrapper.bootstrap_options.for_global_scope())
     bc_builder = BuildConfiguration.Builder()
     # To load plugins, we only need access to the Python/PEX rules.
     load_build_configuration_from_source(bc_builder, ["pants.backend.python"])
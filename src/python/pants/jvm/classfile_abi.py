@@ -0,0 +1,286 @@
+# Copyright 2025 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+"""Fingerprints of the ABI of compiled JVM classes.
+
+The ABI of a class is the part of its class file which can affect the compilation of other
+compilation units against it: its name, supertypes, non-synthetic members, their signatures,
+constant values and annotations. Method bodies, debug information and local or anonymous classes
+are not part of the ABI, so edits which only touch them leave the ABI fingerprint unchanged.
+
+See https://docs.oracle.com/javase/specs/jvms/se17/html/jvms-4.html for the class file format.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import logging
+import struct
+import zipfile
+from typing import Iterable
+
+from pants.engine.fs import FileContent
+
+logger = logging.getLogger(__name__)
+
+_ACC_SYNTHETIC = 0x1000
+
+# Attributes which only describe method bodies or debug information.
+_IGNORED_ATTRIBUTES = frozenset(
+    {
+        "BootstrapMethods",
+        "Code",
+        "LineNumberTable",
+        "LocalVariableTable",
+        "LocalVariableTypeTable",
+        "NestHost",
+        "NestMembers",
+        "SourceDebugExtension",
+        "SourceFile",
+        "StackMapTable",
+    }
+)
+
+
+class ClassfileFormatError(Exception):
+    pass
+
+
+class _ClassfileReader:
+    def __init__(self, data: bytes) -> None:
+        self._data = data
+        self._offset = 0
+
+    def u1(self) -> int:
+        return self.read(1)[0]
+
+    def u2(self) -> int:
+        return struct.unpack(">H", self.read(2))[0]
+
+    def u4(self) -> int:
+        return struct.unpack(">I", self.read(4))[0]
+
+    def read(self, length: int) -> bytes:
+        end = self._offset + length
+        if end > len(self._data):
+            raise ClassfileFormatError("Unexpected end of class file.")
+        result = self._data[self._offset : end]
+        self._offset = end
+        return result
+
+    def exhausted(self) -> bool:
+        return self._offset == len(self._data)
+
+
+class _ConstantPool:
+    """Renders constant pool entries by value rather than by index.
+
+    Indices are not stable: adding a string literal to a method body renumbers the constant pool.
+    """
+
+    def __init__(self, reader: _ClassfileReader) -> None:
+        self._entries: list[tuple[int, tuple] | None] = [None]
+        count = reader.u2()
+        while len(self._entries) < count:
+            tag = reader.u1()
+            if tag == 1:  # Utf8
+                self._entries.append((tag, (reader.read(reader.u2()),)))
+            elif tag in (3, 4):  # Integer, Float
+                self._entries.append((tag, (reader.read(4),)))
+            elif tag in (5, 6):  # Long, Double: occupy two slots.
+                self._entries.append((tag, (reader.read(8),)))
+                self._entries.append(None)
+            elif tag in (7, 8, 16, 19, 20):  # Class, String, MethodType, Module, Package
+                self._entries.append((tag, (reader.u2(),)))
+            elif tag in (9, 10, 11, 12, 17, 18):  # Refs, NameAndType, Dynamic, InvokeDynamic
+                self._entries.append((tag, (reader.u2(), reader.u2())))
+            elif tag == 15:  # MethodHandle
+                self._entries.append((tag, (reader.u1(), reader.u2())))
+            else:
+                raise ClassfileFormatError(f"Unknown constant pool tag {tag}.")
+
+    def __getitem__(self, index: int) -> str:
+        if index == 0:
+            return "-"
+        if index >= len(self._entries):
+            raise ClassfileFormatError(f"Constant pool index {index} out of range.")
+        entry = self._entries[index]
+        if entry is None:
+            raise ClassfileFormatError(f"Constant pool index {index} is not usable.")
+        tag, values = entry
+        if tag == 1:
+            return values[0].decode("utf-8", "backslashreplace")
+        if tag in (3, 4, 5, 6):
+            return f"#{tag}:{values[0].hex()}"
+        if tag == 8:
+            return repr(self[values[0]])
+        if tag in (9, 10, 11):
+            return f"{self[values[0]]}.{self[values[1]]}"
+        if tag == 12:
+            return f"{self[values[0]]}:{self[values[1]]}"
+        if tag == 15:
+            return f"handle({values[0]}, {self[values[1]]})"
+        if tag in (17, 18):
+            return f"dynamic({values[0]}, {self[values[1]]})"
+        return self[values[0]]
+
+
+def _render_element_value(reader: _ClassfileReader, pool: _ConstantPool) -> str:
+    tag = chr(reader.u1())
+    if tag in "BCDFIJSZs":
+        return f"{tag}{pool[reader.u2()]}"
+    if tag == "e":
+        return f"e{pool[reader.u2()]}.{pool[reader.u2()]}"
+    if tag == "c":
+        return f"c{pool[reader.u2()]}"
+    if tag == "@":
+        return _render_annotation(reader, pool)
+    if tag == "[":
+        return f"[{', '.join(_render_element_value(reader, pool) for _ in range(reader.u2()))}]"
+    raise ClassfileFormatError(f"Unknown annotation element value tag {tag!r}.")
+
+
+def _render_annotation(reader: _ClassfileReader, pool: _ConstantPool) -> str:
+    annotation_type = pool[reader.u2()]
+    elements = [
+        f"{pool[reader.u2()]}={_render_element_value(reader, pool)}" for _ in range(reader.u2())
+    ]
+    return f"@{annotation_type}({', '.join(elements)})"
+
+
+def _render_attribute(name: str, data: bytes, pool: _ConstantPool) -> str | None:
+    if name in _IGNORED_ATTRIBUTES:
+        return None
+    reader = _ClassfileReader(data)
+    if name in ("ConstantValue", "Signature"):
+        rendered = pool[reader.u2()]
+    elif name == "Exceptions":
+        rendered = " ".join(sorted(pool[reader.u2()] for _ in range(reader.u2())))
+    elif name == "InnerClasses":
+        inner_classes = []
+        for _ in range(reader.u2()):
+            inner, outer, inner_name, access_flags = (reader.u2() for _ in range(4))
+            # Local and anonymous classes cannot be referred to by other compilation units.
+            if outer != 0 and inner_name != 0:
+                inner_classes.append(
+                    f"{pool[inner]} {pool[outer]} {pool[inner_name]} {access_flags:#x}"
+                )
+        rendered = "; ".join(sorted(inner_classes))
+    elif name == "MethodParameters":
+        rendered = " ".join(f"{pool[reader.u2()]}/{reader.u2():#x}" for _ in range(reader.u1()))
+    elif name in ("RuntimeVisibleAnnotations", "RuntimeInvisibleAnnotations"):
+        rendered = " ".join(sorted(_render_annotation(reader, pool) for _ in range(reader.u2())))
+    elif name in ("RuntimeVisibleParameterAnnotations", "RuntimeInvisibleParameterAnnotations"):
+        rendered = " | ".join(
+            " ".join(sorted(_render_annotation(reader, pool) for _ in range(reader.u2())))
+            for _ in range(reader.u1())
+        )
+    elif name == "AnnotationDefault":
+        rendered = _render_element_value(reader, pool)
+    else:
+        # Any other attribute is included verbatim. Its constant pool indices are not resolved, so
+        # it may change more often than the ABI does, which is safe.
+        return f"{name}={data.hex()}"
+    if not reader.exhausted():
+        raise ClassfileFormatError(f"Unexpected trailing data in attribute {name}.")
+    return f"{name}={rendered}"
+
+
+def _render_attributes(reader: _ClassfileReader, pool: _ConstantPool) -> list[str]:
+    attributes = []
+    for _ in range(reader.u2()):
+        name = pool[reader.u2()]
+        rendered = _render_attribute(name, reader.read(reader.u4()), pool)
+        if rendered is not None:
+            attributes.append(rendered)
+    return sorted(attributes)
+
+
+def _render_members(kind: str, reader: _ClassfileReader, pool: _ConstantPool) -> list[str]:
+    members = []
+    for _ in range(reader.u2()):
+        access_flags = reader.u2()
+        name = pool[reader.u2()]
+        descriptor = pool[reader.u2()]
+        attributes = _render_attributes(reader, pool)
+        # Synthetic members (lambda bodies, accessors, ...) cannot be referred to from source.
+        if not access_flags & _ACC_SYNTHETIC:
+            members.append(f"{kind} {access_flags:#x} {name} {descriptor} {' '.join(attributes)}")
+    return sorted(members)
+
+
+def classfile_abi(classfile: bytes) -> str | None:
+    """Renders the ABI of the given class file as text.
+
+    Returns None for local and anonymous classes, which are not visible outside of their
+    compilation unit.
+    """
+    reader = _ClassfileReader(classfile)
+    if reader.u4() != 0xCAFEBABE:
+        raise ClassfileFormatError("Not a class file.")
+    minor_version, major_version = reader.u2(), reader.u2()
+    pool = _ConstantPool(reader)
+    access_flags = reader.u2()
+    this_class, super_class = pool[reader.u2()], pool[reader.u2()]
+    interfaces = [pool[reader.u2()] for _ in range(reader.u2())]
+    fields = _render_members("field", reader, pool)
+    methods = _render_members("method", reader, pool)
+
+    attributes = []
+    for _ in range(reader.u2()):
+        name = pool[reader.u2()]
+        data = reader.read(reader.u4())
+        if name == "EnclosingMethod":
+            return None
+        rendered = _render_attribute(name, data, pool)
+        if rendered is not None:
+            attributes.append(rendered)
+
+    return "\n".join(
+        (
+            f"class {major_version}.{minor_version} {access_flags:#x} {this_class}",
+            f"extends {super_class} implements {' '.join(interfaces)}",
+            *sorted(attributes),
+            *fields,
+            *methods,
+        )
+    )
+
+
+def _jar_abi(jar: bytes) -> Iterable[str]:
+    with zipfile.ZipFile(io.BytesIO(jar)) as zf:
+        for info in sorted(zf.infolist(), key=lambda i: i.filename):
+            if info.is_dir():
+                continue
+            content = zf.read(info)
+            if info.filename.endswith(".class"):
+                abi = classfile_abi(content)
+                if abi is not None:
+                    yield abi
+            else:
+                yield f"file {info.filename} {hashlib.sha256(content).hexdigest()}"
+
+
+def classpath_abi_fingerprint(files: Iterable[FileContent]) -> str:
+    """Fingerprints the ABI of the classes in the given JAR files and class files.
+
+    Any other files are fingerprinted by their full content, as are files which cannot be parsed.
+    """
+    hasher = hashlib.sha256()
+    for file_content in sorted(files, key=lambda fc: fc.path):
+        hasher.update(f"{file_content.path}\n".encode())
+        try:
+            if file_content.path.endswith(".jar"):
+                parts: Iterable[str] = list(_jar_abi(file_content.content))
+            elif file_content.path.endswith(".class"):
+                parts = [classfile_abi(file_content.content) or ""]
+            else:
+                parts = [hashlib.sha256(file_content.content).hexdigest()]
+        except (ClassfileFormatError, zipfile.BadZipFile) as e:
+            logger.debug(f"Fingerprinting {file_content.path} by content: {e}")
+            parts = [hashlib.sha256(file_content.content).hexdigest()]
+        for part in parts:
+            hasher.update(part.encode("utf-8", "backslashreplace"))
+            hasher.update(b"\n")
+    return hasher.hexdigest()
@@ -0,0 +1,138 @@
+# Copyright 2025 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import io
+import struct
+import zipfile
+
+from pants.engine.fs import FileContent
+from pants.jvm.classfile_abi import classfile_abi, classpath_abi_fingerprint
+
+ACC_PUBLIC = 0x0001
+ACC_STATIC = 0x0008
+ACC_FINAL = 0x0010
+ACC_SYNTHETIC = 0x1000
+
+
+class ClassfileBuilder:
+    """Builds minimal class files, with a constant pool populated in order of use."""
+
+    def __init__(self) -> None:
+        self._pool: list[bytes] = []
+        self._indices: dict[bytes, int] = {}
+
+    def _constant(self, entry: bytes) -> int:
+        if entry not in self._indices:
+            self._pool.append(entry)
+            self._indices[entry] = len(self._pool)
+        return self._indices[entry]
+
+    def utf8(self, value: str) -> int:
+        encoded = value.encode()
+        return self._constant(struct.pack(">BH", 1, len(encoded)) + encoded)
+
+    def integer(self, value: int) -> int:
+        return self._constant(struct.pack(">Bi", 3, value))
+
+    def class_(self, name: str) -> int:
+        return self._constant(struct.pack(">BH", 7, self.utf8(name)))
+
+    def string(self, value: str) -> int:
+        return self._constant(struct.pack(">BH", 8, self.utf8(value)))
+
+    def attribute(self, name: str, data: bytes) -> bytes:
+        return struct.pack(">HI", self.utf8(name), len(data)) + data
+
+    def member(self, access_flags: int, name: str, descriptor: str, *attributes: bytes) -> bytes:
+        return struct.pack(
+            ">HHHH", access_flags, self.utf8(name), self.utf8(descriptor), len(attributes)
+        ) + b"".join(attributes)
+
+    def build(
+        self,
+        name: str,
+        fields: list[bytes],
+        methods: list[bytes],
+        attributes: list[bytes],
+    ) -> bytes:
+        this_class, super_class = self.class_(name), self.class_("java/lang/Object")
+        body = b"".join(
+            (
+                struct.pack(">HHHH", ACC_PUBLIC, this_class, super_class, 0),
+                struct.pack(">H", len(fields)),
+                *fields,
+                struct.pack(">H", len(methods)),
+                *methods,
+                struct.pack(">H", len(attributes)),
+                *attributes,
+            )
+        )
+        header = struct.pack(">IHHH", 0xCAFEBABE, 0, 61, len(self._pool) + 1)
+        return header + b"".join(self._pool) + body
+
+
+def make_classfile(
+    *,
+    body_string: str = "hello",
+    descriptor: str = "()V",
+    constant: int = 1,
+    synthetic_method: str | None = None,
+    enclosing_method: bool = False,
+) -> bytes:
+    builder = ClassfileBuilder()
+    # The body comes first, so that the constants it uses shift the indices of later constants.
+    code = builder.attribute("Code", struct.pack(">BH", 0x13, builder.string(body_string)))
+    methods = [builder.member(ACC_PUBLIC, "run", descriptor, code)]
+    if synthetic_method:
+        methods.append(builder.member(ACC_SYNTHETIC | ACC_STATIC, synthetic_method, "()V", code))
+    fields = [
+        builder.member(
+            ACC_PUBLIC | ACC_STATIC | ACC_FINAL,
+            "CONSTANT",
+            "I",
+            builder.attribute("ConstantValue", struct.pack(">H", builder.integer(constant))),
+        )
+    ]
+    attributes = [builder.attribute("SourceFile", struct.pack(">H", builder.utf8("Foo.java")))]
+    if enclosing_method:
+        enclosing = struct.pack(">HH", builder.class_("org/example/Outer"), 0)
+        attributes.append(builder.attribute("EnclosingMethod", enclosing))
+    return builder.build("org/example/Foo", fields, methods, attributes)
+
+
+def test_abi_ignores_method_bodies() -> None:
+    abi = classfile_abi(make_classfile())
+    assert abi is not None
+    assert "org/example/Foo" in abi
+    assert "hello" not in abi
+    assert classfile_abi(make_classfile(body_string="a different string")) == abi
+    assert classfile_abi(make_classfile(synthetic_method="lambda$run$0")) == abi
+
+
+def test_abi_includes_signatures_and_constants() -> None:
+    abi = classfile_abi(make_classfile())
+    assert classfile_abi(make_classfile(descriptor="(I)V")) != abi
+    assert classfile_abi(make_classfile(constant=2)) != abi
+
+
+def test_abi_excludes_local_classes() -> None:
+    assert classfile_abi(make_classfile(enclosing_method=True)) is None
+
+
+def test_classpath_abi_fingerprint() -> None:
+    def jar(classfile: bytes, resource: bytes = b"resource") -> FileContent:
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as zf:
+            zf.writestr("org/example/", b"")
+            zf.writestr("org/example/Foo.class", classfile)
+            zf.writestr("org/example/resource.txt", resource)
+        return FileContent("foo.jar", buffer.getvalue())
+
+    fingerprint = classpath_abi_fingerprint([jar(make_classfile())])
+    assert classpath_abi_fingerprint([jar(make_classfile(body_string="other"))]) == fingerprint
+    assert classpath_abi_fingerprint([jar(make_classfile(constant=2))]) != fingerprint
+    assert classpath_abi_fingerprint([jar(make_classfile(), b"other")]) != fingerprint
+    # Files which cannot be parsed are fingerprinted by their content.
+    assert classpath_abi_fingerprint([FileContent("foo.jar", b"not a jar")]) != fingerprint
@@ -3,7 +3,9 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import marshal
 import os
 from abc import ABCMeta
 from collections import defaultdict, deque
@@ -19,7 +21,7 @@ from pants.core.target_types import (
 from pants.engine.collection import Collection
 from pants.engine.engine_aware import EngineAwareReturnType
 from pants.engine.environment import EnvironmentName
-from pants.engine.fs import Digest
+from pants.engine.fs import Digest, DigestContents, FileContent
 from pants.engine.internals.selectors import Get, MultiGet
 from pants.engine.process import FallibleProcessResult
 from pants.engine.rules import collect_rules, rule
@@ -34,6 +36,9 @@ from pants.engine.target import (
 )
 from pants.engine.unions import UnionMembership, union
 from pants.jvm.resolve.key import CoursierResolveKey
+from pants.jvm.subsystems import JvmSubsystem
+from pants.option.global_options import GlobalOptions
+from pants.util.disk_cache import DiskCache, persistent_cache
 from pants.util.frozendict import FrozenDict
 from pants.util.logging import LogLevel
 from pants.util.ordered_set import FrozenOrderedSet
@@ -237,31 +242,53 @@ class ClasspathEntry:
     Note: Non-jar artifacts (e.g., executables with "exe" packaging) may end up on the classpath if
     they are dependencies.
     TODO: Does there need to be a filtering mechanism to exclude non-jar artifacts in the default case?
+
+    An entry may additionally carry the fingerprint of the ABI of its classes (see
+    `pants.jvm.classfile_abi`), which compilers use to reuse the outputs of dependents when only
+    the implementation of the entry changed. Entries without one are represented by their digest.
     """
 
     digest: Digest
     filenames: tuple[str, ...]
     dependencies: FrozenOrderedSet[ClasspathEntry]
+    abi_fingerprint: str | None
 
     def __init__(
         self,
         digest: Digest,
         filenames: Iterable[str] = (),
         dependencies: Iterable[ClasspathEntry] = (),
+        abi_fingerprint: str | None = None,
     ):
         object.__setattr__(self, "digest", digest)
         object.__setattr__(self, "filenames", tuple(filenames))
         object.__setattr__(self, "dependencies", FrozenOrderedSet(dependencies))
+        object.__setattr__(self, "abi_fingerprint", abi_fingerprint)
 
     @classmethod
     def merge(cls, digest: Digest, entries: Iterable[ClasspathEntry]) -> ClasspathEntry:
-        """After merging the Digests for entries, merge their filenames and dependencies."""
+        """After merging the Digests for entries, merge their filenames and dependencies.
+
+        The merged entry only has an ABI fingerprint if all of the entries do.
+        """
+        entries = tuple(entries)
+        abi_fingerprint = None
+        if entries and all(cpe.abi_fingerprint for cpe in entries):
+            abi_fingerprint = hashlib.sha256(
+                "\n".join(cpe.abi_key for cpe in entries).encode()
+            ).hexdigest()
         return cls(
             digest,
             (f for cpe in entries for f in cpe.filenames),
             (d for cpe in entries for d in cpe.dependencies),
+            abi_fingerprint,
         )
 
+    @property
+    def abi_key(self) -> str:
+        """A key which only changes when the ABI of this entry (excluding dependencies) may have."""
+        return self.abi_fingerprint or self.digest.fingerprint
+
     @classmethod
     def args(cls, entries: Iterable[ClasspathEntry], *, prefix: str = "") -> Iterator[str]:
         """Returns the filenames for the given entries.
@@ -317,6 +344,75 @@ class ClasspathEntry:
         return repr(self)
 
 
+class CompiledJarCache:
+    """An on-disk cache of the JAR files produced by JVM compilers.
+
+    Entries are keyed by the compiler's identity and arguments, the digest of the sources and the
+    ABI keys (see `ClasspathEntry.abi_key`) of the compile classpath, rather than the full digests
+    of the classpath. A component whose dependencies only changed in their implementation can
+    therefore reuse its previous output without invoking the compiler.
+
+    Filling the cache (and fingerprinting the ABI of compiled classes) requires reading the full
+    contents of each compiled JAR into the Pants process.
+    """
+
+    def __init__(self, directory: str, max_size_bytes: int) -> None:
+        self._disk_cache = DiskCache(directory, max_size_bytes)
+
+    @staticmethod
+    def key(
+        compiler_identity: Iterable[str],
+        sources_digest: Digest,
+        classpath_entries: Iterable[ClasspathEntry],
+        *,
+        by_abi: bool = True,
+    ) -> str:
+        """Computes the key of a compiler's output.
+
+        If `by_abi` is False, the classpath is keyed by its full digests instead: e.g. when
+        annotation processors from the classpath may run, since they depend on more than the ABI.
+        """
+        h = hashlib.sha256()
+        for value in compiler_identity:
+            h.update(f"compiler {value}\n".encode())
+        h.update(f"sources {sources_digest.fingerprint}\n".encode())
+        for cpe in classpath_entries:
+            classpath_key = cpe.abi_key if by_abi else cpe.digest.fingerprint
+            h.update(f"classpath {classpath_key} {' '.join(cpe.filenames)}\n".encode())
+        return h.hexdigest()
+
+    def get(self, key: str) -> tuple[str | None, tuple[FileContent, ...]] | None:
+        """Returns the ABI fingerprint and files of the cached output, if any."""
+        cached = self._disk_cache.get(key)
+        if cached is None:
+            return None
+        try:
+            abi_fingerprint, files = marshal.loads(cached)
+            return abi_fingerprint, tuple(FileContent(path, content) for path, content in files)
+        except (EOFError, ValueError, TypeError):
+            logger.debug(f"Discarding corrupt cached compiled JAR for key {key}.")
+            self._disk_cache.delete(key)
+            return None
+
+    def put(self, key: str, abi_fingerprint: str | None, contents: DigestContents) -> None:
+        self._disk_cache.put(
+            key,
+            marshal.dumps(
+                (abi_fingerprint, tuple((content.path, content.content) for content in contents))
+            ),
+        )
+
+
+def compiled_jar_cache(global_options: GlobalOptions, jvm: JvmSubsystem) -> CompiledJarCache | None:
+    """The configured `CompiledJarCache`, or None if it is disabled."""
+    disk_cache = persistent_cache(
+        global_options.persistent_caches_dir,
+        "jvm_compiled_jars",
+        jvm.compiled_jar_cache_max_size_bytes,
+    )
+    return CompiledJarCache(disk_cache) if disk_cache is not None else None
+
+
 class CompileResult(Enum):
     SUCCEEDED = "succeeded"
     FAILED = "failed"
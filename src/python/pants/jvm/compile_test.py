@@ -48,7 +48,7 @@ from pants.core.target_types import FilesGeneratorTarget, RelocatedFiles
 from pants.core.util_rules import config_files, source_files, stripped_source_files
 from pants.core.util_rules.external_tool import rules as external_tool_rules
 from pants.engine.addresses import Addresses
-from pants.engine.fs import EMPTY_DIGEST
+from pants.engine.fs import EMPTY_DIGEST, Digest
 from pants.engine.target import (
     CoarsenedTarget,
     GeneratedSources,
@@ -61,10 +61,12 @@ from pants.engine.target import (
 from pants.jvm import classpath, jdk_rules, testutil
 from pants.jvm.classpath import Classpath
 from pants.jvm.compile import (
+    ClasspathEntry,
     ClasspathEntryRequest,
     ClasspathEntryRequestFactory,
     ClasspathSourceAmbiguity,
     ClasspathSourceMissing,
+    CompiledJarCache,
 )
 from pants.jvm.goals import lockfile
 from pants.jvm.resolve.coursier_fetch import CoursierFetchRequest
@@ -382,3 +384,19 @@ def test_allow_files_dependency(
 
     main_address = Address(spec_path="", target_name="main")
     rule_runner.request(Classpath, [Addresses([main_address])])
+
+
+def test_compiled_jar_cache_key() -> None:
+    def key(*entries: ClasspathEntry, by_abi: bool = True) -> str:
+        return CompiledJarCache.key(("javac",), EMPTY_DIGEST, entries, by_abi=by_abi)
+
+    dependency = ClasspathEntry(Digest("1" * 64, 1), ("dep.jar",), abi_fingerprint="abi")
+    # The implementation of the dependency changed, but not its ABI.
+    edited_dependency = ClasspathEntry(Digest("2" * 64, 1), ("dep.jar",), abi_fingerprint="abi")
+    assert key(dependency) == key(edited_dependency)
+    assert key(dependency, by_abi=False) != key(edited_dependency, by_abi=False)
+
+    # An entry without an ABI fingerprint is keyed by its digest.
+    assert key(ClasspathEntry(dependency.digest, ("dep.jar",))) != key(
+        ClasspathEntry(edited_dependency.digest, ("dep.jar",))
+    )
@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import dataclasses
+import hashlib
 import logging
 import os
 import re
@@ -129,6 +130,14 @@ class JdkEnvironment:
     def immutable_input_digests(self) -> dict[str, Digest]:
         return {**self.coursier.immutable_input_digests, self.bin_dir: self._digest}
 
+    @property
+    def fingerprint(self) -> str:
+        """Identifies this JDK: the command which locates it, and the files used to launch it."""
+        hasher = hashlib.sha256(f"{self.java_home_command}\n{self.jre_major_version}\n".encode())
+        for path, digest in sorted(self.immutable_input_digests.items()):
+            hasher.update(f"{path} {digest.fingerprint}\n".encode())
+        return hasher.hexdigest()
+
 
 @dataclass(frozen=True)
 class InternalJdk(JdkEnvironment):
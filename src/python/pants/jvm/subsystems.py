@@ -100,6 +100,27 @@ class JvmSubsystem(Subsystem):
         ),
         advanced=True,
     )
+    compiled_jar_cache_max_size_bytes = IntOption(
+        default=1_000_000_000,
+        advanced=True,
+        help=softwrap(
+            """
+            The maximum size in bytes of the persistent cache of JAR files produced by JVM
+            compilers, which is keyed by the ABI rather than the full contents of the compile
+            classpath and is stored below `--persistent-caches-dir`. The least recently used
+            entries are evicted once this size is exceeded.
+
+            Set to 0 to disable the cache, in which case a component is recompiled whenever any
+            file on its compile classpath changes.
+
+            While the cache is enabled, the full contents of each JAR produced by `javac` are read
+            into the Pants process after compiling it, in order to fingerprint its ABI and to store
+            it in the cache. For `javac`, the classpath is only keyed by ABI if annotation
+            processing is disabled with `-proc:none` in `[javac].args`: otherwise processors on the
+            classpath may depend on more than the ABI.
+            """
+        ),
+    )
     deploy_jar_exclude_files = StrListOption(
         default=[
             # Signature files.
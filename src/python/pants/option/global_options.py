@@ -1319,6 +1319,64 @@ class BootstrapOptions:
         ),
         default=os.path.join(get_pants_cachedir(), "named_caches"),
     )
+    persistent_caches_dir = StrOption(
+        advanced=True,
+        help=softwrap(
+            f"""
+            Directory below which Pants stores its size-bounded persistent caches, each in its own
+            subdirectory: e.g. of compiled BUILD files and of the awaitables of `@rule`s. These
+            caches are shared across runs and `pantsd` restarts, and the size of each is limited
+            by its own `..._max_size_bytes` option.
+
+            {cache_instructions}
+            """
+        ),
+        default=os.path.join(get_pants_cachedir(), "persistent_caches"),
+    )
+    build_file_code_cache_max_size_bytes = IntOption(
+        advanced=True,
+        help=softwrap(
+            """
+            The maximum size in bytes of the persistent cache of compiled BUILD files, which is
+            stored below `--persistent-caches-dir`. The least recently used entries are evicted
+            once this size is exceeded.
+
+            Set to 0 to disable the cache.
+            """
+        ),
+        default=256 * MEGABYTES,
+    )
+    build_file_parse_workers = IntOption(
+        default=0,
+        advanced=True,
+        help=softwrap(
+            """
+            The number of worker processes to use for evaluating BUILD files, or 0 to evaluate
+            them in the main Pants process.
+
+            BUILD file evaluation in the main process is limited to a single core, so a pool of
+            workers may significantly speed up commands which evaluate many BUILD files (e.g.
+            `pants list ::`) on machines with many cores. The workers are started on demand, and
+            are stopped when the engine is re-initialized (e.g. when pantsd restarts its
+            scheduler). They are started by a fork server process, and so this option is not
+            supported on platforms without `fork`.
+            """
+        ),
+    )
+    rule_awaitables_cache_max_size_bytes = IntOption(
+        advanced=True,
+        help=softwrap(
+            """
+            The maximum size in bytes of the persistent cache of the awaitables found in the bodies
+            of `@rule`s, which saves parsing the source of every rule when backends are loaded. It
+            is stored below `--persistent-caches-dir`. The least recently used entries are evicted
+            once this size is exceeded.
+
+            Set to 0 to disable the cache.
+            """
+        ),
+        default=64 * MEGABYTES,
+    )
     local_execution_root_dir = StrOption(
         advanced=True,
         help=softwrap(
@@ -103,6 +103,11 @@ class PantsDaemonCore:
             )
             if self._services:
                 self._services.shutdown()
+            if self._scheduler is not None:
+                # NB: The previous Scheduler is not shut down, since it may still be in use by
+                # in-flight runs, but its BUILD file parser workers are released: its remaining
+                # runs parse BUILD files in-process.
+                self._scheduler.parser_pool.shutdown()
             self._scheduler = EngineInitializer.setup_graph(
                 bootstrap_options, build_config, dynamic_remote_options, self._executor
             )
@@ -190,5 +195,5 @@ class PantsDaemonCore:
                 self._services.shutdown()
                 self._services = None
             if self._scheduler is not None:
-                self._scheduler.scheduler.shutdown()
+                self._scheduler.shutdown()
                 self._scheduler = None
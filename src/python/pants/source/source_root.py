@@ -212,6 +212,16 @@ class SourceRootRequest(EngineAwareParameter):
         return str(self.path)
 
 
+def _validate_marker_filenames(marker_filenames: Iterable[str]) -> None:
+    for marker_filename in marker_filenames:
+        if (
+            os.path.basename(marker_filename) != marker_filename
+            or "*" in marker_filename
+            or "!" in marker_filename
+        ):
+            raise InvalidMarkerFileError(f"Marker filename must be a base name: {marker_filename}")
+
+
 @dataclass(frozen=True)
 class SourceRootsResult:
     path_to_root: FrozenDict[PurePath, SourceRoot]
@@ -224,9 +234,14 @@ class OptionalSourceRootsResult:
 
 @rule
 async def get_optional_source_roots(
-    source_roots_request: SourceRootsRequest,
+    source_roots_request: SourceRootsRequest, source_root_config: SourceRootConfig
 ) -> OptionalSourceRootsResult:
-    """Rule to request source roots that may not exist."""
+    """Rule to request source roots that may not exist.
+
+    Rather than requesting a `SourceRootRequest` per directory (which recurses one parent directory
+    at a time), this resolves all of the requested directories together: the ancestors they share
+    are only checked once, and all marker files are probed with a single glob.
+    """
     # A file cannot be a source root, so request for its parent.
     # In the typical case, where we have multiple files with the same parent, this can
     # dramatically cut down on the number of engine requests.
@@ -236,14 +251,55 @@ async def get_optional_source_roots(
     }
     dirs.update(file_to_dir.values())
 
-    roots = await MultiGet(Get(OptionalSourceRoot, SourceRootRequest(d)) for d in dirs)
-    dir_to_root = dict(zip(dirs, roots))
+    # Walk up from each requested directory, stopping at the first pattern-matched source root,
+    # to collect the set of directories which might need to be probed for marker files. Since
+    # this walk is shared between all requested directories, each ancestor is only visited once.
+    pattern_matcher = source_root_config.get_pattern_matcher()
+    pattern_matches: dict[PurePath, bool] = {}
+    for d in dirs:
+        path = d
+        while path not in pattern_matches:
+            pattern_matches[path] = pattern_matcher.matches_root_patterns(path)
+            if pattern_matches[path] or str(path) == ".":
+                break
+            path = path.parent
+
+    marker_dirs: set[PurePath] = set()
+    marker_filenames = source_root_config.marker_filenames
+    if marker_filenames:
+        _validate_marker_filenames(marker_filenames)
+        probe_dirs = sorted(path for path, matched in pattern_matches.items() if not matched)
+        paths = await Get(
+            Paths,
+            PathGlobs([str(path / mf) for path in probe_dirs for mf in marker_filenames]),
+        )
+        marker_dirs.update(PurePath(f).parent for f in paths.files)
+
+    dir_to_root: dict[PurePath, OptionalSourceRoot] = {}
+
+    def find_root(d: PurePath) -> OptionalSourceRoot:
+        # Each path visited on the way to a root shares that root, so memoize it for all of them.
+        visited = []
+        path = d
+        while path not in dir_to_root:
+            if pattern_matches.get(path) or path in marker_dirs:
+                dir_to_root[path] = OptionalSourceRoot(SourceRoot(str(path)))
+                break
+            visited.append(path)
+            if str(path) == ".":
+                dir_to_root[path] = OptionalSourceRoot(None)
+                break
+            path = path.parent
+        root = dir_to_root[path]
+        for visited_path in visited:
+            dir_to_root[visited_path] = root
+        return root
 
     path_to_optional_root: dict[PurePath, OptionalSourceRoot] = {}
     for d in source_roots_request.dirs:
-        path_to_optional_root[d] = dir_to_root[d]
+        path_to_optional_root[d] = find_root(d)
     for f, d in file_to_dir.items():
-        path_to_optional_root[f] = dir_to_root[d]
+        path_to_optional_root[f] = find_root(d)
 
     return OptionalSourceRootsResult(path_to_optional_root=FrozenDict(path_to_optional_root))
 
@@ -281,15 +337,7 @@ async def get_optional_source_root(
     # B) Does it contain a marker file?
     marker_filenames = source_root_config.marker_filenames
     if marker_filenames:
-        for marker_filename in marker_filenames:
-            if (
-                os.path.basename(marker_filename) != marker_filename
-                or "*" in marker_filename
-                or "!" in marker_filename
-            ):
-                raise InvalidMarkerFileError(
-                    f"Marker filename must be a base name: {marker_filename}"
-                )
+        _validate_marker_filenames(marker_filenames)
         paths = await Get(Paths, PathGlobs([str(path / mf) for mf in marker_filenames]))
         if len(paths.files) > 0:
             return OptionalSourceRoot(SourceRoot(str(path)))
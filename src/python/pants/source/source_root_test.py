@@ -18,6 +18,7 @@ from pants.source.source_root import (
     SourceRootsResult,
     all_roots,
     get_optional_source_root,
+    get_optional_source_roots,
 )
 from pants.source.source_root import rules as source_root_rules
 from pants.testutil.option_util import create_subsystem
@@ -58,7 +59,20 @@ def _find_root(
             ],
         )
 
+    def _mock_bulk_fs_check(pathglobs: PathGlobs) -> Paths:
+        files = tuple(glob for glob in pathglobs.globs if glob in (existing_marker_files or []))
+        return Paths(files=files, dirs=())
+
     source_root = _do_find_root(SourceRootRequest(PurePath(path))).source_root
+
+    # The bulk resolution of source roots must agree with resolving them one at a time.
+    bulk_result = run_rule_with_mocks(
+        get_optional_source_roots,
+        rule_args=[SourceRootsRequest((), (PurePath(path),)), source_root_config],
+        mock_gets=[MockGet(output_type=Paths, input_types=(PathGlobs,), mock=_mock_bulk_fs_check)],
+    )
+    assert bulk_result.path_to_optional_root[PurePath(path)].source_root == source_root
+
     return None if source_root is None else source_root.path
 
 
@@ -297,3 +311,39 @@ def test_source_roots_request() -> None:
         PurePath("src/python/foo"): SourceRoot("src/python"),
         PurePath("src/python/baz/qux"): SourceRoot("src/python"),
     } == dict(res.path_to_root)
+
+
+def test_source_roots_request_marker_files() -> None:
+    rule_runner = RuleRunner(
+        rules=[
+            *source_root_rules(),
+            QueryRule(SourceRootsResult, (SourceRootsRequest,)),
+        ]
+    )
+    rule_runner.set_options(
+        ["--source-root-patterns=['src/python']", "--source-marker-filenames=['SOURCE_ROOT']"]
+    )
+    rule_runner.write_files(
+        {
+            "projects/a/SOURCE_ROOT": "",
+            "projects/a/x/y/z.py": "",
+            "src/python/nested/SOURCE_ROOT": "",
+        }
+    )
+    req = SourceRootsRequest.for_files(
+        [
+            "projects/a/x/y/z.py",
+            "projects/a/x/w.py",
+            "projects/a/v.py",
+            "src/python/foo/bar.py",
+            "src/python/nested/baz.py",
+        ]
+    )
+    res = rule_runner.request(SourceRootsResult, [req])
+    assert {
+        PurePath("projects/a/x/y/z.py"): SourceRoot("projects/a"),
+        PurePath("projects/a/x/w.py"): SourceRoot("projects/a"),
+        PurePath("projects/a/v.py"): SourceRoot("projects/a"),
+        PurePath("src/python/foo/bar.py"): SourceRoot("src/python"),
+        PurePath("src/python/nested/baz.py"): SourceRoot("src/python/nested"),
+    } == dict(res.path_to_root)
@@ -150,3 +150,45 @@ def partition_sequentially(
             yield emit_batch()
     if batch:
         yield emit_batch()
+
+
+def partition_by_duration(
+    items: Iterable[_T],
+    *,
+    key: Callable[[_T], str],
+    duration: Callable[[_T], float],
+    duration_target: float,
+    size_max: int | None = None,
+) -> list[list[_T]]:
+    """Partitions the given items into batches which each take around `duration_target` to run.
+
+    This is a "first fit decreasing" bin packing: items are placed longest first into the first
+    batch which can fit them without exceeding `duration_target` (or `size_max` items), and items
+    which do not fit in any batch start a new one. Items which take longer than `duration_target`
+    on their own are placed in a batch of their own.
+
+    The batches are returned longest first, so that the longest running batches can be started
+    first. The items in each batch are sorted by `key`.
+    """
+    batches: list[tuple[float, list[tuple[str, _T]]]] = []
+    keyed_items = sorted(
+        ((duration(item), key(item), item) for item in items),
+        key=lambda keyed_item: (keyed_item[0], keyed_item[1]),
+        reverse=True,
+    )
+    for item_duration, item_key, item in keyed_items:
+        for i, (batch_duration, batch) in enumerate(batches):
+            if batch_duration + item_duration <= duration_target and (
+                not size_max or len(batch) < size_max
+            ):
+                batch.append((item_key, item))
+                batches[i] = (batch_duration + item_duration, batch)
+                break
+        else:
+            batches.append((item_duration, [(item_key, item)]))
+
+    batches.sort(key=lambda batch: batch[0], reverse=True)
+    return [
+        [item for _, item in sorted(batch, key=lambda keyed_item: keyed_item[0])]
+        for _, batch in batches
+    ]
@@ -12,6 +12,7 @@ from pants.util.collections import (
     assert_single_element,
     ensure_list,
     ensure_str_list,
+    partition_by_duration,
     partition_sequentially,
     recursively_update,
 )
@@ -107,3 +108,18 @@ def test_partition_sequentially(size_target: int) -> None:
     for to_add in [item for i, item in enumerate(all_items) if i % 2 == 1]:
         updated_partitions = partitioned_buckets([to_add, *base_items])
         assert 1 <= len(base_partitions ^ updated_partitions) <= 4
+
+
+def test_partition_by_duration() -> None:
+    durations = {"a": 50.0, "b": 40.0, "c": 30.0, "d": 20.0, "e": 10.0, "f": 120.0}
+    batches = partition_by_duration(
+        durations, key=str, duration=durations.__getitem__, duration_target=60
+    )
+    # Items longer than the target get their own batch, and batches are returned longest first,
+    # with their items sorted.
+    assert batches == [["f"], ["a", "e"], ["b", "d"], ["c"]]
+
+    batches = partition_by_duration(
+        durations, key=str, duration=durations.__getitem__, duration_target=1000, size_max=2
+    )
+    assert batches == [["a", "f"], ["b", "c"], ["d", "e"]]
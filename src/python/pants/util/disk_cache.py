@@ -0,0 +1,147 @@
+# Copyright 2025 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import uuid
+
+from pants.util.memo import memoized
+
+logger = logging.getLogger(__name__)
+
+
+class DiskCache:
+    """A size-bounded, process- and thread-safe on-disk key/value store for small blobs.
+
+    Each entry is stored in its own file under `directory`, sharded by the first two characters of
+    its key. Entries are written atomically via a rename, so concurrent writers (e.g. several Pants
+    processes sharing a cache directory) never observe partial entries. Reads refresh the entry's
+    mtime, which is used to evict the least recently used entries once the total size of the cache
+    exceeds `max_size_bytes`.
+
+    The cache is purely an optimization: all I/O errors are logged at debug level and otherwise
+    ignored, so that a missing, read-only or corrupted cache directory never causes a failure.
+
+    Keys must be filesystem-safe strings of at least three characters (e.g. hex digests).
+    """
+
+    # When the cache grows beyond its max size, entries are evicted until it is below this fraction
+    # of the max size, so that eviction does not need to run on every write.
+    _TARGET_SIZE_FRACTION = 0.75
+
+    def __init__(self, directory: str, max_size_bytes: int) -> None:
+        self._directory = directory
+        self._max_size_bytes = max_size_bytes
+        self._lock = threading.Lock()
+        # Lazily computed on first write, since reads do not change the size of the cache.
+        self._size_bytes: int | None = None
+
+    def __reduce__(self):
+        # NB: The lock and the tracked size are process-local, so only the location and the size
+        # limit of the cache are pickled.
+        return DiskCache, (self._directory, self._max_size_bytes)
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self._directory, key[:2], key[2:])
+
+    def get(self, key: str) -> bytes | None:
+        path = self._entry_path(key)
+        try:
+            with open(path, "rb") as fp:
+                value = fp.read()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.debug(f"Failed to read {path} from the disk cache: {e}")
+            return None
+        return value
+
+    def put(self, key: str, value: bytes) -> None:
+        path = self._entry_path(key)
+        tmp_path = f"{path}.tmp.{uuid.uuid4().hex}"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "wb") as fp:
+                fp.write(value)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug(f"Failed to write {path} to the disk cache: {e}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            return
+
+        with self._lock:
+            if self._size_bytes is None:
+                self._size_bytes = sum(size for _, size, _ in self._entries())
+            else:
+                self._size_bytes += len(value)
+            if self._size_bytes > self._max_size_bytes:
+                self._evict()
+
+    def delete(self, key: str) -> None:
+        try:
+            os.unlink(self._entry_path(key))
+        except OSError:
+            pass
+
+    def _entries(self) -> list[tuple[float, int, str]]:
+        """Return (mtime, size, path) for all entries in the cache."""
+        entries: list[tuple[float, int, str]] = []
+        try:
+            shards = list(os.scandir(self._directory))
+        except OSError:
+            return entries
+        for shard in shards:
+            if not shard.is_dir(follow_symlinks=False):
+                continue
+            try:
+                for entry in os.scandir(shard.path):
+                    try:
+                        stat = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+            except OSError:
+                continue
+        return entries
+
+    def _evict(self) -> None:
+        entries = sorted(self._entries())
+        size_bytes = sum(size for _, size, _ in entries)
+        target_size_bytes = int(self._max_size_bytes * self._TARGET_SIZE_FRACTION)
+        for _, size, path in entries:
+            if size_bytes <= target_size_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            size_bytes -= size
+        self._size_bytes = size_bytes
+
+
+@memoized
+def _shared_disk_cache(directory: str, max_size_bytes: int) -> DiskCache:
+    return DiskCache(directory, max_size_bytes)
+
+
+def persistent_cache(caches_dir: str, name: str, max_size_bytes: int) -> DiskCache | None:
+    """The `DiskCache` named `name` below `caches_dir` (see `--persistent-caches-dir`).
+
+    Returns None if the cache is disabled, i.e. if `max_size_bytes` is 0. The same instance is
+    returned for the same arguments for the lifetime of the process (e.g. across runs in pantsd),
+    so that all of its users share the tracked size of the cache.
+    """
+    if max_size_bytes <= 0:
+        return None
+    return _shared_disk_cache(os.path.join(caches_dir, name), max_size_bytes)
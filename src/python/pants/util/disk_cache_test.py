@@ -0,0 +1,56 @@
+# Copyright 2025 Pants project contributors (see CONTRIBUTORS.md).
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+import os
+from pathlib import Path
+
+from pants.util.disk_cache import DiskCache, persistent_cache
+
+
+def test_get_put_delete(tmp_path: Path) -> None:
+    cache = DiskCache(str(tmp_path), max_size_bytes=1000)
+    assert cache.get("abc123") is None
+    cache.put("abc123", b"value")
+    assert cache.get("abc123") == b"value"
+    assert (tmp_path / "ab" / "c123").is_file()
+    cache.put("abc123", b"new value")
+    assert cache.get("abc123") == b"new value"
+    cache.delete("abc123")
+    assert cache.get("abc123") is None
+    # Deleting a missing key is a no-op.
+    cache.delete("abc123")
+
+
+def test_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = DiskCache(str(tmp_path), max_size_bytes=35)
+    for i, key in enumerate(("aaa", "bbb", "ccc")):
+        cache.put(key, b"x" * 10)
+        os.utime(tmp_path / key[:2] / key[2:], (i, i))
+
+    # Reading refreshes the mtime, so `aaa` is now the most recently used.
+    assert cache.get("aaa") is not None
+    cache.put("ddd", b"x" * 10)
+
+    # The cache shrinks to below 75% of its max size.
+    assert cache.get("bbb") is None
+    assert cache.get("ccc") is None
+    assert cache.get("aaa") == b"x" * 10
+    assert cache.get("ddd") == b"x" * 10
+
+
+def test_unwritable_directory(tmp_path: Path) -> None:
+    not_a_dir = tmp_path / "file"
+    not_a_dir.write_text("")
+    cache = DiskCache(str(not_a_dir), max_size_bytes=1000)
+    cache.put("abc", b"value")
+    assert cache.get("abc") is None
+
+
+def test_persistent_cache(tmp_path: Path) -> None:
+    cache = persistent_cache(str(tmp_path), "name", 1000)
+    assert cache is not None
+    assert cache.directory == str(tmp_path / "name")
+    # Callers share a single instance per cache, and so its tracked size.
+    assert persistent_cache(str(tmp_path), "name", 1000) is cache
+    assert persistent_cache(str(tmp_path), "other", 1000) is not cache
+    assert persistent_cache(str(tmp_path), "name", 0) is None
@@ -10,6 +10,7 @@ mod digests;
 mod docker;
 mod interactive_process;
 mod process;
+mod python_futures;
 mod values;
 
 pub use interactive_process::interactive_process_inner;
@@ -20,6 +21,7 @@ pub fn register(py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
     docker::register(py, m)?;
     interactive_process::register(py, m)?;
     process::register(py, m)?;
+    python_futures::register(py, m)?;
     values::register(py, m)?;
 
     Ok(())
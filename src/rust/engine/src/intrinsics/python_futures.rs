@@ -0,0 +1,44 @@
+// Copyright 2025 Pants project contributors (see CONTRIBUTORS.md).
+// Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+use futures::channel::oneshot;
+use parking_lot::Mutex;
+use pyo3::prelude::{pyfunction, wrap_pyfunction, PyModule, PyObject, PyResult, Python};
+use pyo3::types::{PyCFunction, PyDict, PyModuleMethods, PyTuple};
+use pyo3::Bound;
+
+use crate::externs::PyGeneratorResponseNativeCall;
+use crate::python::Value;
+
+pub fn register(_py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_function(wrap_pyfunction!(await_future, m)?)?;
+
+    Ok(())
+}
+
+/// Awaits a `concurrent.futures.Future` without blocking a rule thread while it is pending.
+#[pyfunction]
+fn await_future(py: Python, future: PyObject) -> PyResult<PyGeneratorResponseNativeCall> {
+    let (sender, receiver) = oneshot::channel::<()>();
+    let sender = Mutex::new(Some(sender));
+    let on_done = PyCFunction::new_closure(
+        py,
+        None,
+        None,
+        move |_args: &Bound<'_, PyTuple>, _kwargs: Option<&Bound<'_, PyDict>>| -> PyResult<()> {
+            if let Some(sender) = sender.lock().take() {
+                // The receiver is dropped if the awaiting rule was cancelled.
+                let _ = sender.send(());
+            }
+            Ok(())
+        },
+    )?;
+    // NB: If the future is already done, the callback is called immediately.
+    future.call_method1(py, "add_done_callback", (on_done,))?;
+
+    Ok(PyGeneratorResponseNativeCall::new(async move {
+        let _ = receiver.await;
+        let result = Python::with_gil(|py| future.call_method0(py, "result"))?;
+        Ok(Value::new(result))
+    }))
+}